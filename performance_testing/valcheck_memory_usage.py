@@ -0,0 +1,76 @@
+"""
+Snippet that measures the memory used by valcheck's core objects (fields, validators, errors), via `tracemalloc`.
+"""
+
+
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from valcheck import fields, validators
+
+
+NUM_FIELDS = 50
+NUM_VALIDATORS = 10_000
+NUM_ROWS = 100_000
+
+
+def measure_memory(func: Callable[[], Any]) -> Any:
+    """Prints the memory (retained and peak) allocated by the given function, and returns its result"""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"`{func.__name__}` => retained: {retained / 1024 ** 2:.2f} MiB | peak: {peak / 1024 ** 2:.2f} MiB")
+    return result
+
+
+def make_wide_validator_class() -> type:
+    namespace: Dict[str, Any] = {
+        f"field_{idx}": fields.IntegerField(min_value=0) if idx % 2 else fields.StringField(max_length=32)
+        for idx in range(NUM_FIELDS)
+    }
+    return type("WideValidator", (validators.Validator,), namespace)
+
+
+class RowValidator(validators.Validator):
+    id = fields.IntegerField()
+    name = fields.StringField()
+
+
+class PayloadValidator(validators.Validator):
+    rows = fields.ModelListField(validator_model=RowValidator)
+
+
+def main():
+    wide_validator_class = measure_memory(make_wide_validator_class)
+    wide_data = {f"field_{idx}": idx if idx % 2 else "some string" for idx in range(NUM_FIELDS)}
+
+    def run_wide_validators():
+        validator_objs = [wide_validator_class(data=wide_data) for _ in range(NUM_VALIDATORS)]
+        for validator_obj in validator_objs:
+            validator_obj.run_validations()
+        return validator_objs
+
+    measure_memory(run_wide_validators)
+
+    valid_rows = [{"id": idx, "name": f"name-{idx}"} for idx in range(NUM_ROWS)]
+    invalid_rows = [{"id": str(idx), "name": idx} for idx in range(NUM_ROWS)]
+
+    def run_model_list_field_with_valid_rows():
+        validator_obj = PayloadValidator(data={"rows": valid_rows})
+        validator_obj.run_validations()
+        return validator_obj
+
+    def run_model_list_field_with_invalid_rows():
+        validator_obj = PayloadValidator(data={"rows": invalid_rows})
+        validator_obj.run_validations()
+        return validator_obj
+
+    measure_memory(run_model_list_field_with_valid_rows)
+    measure_memory(run_model_list_field_with_invalid_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -71,7 +71,7 @@ class PersonValcheck(validators.Validator):
         ],
     )
     age = fields.IntegerField(
-        validators=[lambda age: age >= 18],
+        min_value=18,
         error=models.Error(description="The person must be an adult (at least 18 years old)"),
     )
     gender = fields.ChoiceField(choices=("Female", "Male"))
@@ -0,0 +1,66 @@
+"""
+Snippet that compares the runtime of valcheck with production mode disabled (default) vs enabled.
+Refer to `valcheck.settings` for details on production mode.
+"""
+
+
+import time
+from typing import Any, Dict, List
+
+from valcheck import fields, models, settings, validators
+
+
+NUM_REPITITIONS = 5
+NUM_ROWS = 20_000
+
+
+class RowValidator(validators.Validator):
+    id = fields.IntegerField(validators=[lambda value: value > 0])
+    name = fields.StringField(allow_empty=False)
+    email = fields.EmailIdStringField(required=False)
+    score = fields.FloatField(nullable=True)
+
+    def model_validator(self) -> List[models.Error]:
+        return []
+
+
+class PayloadValidator(validators.Validator):
+    rows = fields.ModelListField(validator_model=RowValidator)
+
+
+def run(data: Dict[str, Any]) -> Dict[str, Any]:
+    validator_obj = PayloadValidator(data=data)
+    validator_obj.run_validations()
+    return {
+        "validated_data": validator_obj.validated_data,
+        "errors": [error.as_dict() for error in validator_obj.errors],
+    }
+
+
+def time_it(data: Dict[str, Any], /) -> float:
+    start = time.perf_counter()
+    for _ in range(NUM_REPITITIONS):
+        run(data)
+    return time.perf_counter() - start
+
+
+def main():
+    valid_rows = [{"id": idx + 1, "name": f"name-{idx}", "score": None} for idx in range(NUM_ROWS)]
+    invalid_rows = [{"id": -idx, "name": "", "score": "x"} for idx in range(NUM_ROWS)]
+    for name, data in [("valid rows", {"rows": valid_rows}), ("invalid rows", {"rows": invalid_rows})]:
+        settings.set_production_mode(False)
+        result_in_default_mode = run(data)
+        time_taken_in_default_mode = time_it(data)
+        settings.set_production_mode(True)
+        result_in_production_mode = run(data)
+        time_taken_in_production_mode = time_it(data)
+        settings.set_production_mode(False)
+        assert result_in_default_mode == result_in_production_mode, "The results must be the same in both modes"
+        print(
+            f"{NUM_REPITITIONS} x {NUM_ROWS} {name} => default mode: {time_taken_in_default_mode:.3f} seconds"
+            f" | production mode: {time_taken_in_production_mode:.3f} seconds"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta, timezone
+import pickle
+import random
+import unittest
+
+from valcheck.date_parsers import (
+    _parse_date_string_via_strptime,
+    _parse_datetime_string_via_strptime,
+    compile_format,
+    get_date_string_parser,
+    get_datetime_string_parser,
+)
+
+
+DATE_STRINGS = [
+    "2020-04-20",
+    "1999-12-31",
+    "2020-02-29",
+    "2021-02-29",
+    "2020-13-01",
+    "2020-00-10",
+    "2020-4-20",
+    "2020-04-2",
+    "0999-01-01",
+    "0000-01-01",
+    "20200420",
+    "2020-04-20 ",
+    " 2020-04-20",
+    "2020/04/20",
+    "２０２０-04-20",
+    "",
+]
+
+DATETIME_STRINGS = [
+    "2020-04-20 17:30:45",
+    "2020-04-20T17:30:45",
+    "2020-04-20t17:30:45",
+    "2020-04-20  17:30:45",
+    "2020-04-20 17:30:45.585675",
+    "2020-04-20 17:30:45.5",
+    "2020-04-20 17:30:45.5856751",
+    "2020-04-20 17:30:45.585675+0000",
+    "2020-04-20 17:30:45.585675+00:00",
+    "2020-04-20 17:30:45.585675+05:30",
+    "2020-04-20 17:30:45.585675-02:30",
+    "2020-04-20 17:30:45.585675Z",
+    "2020-04-20 17:30:45.585675z",
+    "2020-04-20 17:30:45.585675+05:30:15",
+    "2020-04-20 17:30:45.585675+24:00",
+    "2020-04-20 17:30:45.585675+05:60",
+    "2020-04-20T17:30:45+05:30",
+    "2020-04-20T17:30:45Z",
+    "2020-04-20 24:00:00",
+    "2020-04-20 23:60:00",
+    "2020-04-20 23:59:60",
+    "2020-04-20 7:30:45",
+    "2021-02-29 17:30:45",
+    "2020-04-20",
+    "",
+]
+
+DATETIME_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+]
+
+
+class TestDateParsers(unittest.TestCase):
+
+    def test_iso_date_string_parser(self):
+        parser = get_date_string_parser("%Y-%m-%d")
+        self.assertTrue(parser.has_fast_path)
+        for value in DATE_STRINGS:
+            self.assertEqual(parser.parse(value), _parse_date_string_via_strptime(value, "%Y-%m-%d"), msg=value)
+        self.assertIsNone(parser.parse(None))
+        self.assertIsNone(parser.parse(20200420))
+
+    def test_iso_datetime_string_parsers(self):
+        for format_ in DATETIME_FORMATS:
+            parser = get_datetime_string_parser(format_)
+            self.assertTrue(parser.has_fast_path, msg=format_)
+            for value in DATETIME_STRINGS:
+                expected = _parse_datetime_string_via_strptime(value, format_)
+                actual = parser.parse(value)
+                self.assertEqual(actual, expected, msg=(format_, value))
+                if expected is not None:
+                    self.assertEqual(actual.tzinfo, expected.tzinfo, msg=(format_, value))
+                    self.assertEqual(actual.tzname(), expected.tzname(), msg=(format_, value))
+
+    def test_parsers_are_cached_and_picklable(self):
+        parser = get_datetime_string_parser("%Y-%m-%dT%H:%M:%S%z")
+        self.assertIs(get_datetime_string_parser("%Y-%m-%dT%H:%M:%S%z"), parser)
+        unpickled_parser = pickle.loads(pickle.dumps(parser))
+        self.assertEqual(unpickled_parser.parse("2020-04-20T17:30:45Z"), parser.parse("2020-04-20T17:30:45Z"))
+        self.assertEqual(
+            parser.parse("2020-04-20T17:30:45+05:30"),
+            datetime.strptime("2020-04-20T17:30:45+05:30", "%Y-%m-%dT%H:%M:%S%z"),
+        )
+
+    def test_compiled_formats(self):
+        self.assertIsNotNone(compile_format("%d %B, %Y"))
+        self.assertIsNotNone(compile_format("%d/%y %H:%M %% %b"))
+        self.assertIsNone(compile_format("%A, %d %B %Y"))
+        self.assertIsNone(compile_format("%Y-%m-%d %Y"))
+        self.assertIsNone(compile_format("%d %m %b %Y"))
+        self.assertIsNone(compile_format("%Y-%m-%d %H:%M", allowed_directives=frozenset("Ymd")))
+        self.assertFalse(get_date_string_parser("%Y-%m-%d %H:%M").has_fast_path)
+        self.assertTrue(get_datetime_string_parser("%Y-%m-%d %H:%M").has_fast_path)
+
+    def test_parsers_match_strptime(self):
+        """Checks the parsers against `strptime()`, for valid values and for values that are mutated in various ways"""
+        date_formats = ["%d %B, %Y", "%d/%m/%Y", "%m-%d-%y", "%b %d %Y", "%Y%m%d", "%Y-%m", "%A %d %B %Y"]
+        datetime_formats = ["%d/%m/%y %H:%M", "%d %b %Y %H:%M:%S.%f", "%Y%m%d%H%M%S%z", "%H:%M:%S", "%Y-%m-%d %H:%M:%S %z"]
+        rng = random.Random(42)
+        mutations = [
+            lambda value: value,
+            lambda value: value.upper(),
+            lambda value: value.lower(),
+            lambda value: value.replace("0", "", 1),
+            lambda value: value.replace(" ", "  ", 1),
+            lambda value: value.replace("1", "3", 1),
+            lambda value: value[:-1],
+            lambda value: value + "0",
+            lambda value: value.replace("+", "-").replace("Z", "+2400"),
+        ]
+        for _ in range(300):
+            tzinfo = rng.choice([None, timezone.utc, timezone(timedelta(hours=5, minutes=30)), timezone(-timedelta(hours=2))])
+            datetime_obj = datetime(2000, 1, 1, tzinfo=tzinfo) + timedelta(seconds=rng.randint(-10**9, 10**9), microseconds=rng.randint(0, 10**6))
+            for mutation in mutations:
+                for format_ in date_formats:
+                    value = mutation(datetime_obj.strftime(format_))
+                    self.assertEqual(
+                        get_date_string_parser(format_).parse(value),
+                        _parse_date_string_via_strptime(value, format_),
+                        msg=(format_, value),
+                    )
+                for format_ in datetime_formats:
+                    value = mutation(datetime_obj.strftime(format_))
+                    expected = _parse_datetime_string_via_strptime(value, format_)
+                    actual = get_datetime_string_parser(format_).parse(value)
+                    self.assertEqual(actual, expected, msg=(format_, value))
+                    if expected is not None:
+                        self.assertEqual(actual.tzinfo, expected.tzinfo, msg=(format_, value))
@@ -170,6 +170,14 @@ class ListFieldValidator(validators.Validator):
     list_field = fields.ListField()
 
 
+class ConstraintsValidator(validators.Validator):
+    age = fields.IntegerField(min_value=18, max_value=150, required=False)
+    score = fields.NumberField(min_value=0, required=False)
+    ratio = fields.FloatField(max_value=1.0, required=False)
+    code = fields.StringField(min_length=2, max_length=4, pattern=r"[A-Z]+", required=False)
+    tags = fields.ListField(min_length=1, max_length=2, required=False)
+
+
 class FieldParamsValidator(validators.Validator):
     five_letter_word = fields.StringField(
         allow_empty=False,
@@ -230,6 +238,7 @@ class TestField(unittest.TestCase):
         val = FieldConversionValidator(data=data)
         val.run_validations()
         self.assertTrue(not has_errors(val.errors))
+        self.assert_compiled_validator_matches(validator=val)
         validated_data = val.validated_data
         for key in validated_data:
             self.assertTrue(
@@ -247,12 +256,41 @@ class TestField(unittest.TestCase):
                 msg=f"Validated value: `{validated_value}` || Expected value: `{expected_value}`",
             )
 
+    def test_fields_are_stateless(self):
+        field = IntegerFieldValidator.get_schema_plan().field_info["integer_field"]
+        self.assertFalse(hasattr(field, "field_value"))
+
+        validated_field = field.validate_entire_field(10)
+        self.assertTrue(not has_errors(validated_field.errors))
+        self.assertEqual(validated_field.field_value, 10)
+        self.assertIs(validated_field.field, field)
+
+        validated_field = field.validate_entire_field("10")
+        self.assertTrue(has_errors(validated_field.errors))
+
+        validated_field = field.validate_entire_field(utils.set_as_empty())
+        self.assertTrue(has_errors(validated_field.errors))
+
+        self.assertEqual(field.validate(10), (10, []))
+        validated_value, errors = fields.DateStringField(to_date_obj=True).validate("2020-05-25")
+        self.assertEqual(validated_value, date(year=2020, month=5, day=25))
+        self.assertTrue(not has_errors(errors))
+
+        # the same field instances are used by all the instances of a validator
+        val_1 = FieldConversionValidator(data={})
+        val_2 = FieldConversionValidator(data={})
+        self.assertIs(
+            val_1.get_schema_plan().field_info["date_string_field_2"],
+            val_2.get_schema_plan().field_info["date_string_field_2"],
+        )
+
     def field_params_validator_helper(self, *, data: Dict[str, Any], should_be_valid: bool) -> None:
         val = FieldParamsValidator(data=data)
         self.assertTrue(val.five_letter_word.type_alias == "CustomStringField")
         self.assertTrue(val.five_letter_word.required is False)
         self.assertTrue(val.five_letter_word.nullable is True)
         val.run_validations()
+        self.assert_compiled_validator_matches(validator=val)
         errors = val.errors
         num_errors = len(errors)
         if should_be_valid:
@@ -315,6 +353,21 @@ class TestField(unittest.TestCase):
                     expr=has_errors(errors),
                     msg=message,
                 )
+            self.assert_compiled_validator_matches(validator=val)
+            self.assertEqual(validator_model.is_valid(data), not has_errors(errors), msg=message)
+
+    def assert_compiled_validator_matches(self, *, validator: validators.Validator) -> None:
+        """Helper method that checks if the compiled version of the given validator's class gives the same results"""
+        validator_model = validator.__class__
+        compiled_validator_model = type(f"Compiled{validator_model.__name__}", (validator_model,), {}, compiled=True)
+        self.assertIsNotNone(compiled_validator_model.get_schema_plan().compiled_field_validator)
+        compiled_val = compiled_validator_model(data=validator.data)
+        compiled_val.run_validations()
+        self.assertEqual(
+            [error.as_dict(include_validator_message=False) for error in compiled_val.errors],
+            [error.as_dict(include_validator_message=False) for error in validator.errors],
+        )
+        self.assertEqual(compiled_val.validated_data, validator.validated_data)
 
     def test_any_field_1(self):
         self.assert_validations(
@@ -722,6 +775,22 @@ class TestField(unittest.TestCase):
                 },
             ],
         )
+        self.assert_validations(
+            validator_model=ChoiceFieldValidator,
+            io=[
+                {"data": {"choice_field": ["A"]}, "should_be_valid": False},
+                {"data": {"choice_field": {"A": 1}}, "should_be_valid": False},
+            ],
+        )
+        unhashable_choices_field = fields.ChoiceField(choices=[{"a": 1}, ["b"], "c"], source="letter")
+        self.assertIsNone(unhashable_choices_field._choice_set)
+        for value, is_valid in [({"a": 1}, True), (["b"], True), ("c", True), ({"a": 2}, False), ("d", False)]:
+            self.assertEqual(unhashable_choices_field.is_valid_value(value), is_valid)
+            _, errors = unhashable_choices_field.validate(value)
+            self.assertEqual(not errors, is_valid)
+        choice_field = fields.ChoiceField(choices=("A", "B"), source="letter")
+        _, errors = choice_field.validate("C")
+        self.assertEqual(errors[0].validator_message, "Invalid ChoiceField 'letter' || Must be a valid choice i.e; one of ['A', 'B']")
 
     def test_multi_choice_field(self):
         self.assert_validations(
@@ -751,6 +820,14 @@ class TestField(unittest.TestCase):
                     "data": {"multi_choice_field": []},
                     "should_be_valid": False,
                 },
+                {
+                    "data": {"multi_choice_field": ["A", ["B"]]},
+                    "should_be_valid": False,
+                },
+                {
+                    "data": {"multi_choice_field": "AB"},
+                    "should_be_valid": False,
+                },
             ],
         )
     
@@ -1053,3 +1130,193 @@ class TestField(unittest.TestCase):
             ],
         )
 
+    def test_constraints(self):
+        self.assert_validations(
+            validator_model=ConstraintsValidator,
+            io=[
+                {"data": {}, "should_be_valid": True},
+                {"data": {"age": 18, "score": 0, "ratio": 1.0, "code": "AB", "tags": ["a"]}, "should_be_valid": True},
+                {"data": {"age": 150, "score": 3.5, "ratio": -1.5, "code": "ABCD", "tags": ["a", "b"]}, "should_be_valid": True},
+                {"data": {"age": 17}, "should_be_valid": False},
+                {"data": {"age": 151}, "should_be_valid": False},
+                {"data": {"age": "20"}, "should_be_valid": False},
+                {"data": {"score": -0.1}, "should_be_valid": False},
+                {"data": {"ratio": 1.01}, "should_be_valid": False},
+                {"data": {"code": "A"}, "should_be_valid": False},
+                {"data": {"code": "ABCDE"}, "should_be_valid": False},
+                {"data": {"code": "ab"}, "should_be_valid": False},
+                {"data": {"code": "AB\n"}, "should_be_valid": False},
+                {"data": {"tags": []}, "should_be_valid": False},
+                {"data": {"tags": ["a", "b", "c"]}, "should_be_valid": False},
+            ],
+        )
+        val = ConstraintsValidator(data={"age": 17, "score": -1, "code": "A", "tags": []})
+        val.run_validations()
+        self.assertEqual(
+            [error.validator_message for error in val.errors],
+            [
+                "Invalid IntegerField 'age' || Must be >= 18 and <= 150",
+                "Invalid NumberField 'score' || Must be >= 0",
+                "Invalid StringField 'code' || Length must be >= 2 and <= 4",
+                "Invalid ListField 'tags' || Length must be >= 1 and <= 2",
+            ],
+        )
+        sample_data = ConstraintsValidator().get_representation(key="source")
+        self.assertTrue(ConstraintsValidator.is_valid({key: sample_data[key] for key in ("age", "score", "ratio", "tags")}))
+        with self.assertRaises(AssertionError):
+            fields.IntegerField(min_value=10, max_value=1)
+        with self.assertRaises(AssertionError):
+            fields.StringField(min_length=-1)
+
+    def test_nan_is_out_of_bounds(self):
+        class RatioValidator(validators.Validator):
+            ratio = fields.FloatField(min_value=0.0, max_value=1.0)
+            score = fields.NumberField(required=False, min_value=0)
+
+        class CompiledRatioValidator(RatioValidator, compiled=True):
+            pass
+
+        for validator_model in (RatioValidator, CompiledRatioValidator):
+            for data in ({"ratio": float("nan")}, {"ratio": 0.5, "score": float("nan")}):
+                val = validator_model(data=data)
+                val.run_validations()
+                self.assertEqual(len(val.errors), 1, msg=validator_model)
+                self.assertFalse(validator_model.is_valid(data), msg=validator_model)
+            self.assertTrue(validator_model.is_valid({"ratio": 0.5, "score": 3}), msg=validator_model)
+        for kwargs in ({"min_value": float("nan")}, {"max_value": float("nan")}, {"min_value": 0.0, "max_value": float("nan")}):
+            with self.assertRaises(AssertionError, msg=kwargs):
+                fields.FloatField(**kwargs)
+
+    def test_custom_validators_short_circuit(self):
+        calls = []
+
+        def is_even(value):
+            calls.append("is_even")
+            return value % 2 == 0
+
+        def is_positive(value):
+            calls.append("is_positive")
+            return value > 0
+
+        class CustomValidatorsValidator(validators.Validator):
+            number = fields.IntegerField(validators=[is_even, is_positive])
+
+        class CompiledCustomValidatorsValidator(CustomValidatorsValidator, compiled=True):
+            pass
+
+        for validator_model in (CustomValidatorsValidator, CompiledCustomValidatorsValidator):
+            calls.clear()
+            val = validator_model(data={"number": 3})
+            val.run_validations()
+            self.assertEqual(calls, ["is_even"])
+            self.assertEqual(
+                val.errors[0].validator_message,
+                "Invalid IntegerField 'number' || Custom validations failed (validator #1: is_even)",
+            )
+
+            calls.clear()
+            val = validator_model(data={"number": -2})
+            val.run_validations()
+            self.assertEqual(calls, ["is_even", "is_positive"])
+            self.assertEqual(
+                val.errors[0].validator_message,
+                "Invalid IntegerField 'number' || Custom validations failed (validator #2: is_positive)",
+            )
+
+    def test_return_type_of_custom_validators_is_checked_once(self):
+        def is_small(value):
+            return value < 10 if value >= 0 else 0  # Returns a non-boolean for negative values
+
+        class NumberValidator(validators.Validator):
+            number = fields.IntegerField(validators=[lambda value: value % 2 == 0, is_small])
+
+        with self.assertRaises(AssertionError):
+            NumberValidator(data={"number": -2}).run_validations()
+
+        class NumberValidator(validators.Validator):
+            number = fields.IntegerField(validators=[lambda value: value % 2 == 0, is_small])
+
+        self.assertFalse(NumberValidator.is_valid({"number": 1}))  # Only the first validator is called (and checked)
+        with self.assertRaises(AssertionError):
+            NumberValidator(data={"number": -2}).run_validations()
+        self.assertTrue(NumberValidator.is_valid({"number": 2}))
+        # The return type of each validator has been checked, so it is not checked again
+        val = NumberValidator(data={"number": -2})
+        val.run_validations()
+        self.assertEqual(len(val.errors), 1)
+
+    def test_legacy_validate_signature(self):
+        with self.assertWarns(DeprecationWarning):
+            class LegacyUpperCaseStringField(fields.StringField):
+                def validate(self) -> List[models.Error]:
+                    if not isinstance(self.field_value, str):
+                        return [self.create_invalid_field_error(suffix="Must be a string")]
+                    self.field_value = self.field_value.upper()
+                    return []
+
+        class LegacyFieldValidator(validators.Validator):
+            word = LegacyUpperCaseStringField()
+
+        class CompiledLegacyFieldValidator(LegacyFieldValidator, compiled=True):
+            pass
+
+        for validator_model in (LegacyFieldValidator, CompiledLegacyFieldValidator):
+            val = validator_model(data={"word": "hello"})
+            val.run_validations()
+            self.assertEqual(val.validated_data, {"word": "HELLO"})
+            val = validator_model(data={"word": 1})
+            val.run_validations()
+            self.assertEqual(val.errors[0].validator_message, "Invalid LegacyUpperCaseStringField 'word' || Must be a string")
+            self.assertTrue(validator_model.is_valid({"word": "hello"}))
+            self.assertFalse(validator_model.is_valid({"word": 1}))
+
+        field = LegacyFieldValidator.get_schema_plan().field_info["word"]
+        self.assertEqual(field.validate("hello"), ("HELLO", []))
+        self.assertTrue(utils.is_empty(field.field_value))
+
+    def test_legacy_validate_signature_calling_super(self):
+        with self.assertWarns(DeprecationWarning):
+            class LegacyTitleCaseStringField(fields.StringField):
+                def validate(self) -> List[models.Error]:
+                    errors = super().validate()
+                    if errors:
+                        return errors
+                    self.field_value = self.field_value.title()
+                    return []
+
+        with self.assertWarns(DeprecationWarning):
+            class LegacyExclaimedTitleCaseStringField(LegacyTitleCaseStringField):
+                def validate(self) -> List[models.Error]:
+                    errors = super().validate()
+                    if not errors:
+                        self.field_value += "!"
+                    return errors
+
+        class LegacyFieldValidator(validators.Validator):
+            name = LegacyTitleCaseStringField(allow_empty=False)
+            greeting = LegacyExclaimedTitleCaseStringField()
+
+        class CompiledLegacyFieldValidator(LegacyFieldValidator, compiled=True):
+            pass
+
+        for validator_model in (LegacyFieldValidator, CompiledLegacyFieldValidator):
+            val = validator_model(data={"name": "james bond", "greeting": "hello"})
+            val.run_validations()
+            self.assertEqual(val.errors, [])
+            self.assertEqual(val.validated_data, {"name": "James Bond", "greeting": "Hello!"})
+            val = validator_model(data={"name": "", "greeting": 1})
+            val.run_validations()
+            self.assertEqual(len(val.errors), 2)
+            self.assertEqual(
+                [error.validator_message for error in val.errors],
+                [
+                    "Invalid LegacyTitleCaseStringField 'name' || Must be a non-empty string",
+                    "Invalid LegacyExclaimedTitleCaseStringField 'greeting'",
+                ],
+            )
+            self.assertFalse(validator_model.is_valid({"name": "", "greeting": "hello"}))
+
+        field = LegacyFieldValidator.get_schema_plan().field_info["greeting"]
+        self.assertEqual(field.validate("hello"), ("Hello!", []))
+        self.assertIs(type(field), LegacyExclaimedTitleCaseStringField)
+        self.assertTrue(utils.is_empty(field.field_value))
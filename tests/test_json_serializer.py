@@ -1,11 +1,15 @@
+from collections import OrderedDict
 from datetime import date, datetime
+from enum import Enum, IntEnum
+import io
+import json
 from typing import Any, Optional
 import unittest
 import uuid
 
 from valcheck import utils
 from valcheck.meta_classes import SingletonError
-from valcheck.serializers.json_serializers import JsonSerializer, JsonSerializerSingleton
+from valcheck.serializers.json_serializers import JSON_BYTES_BACKENDS, JsonSerializer, JsonSerializerSingleton
 
 
 class Person:
@@ -189,6 +193,173 @@ class TestJsonSerializer(unittest.TestCase):
         self.assertTrue(id(obj) != id(obj_json_serializable))
         self.assertTrue(obj_json_serializable == expected_json_serializable)
 
+    def test_make_json_serializable_leaves_input_unmodified(self):
+        nested_list = [1, (2, {3}), {"x": date(year=2020, month=6, day=22)}]
+        obj = OrderedDict([("a", nested_list), ("b", "text"), ("c", (date(year=2020, month=6, day=22),))])
+        json_serializer = JsonSerializer(include_default_serializers=True)
+        obj_json_serializable = json_serializer.make_json_serializable(obj)
+        self.assertIsInstance(obj_json_serializable, OrderedDict)
+        self.assertEqual(
+            obj_json_serializable,
+            {"a": [1, [2, [3]], {"x": "2020-06-22"}], "b": "text", "c": ["2020-06-22"]},
+        )
+        self.assertEqual(nested_list, [1, (2, {3}), {"x": date(year=2020, month=6, day=22)}])
+        self.assertIsNot(obj_json_serializable["a"], nested_list)
+        self.assertIsNot(obj_json_serializable["a"][2], nested_list[2])
+        self.assertIs(obj_json_serializable["b"], obj["b"])
+
+    def test_parse_json_strings(self):
+        obj = {"a": ' {"x": [1, 2]} ', "b": "\n[1, 2]", "c": "[1, 2", "d": '"[1, 2]"', "e": "", "f": "3", "g": "\ufeff[1]"}
+        expected_json_serializable = {"a": {"x": [1, 2]}, "b": [1, 2], "c": "[1, 2", "d": '"[1, 2]"', "e": "", "f": "3", "g": "\ufeff[1]"}
+        self.assertEqual(JsonSerializer(include_default_serializers=True).make_json_serializable(obj), expected_json_serializable)
+        json_serializer = JsonSerializer(include_default_serializers=True, parse_json_strings=False)
+        self.assertEqual(json_serializer.make_json_serializable(obj), obj)
+        self.assertEqual(json_serializer.make_json_serializable({"a": {1}}), {"a": [1]})
+        self.assertEqual(
+            [utils.might_be_json_object_or_array(value) for value in obj.values()],
+            [True, True, True, False, False, False, False],
+        )
+
+    def test_iter_encode_and_dump(self):
+        obj = {
+            "a": [1, 2.5, True, None, (1, 2), {3}, "héllo", '{"x": [1]}', b"bytes"],
+            "b": {},
+            "c": [],
+            "d": {
+                "z": date(year=2020, month=6, day=22),
+                "y": uuid.UUID("09c35a0b-ed0b-486a-ab06-6f8de0e381fd"),
+                "x": OrderedDict([("q", [{}, []])]),
+            },
+            "e": Person(name="james"),
+        }
+        json_serializer = JsonSerializer(include_default_serializers=True)
+        json_serializer.register_serializers_by_type({Person: lambda value: {"greeting": value.greet()}})
+        for kwargs in [{}, {"indent": 4, "sort_keys": True}, {"indent": "\t", "ensure_ascii": False}]:
+            expected_json_string = json.dumps(json_serializer.make_json_serializable(obj), **kwargs)
+            self.assertEqual("".join(json_serializer.iter_encode(obj, **kwargs)), expected_json_string)
+            text_buffer = io.StringIO()
+            json_serializer.dump(obj, text_buffer, buffer_size=16, **kwargs)
+            self.assertEqual(text_buffer.getvalue(), expected_json_string)
+            bytes_buffer = io.BytesIO()
+            json_serializer.dump(obj, bytes_buffer, encoding="utf-8", **kwargs)
+            self.assertEqual(bytes_buffer.getvalue(), expected_json_string.encode("utf-8"))
+        self.assertEqual(
+            "".join(json_serializer.iter_encode({1: float("nan"), None: "x", False: date(year=2020, month=6, day=22)})),
+            '{"1": NaN, "null": "x", "false": "2020-06-22"}',
+        )
+        self.assertEqual(
+            "".join(json_serializer.iter_encode(uuid.UUID("09c35a0b-ed0b-486a-ab06-6f8de0e381fd"))),
+            '"09c35a0b-ed0b-486a-ab06-6f8de0e381fd"',
+        )
+        with self.assertRaises(TypeError):
+            "".join(JsonSerializer().iter_encode({"a": date(year=2020, month=6, day=22)}))
+
+    def test_iter_encode_of_nested_tuples(self):
+        json_serializer = JsonSerializer()
+        json_serializer.register_serializers_by_type({Person: lambda value: value.greet()})
+        obj = {"t": (1, (2, [3]), {"k": "v"}), "l": [(4,), Person(name="james")]}
+        self.assertEqual(
+            "".join(json_serializer.iter_encode(obj)),
+            json.dumps(json_serializer.make_json_serializable(obj)),
+        )
+        for obj_with_unconverted_value in [
+            {"t": (Person(name="james"),)},
+            [({"d": date(year=2020, month=6, day=22)},)],
+            (Person(name="james"),),
+        ]:
+            with self.assertRaises(TypeError):
+                json.dumps(json_serializer.make_json_serializable(obj_with_unconverted_value))
+            with self.assertRaises(TypeError):
+                "".join(json_serializer.iter_encode(obj_with_unconverted_value))
+        with self.assertRaises(ValueError):
+            "".join(json_serializer.iter_encode([float("inf")], allow_nan=False))
+        circular_list = [1]
+        circular_list.append(circular_list)
+        with self.assertRaises(ValueError):
+            "".join(json_serializer.iter_encode(circular_list))
+
+    def test_to_json_bytes(self):
+        obj = {
+            "b": [1, 2.5, True, None, (1, 2), "héllo", '{"x": [1]}'],
+            "a": {"z": date(year=2020, month=6, day=22), 1: uuid.UUID("09c35a0b-ed0b-486a-ab06-6f8de0e381fd")},
+        }
+        expected_json_bytes = (
+            '{"b":[1,2.5,true,null,[1,2],"héllo",{"x":[1]}],"a":{"z":"2020-06-22","1":"09c35a0b-ed0b-486a-ab06-6f8de0e381fd"}}'
+        ).encode("utf-8")
+        json_serializer = JsonSerializer(include_default_serializers=True)
+        self.assertEqual(json_serializer.to_json_bytes(obj), expected_json_bytes)
+        for backend in JSON_BYTES_BACKENDS:
+            self.assertEqual(json_serializer.to_json_bytes(obj, backend=backend), expected_json_bytes, msg=backend)
+        self.assertEqual(json_serializer.to_json_bytes(obj, backend=lambda value: repr(sorted(value)).encode()), b"['a', 'b']")
+        with self.assertRaises(AssertionError):
+            json_serializer.to_json_bytes(obj, backend="unknown")
+
+        # Lone surrogates cannot be encoded as UTF-8, so the "json" backend escapes the non-ASCII characters instead
+        self.assertEqual(json_serializer.to_json_bytes(["héllo", "\ud800"]), b'["h\\u00e9llo","\\ud800"]')
+
+        # Unconverted values are rejected by every backend (without the default serializers)
+        class CustomFloat(float):
+            pass
+
+        json_serializer = JsonSerializer()
+        for backend in JSON_BYTES_BACKENDS:
+            self.assertEqual(json_serializer.to_json_bytes([CustomFloat(1.5)], backend=backend), b"[1.5]", msg=backend)
+            for unconverted_obj in [
+                {"t": datetime(year=2020, month=6, day=22, hour=17, minute=30)},
+                [date(year=2020, month=6, day=22)],
+                {"p": Person(name="james")},
+            ]:
+                with self.assertRaises(TypeError, msg=backend):
+                    json_serializer.to_json_bytes(unconverted_obj, backend=backend)
+
+    def test_mro_dispatch(self):
+        class Color(IntEnum):
+            RED = 1
+
+        class CustomDatetime(datetime):
+            pass
+
+        json_serializer = JsonSerializer(include_default_serializers=True)
+        json_serializer.register_serializers_by_type({Enum: lambda value: value.name})
+        obj = {
+            "color": Color.RED,
+            "datetime": CustomDatetime(year=2020, month=6, day=22, hour=17, minute=30),
+            "ordered_dict": OrderedDict([("b", Color.RED), ("a", [Color.RED])]),
+        }
+        expected = {
+            "color": "RED",
+            "datetime": "2020-06-22 17:30:00.000000",
+            "ordered_dict": {"b": "RED", "a": ["RED"]},
+        }
+        self.assertEqual(json_serializer.make_json_serializable(obj), expected)
+        self.assertEqual("".join(json_serializer.iter_encode(obj)), json.dumps(expected))
+
+        # Registering a serializer clears the cache, and the most specific registered type wins
+        json_serializer.register_serializers_by_type({
+            IntEnum: lambda value: value.value,
+            OrderedDict: lambda value: [[key, value_] for key, value_ in value.items()],
+        })
+        expected = {
+            "color": 1,
+            "datetime": "2020-06-22 17:30:00.000000",
+            "ordered_dict": [["b", 1], ["a", [1]]],
+        }
+        self.assertEqual(json_serializer.make_json_serializable(obj), expected)
+        self.assertEqual("".join(json_serializer.iter_encode(obj)), json.dumps(expected))
+
+        # Serializers registered for `dict` or `list` do not apply, since dictionaries and lists are always walked
+        json_serializer.register_serializers_by_type({dict: lambda value: "dict", list: lambda value: "list"})
+        self.assertEqual(json_serializer.make_json_serializable({"x": [Color.RED]}), {"x": [1]})
+
+        # Serializers registered for `int` do not apply to booleans
+        json_serializer.register_serializers_by_type({int: lambda value: str(value)})
+        obj = {"int": 1, "bool": True, "list": [False, 2]}
+        expected = {"int": "1", "bool": True, "list": [False, "2"]}
+        self.assertEqual(json_serializer.make_json_serializable(obj), expected)
+        self.assertEqual("".join(json_serializer.iter_encode(obj)), json.dumps(expected))
+        json_serializer.register_serializers_by_type({bool: lambda value: int(value)})
+        self.assertEqual(json_serializer.make_json_serializable(obj), {"int": "1", "bool": 1, "list": [0, "2"]})
+
     def test_json_serializer_singleton(self):
         json_serializer_singleton = JsonSerializerSingleton(include_default_serializers=True)
         self.assertTrue(isinstance(json_serializer_singleton, JsonSerializerSingleton))
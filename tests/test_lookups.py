@@ -0,0 +1,173 @@
+import os
+import pickle
+import random
+import sqlite3
+import tempfile
+import unittest
+
+from valcheck import fields, validators
+from valcheck.lookups import BloomFilterLookupIndex, LookupIndex, SortedFileLookupIndex, SqliteLookupIndex
+
+
+SKUS = sorted({f"SKU-{random.randint(0, 10**6):07d}" for _ in range(2000)} | {"SKU-jöhn"})
+
+
+class CountingLookupIndex(LookupIndex):
+    """Lookup index (over an in-memory set) that counts the calls made to it"""
+
+    def __init__(self, values) -> None:
+        super().__init__()
+        self.values = frozenset(values)
+        self.num_single_lookups = 0
+        self.num_batch_lookups = 0
+
+    def _contains(self, value, /) -> bool:
+        self.num_single_lookups += 1
+        return value in self.values
+
+    def _contains_many(self, values, /):
+        self.num_batch_lookups += 1
+        return {value for value in values if value in self.values}
+
+
+class TestLookups(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sorted_file_path = os.path.join(self.temp_dir.name, "skus.txt")
+        with open(self.sorted_file_path, mode="wb") as fp:
+            fp.write(b"\n".join(sorted(sku.encode("utf-8") for sku in SKUS)) + b"\n")
+        self.sqlite_path = os.path.join(self.temp_dir.name, "skus.db")
+        with sqlite3.connect(self.sqlite_path) as connection:
+            connection.execute("CREATE TABLE skus (sku TEXT PRIMARY KEY)")
+            connection.executemany("INSERT INTO skus (sku) VALUES (?)", [(sku,) for sku in SKUS])
+        connection.close()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def make_indexes(self):
+        sorted_file_index = SortedFileLookupIndex(self.sorted_file_path)
+        sqlite_index = SqliteLookupIndex(self.sqlite_path, table="skus", column="sku")
+        bloom_filter_index = BloomFilterLookupIndex(SKUS, fallback=sqlite_index, expected_count=len(SKUS))
+        return [sorted_file_index, sqlite_index, bloom_filter_index]
+
+    def test_indexes(self):
+        invalid_values = ["SKU-", "SKU-99999999", "", "A", "ZZZ", "SKU-jöhn\n", 123, None, ["SKU-jöhn"]]
+        for index in self.make_indexes():
+            for value in SKUS:
+                self.assertTrue(index.contains(value), msg=(index, value))
+            for value in invalid_values:
+                self.assertFalse(index.contains(value), msg=(index, value))
+            results = index.contains_many([SKUS[0], SKUS[-1], "SKU-", SKUS[0], ["unhashable"]])
+            self.assertEqual(results, {SKUS[0]: True, SKUS[-1]: True, "SKU-": False})
+
+            unpickled_index = pickle.loads(pickle.dumps(index))
+            self.assertTrue(unpickled_index.contains(SKUS[1]))
+            self.assertFalse(unpickled_index.contains("SKU-"))
+
+    def test_empty_sorted_file(self):
+        empty_file_path = os.path.join(self.temp_dir.name, "empty.txt")
+        open(empty_file_path, mode="wb").close()
+        self.assertFalse(SortedFileLookupIndex(empty_file_path).contains("SKU-"))
+        self.assertIsNone(SortedFileLookupIndex(empty_file_path).sample_value())
+
+    def test_lookup_field(self):
+        for index in self.make_indexes():
+            class ItemValidator(validators.Validator):
+                sku = fields.LookupField(index=index)
+
+            self.assertIs(ItemValidator.get_schema_plan().field_info["sku"].index, index)
+            val = ItemValidator(data={"sku": SKUS[0]})
+            val.run_validations()
+            self.assertEqual(val.errors, [])
+            val = ItemValidator(data={"sku": "SKU-"})
+            val.run_validations()
+            self.assertEqual(
+                val.errors[0].validator_message,
+                "Invalid LookupField 'sku' || Must be a valid value i.e; one of the values of the lookup index",
+            )
+            self.assertTrue(ItemValidator.is_valid({"sku": SKUS[0]}))
+            self.assertFalse(ItemValidator.is_valid({"sku": "SKU-"}))
+            sample_data = ItemValidator().get_representation(key="source")
+            self.assertIn(sample_data["sku"], SKUS)
+            self.assertTrue(ItemValidator.is_valid(sample_data))
+
+    def test_lookups_are_batched(self):
+        index = CountingLookupIndex(SKUS)
+
+        class ItemValidator(validators.Validator):
+            sku = fields.LookupField(index=index)
+
+        class OrderValidator(validators.Validator):
+            items = fields.ModelListField(validator_model=ItemValidator)
+
+        items = [{"sku": sku} for sku in SKUS[:50]] + [{"sku": "SKU-"}, "not a dictionary", {}]
+        val = OrderValidator(data={"items": items})
+        val.run_validations()
+        self.assertEqual(len(val.errors), 3)
+        self.assertEqual((index.num_single_lookups, index.num_batch_lookups), (0, 1))
+
+        index.num_batch_lookups = 0
+        records = [{"sku": sku} for sku in SKUS[:2500]] + [{"sku": "SKU-"}]
+        results = list(ItemValidator.validate_many(records))
+        self.assertEqual([result.is_valid for result in results], [True] * len(records[:-1]) + [False])
+        self.assertEqual(index.num_single_lookups, 0)
+        self.assertEqual(index.num_batch_lookups, -(-len(records) // ItemValidator.LOOKUP_BATCH_SIZE))
+
+        # The prefetched results are not used outside of the batch
+        self.assertTrue(ItemValidator.is_valid({"sku": SKUS[0]}))
+        self.assertEqual(index.num_single_lookups, 1)
+
+    def test_prefetched_lookups_are_scoped_to_the_batch(self):
+        index = CountingLookupIndex(SKUS[:10])
+
+        class ItemValidator(validators.Validator):
+            sku = fields.LookupField(index=index)
+
+        first_results = ItemValidator.validate_many([{"sku": SKUS[0]}, {"sku": SKUS[1]}])
+        second_results = ItemValidator.validate_many([{"sku": SKUS[2]}, {"sku": SKUS[20]}])
+        # Both batches are prefetched, while both generators are suspended
+        self.assertTrue(next(first_results).is_valid)
+        self.assertTrue(next(second_results).is_valid)
+        self.assertTrue(next(first_results).is_valid)
+        self.assertFalse(next(second_results).is_valid)
+        self.assertEqual((index.num_single_lookups, index.num_batch_lookups), (0, 2))
+        first_results.close()
+        second_results.close()
+
+        # The prefetched results of the batches are not used by other validations
+        index.values = frozenset()
+        self.assertFalse(ItemValidator.is_valid({"sku": SKUS[0]}))
+        self.assertEqual(index.num_single_lookups, 1)
+
+    def test_batched_lookups_match_single_lookups(self):
+        sqlite_path = os.path.join(self.temp_dir.name, "mixed.db")
+        with sqlite3.connect(sqlite_path) as connection:
+            connection.execute("CREATE TABLE texts (value TEXT PRIMARY KEY)")
+            connection.executemany("INSERT INTO texts (value) VALUES (?)", [("1",), ("abc",)])
+            connection.execute("CREATE TABLE numbers (value INTEGER PRIMARY KEY)")
+            connection.executemany("INSERT INTO numbers (value) VALUES (?)", [(1,), (2,)])
+        connection.close()
+        text_index = SqliteLookupIndex(sqlite_path, table="texts", column="value")
+        number_index = SqliteLookupIndex(sqlite_path, table="numbers", column="value")
+        indexes = [
+            text_index,
+            number_index,
+            BloomFilterLookupIndex(["1", "abc"], fallback=text_index, expected_count=2),
+            BloomFilterLookupIndex([1, 2], fallback=number_index, expected_count=2),
+        ]
+        values = [1, "1", 1.0, True, b"1", "abc", 1.5, "1.0", 2, "2"]
+        for index in indexes:
+            expected_results = [index.contains(value) for value in values]
+            prefetched_results = index.prefetch(values)
+            self.assertEqual(
+                [index.contains(value, prefetched_results=prefetched_results) for value in values],
+                expected_results,
+                msg=index,
+            )
+            for value, expected_result in zip(values, expected_results):
+                self.assertEqual(index.contains_many([value]), {value: expected_result}, msg=(index, value))
+        self.assertTrue(text_index.contains(1))
+        self.assertTrue(number_index.contains(1.0))
+        self.assertFalse(indexes[3].is_enabled)
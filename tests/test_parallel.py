@@ -0,0 +1,59 @@
+import unittest
+
+from valcheck import fields, validators
+from valcheck.parallel import validate_in_parallel
+
+
+class NumberValidator(validators.Validator):
+    number = fields.IntegerField(validators=[lambda value: value % 7 != 0])
+
+
+def generate_records(*, count: int):
+    for number in range(count):
+        yield {"number": number} if number % 11 else {"number": str(number)}
+
+
+class TestParallel(unittest.TestCase):
+
+    def test_validate_in_parallel(self):
+        expected_results = list(NumberValidator.validate_many(generate_records(count=1000)))
+        results = list(
+            validate_in_parallel(
+                generate_records(count=1000),
+                validator_model=NumberValidator,
+                chunk_size=64,
+                max_workers=2,
+            )
+        )
+        self.assertEqual([result.index for result in results], list(range(1000)))
+        self.assertEqual(
+            [(result.validated_data, [error.as_dict() for error in result.errors]) for result in results],
+            [(result.validated_data, [error.as_dict() for error in result.errors]) for result in expected_results],
+        )
+
+        unordered_results = list(
+            validate_in_parallel(
+                generate_records(count=1000),
+                validator_model=NumberValidator,
+                chunk_size=64,
+                max_workers=2,
+                ordered=False,
+            )
+        )
+        self.assertEqual(
+            sorted(result.index for result in unordered_results),
+            list(range(1000)),
+        )
+        self.assertEqual(
+            sum(not result.is_valid for result in unordered_results),
+            sum(not result.is_valid for result in expected_results),
+        )
+
+    def test_validator_model_must_be_importable(self):
+        class LocalValidator(validators.Validator):
+            number = fields.IntegerField()
+
+        with self.assertRaises(AssertionError):
+            validate_in_parallel([{"number": 1}], validator_model=LocalValidator)
+        with self.assertRaises(AssertionError):
+            validate_in_parallel([{"number": 1}], validator_model=NumberValidator, chunk_size=0)
@@ -0,0 +1,111 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from valcheck import fields, validators
+from valcheck.streaming import validate_json_lines
+
+
+class PersonValidator(validators.Validator):
+    name = fields.StringField(allow_empty=False)
+    age = fields.IntegerField()
+
+
+class PeopleValidator(validators.Validator):
+    people = fields.ModelListField(validator_model=PersonValidator)
+
+
+JSON_LINES = (
+    '{"name": "james", "age": 30}\n'
+    '{"name": "", "age": "thirty"}\n'
+    '\n'
+    '{"name": "jane", "age": 25\n'
+    '[1, 2, 3]\n'
+    '{"name": "jöhn", "age": 40}\n'
+)
+
+
+class TestStreaming(unittest.TestCase):
+
+    def assert_results(self, results) -> None:
+        results = list(results)
+        self.assertEqual([result.index for result in results], [0, 1, 3, 4, 5])
+        self.assertEqual([result.is_valid for result in results], [True, False, False, False, True])
+        self.assertEqual(results[0].validated_data, {"name": "james", "age": 30})
+        self.assertEqual(results[4].validated_data, {"name": "jöhn", "age": 40})
+
+        expected_byte_offsets = {1: 29, 3: 60, 4: 87}
+        for result in results[1:4]:
+            line_number = result.index + 1
+            self.assertTrue(result.errors)
+            for error in result.errors:
+                self.assertEqual(error.details["line_number"], line_number)
+                self.assertEqual(error.details["byte_offset"], expected_byte_offsets[result.index])
+        self.assertEqual(len(results[1].errors), 2)
+        self.assertTrue(results[2].errors[0].validator_message.startswith("Invalid JSON line"))
+
+    def test_validate_json_lines_from_file_objects(self):
+        self.assert_results(
+            validate_json_lines(io.BytesIO(JSON_LINES.encode("utf-8")), validator_model=PersonValidator),
+        )
+        self.assert_results(
+            validate_json_lines(io.StringIO(JSON_LINES), validator_model=PersonValidator),
+        )
+
+    def test_validate_json_lines_from_path(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, "people.jsonl")
+            with open(filepath, mode="w", encoding="utf-8") as fp:
+                fp.write(JSON_LINES)
+            self.assert_results(validate_json_lines(filepath, validator_model=PersonValidator))
+
+    def test_validate_json_lines_with_max_errors(self):
+        results = list(
+            validate_json_lines(io.BytesIO(JSON_LINES.encode("utf-8")), validator_model=PersonValidator, max_errors=3),
+        )
+        self.assertEqual([result.index for result in results], [0, 1, 3])
+
+        people = [{"name": "", "age": "thirty"}] * 500
+        lines = "".join(json.dumps({"people": people}) + "\n" for _ in range(3))
+        results = list(validate_json_lines(io.StringIO(lines), validator_model=PeopleValidator, max_errors=10))
+        self.assertEqual([len(result.errors) for result in results], [10])
+
+    def test_byte_offsets_of_text_mode_files(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, "people.jsonl")
+            for encoding in ("utf-8", "latin-1"):
+                with open(filepath, mode="wb") as fp:
+                    fp.write(JSON_LINES.replace("\n", "\r\n").encode(encoding))
+                with open(filepath, mode="r", encoding=encoding) as fp:
+                    results = list(validate_json_lines(fp, validator_model=PersonValidator))
+                self.assertEqual([result.is_valid for result in results], [True, False, False, False, True], msg=encoding)
+                self.assertEqual(results[4].validated_data, {"name": "jöhn", "age": 40}, msg=encoding)
+                self.assertEqual(
+                    [error.details["byte_offset"] for result in results for error in result.errors],
+                    [30, 30, 63, 91],
+                    msg=encoding,
+                )
+
+    def test_text_mode_files_with_multi_byte_newlines(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, "people.jsonl")
+            for encoding in ("utf-16", "utf-16-le", "utf-32", "utf-8-sig"):
+                with open(filepath, mode="w", encoding=encoding) as fp:
+                    fp.write(JSON_LINES)
+                with open(filepath, mode="r", encoding=encoding) as fp:
+                    results = list(validate_json_lines(fp, validator_model=PersonValidator))
+                self.assertEqual([result.is_valid for result in results], [True, False, False, False, True], msg=encoding)
+                self.assertEqual(results[0].validated_data, {"name": "james", "age": 30}, msg=encoding)
+                self.assertEqual(results[4].validated_data, {"name": "jöhn", "age": 40}, msg=encoding)
+                # The byte offset of a line is the length of the encoded text (including the BOM, if any) that precedes it
+                expected_byte_offsets = [
+                    len(JSON_LINES[:JSON_LINES.index(line)].encode(encoding))
+                    for line in ('{"name": ""', '{"name": ""', '{"name": "jane"', "[1, 2, 3]")
+                ]
+                self.assertEqual(
+                    [error.details["byte_offset"] for result in results for error in result.errors],
+                    expected_byte_offsets,
+                    msg=encoding,
+                )
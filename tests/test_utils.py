@@ -105,6 +105,17 @@ class TestUtils(unittest.TestCase):
             utils.access_nested_dictionary(dictionary, path=["other_hobbies_v1", 300, "name"], default=None),
         )
 
+    def test_is_within_bounds(self):
+        self.assertTrue(utils.is_within_bounds(5, min_value=1, max_value=10))
+        self.assertTrue(utils.is_within_bounds(1, min_value=1))
+        self.assertTrue(utils.is_within_bounds(10, max_value=10))
+        self.assertTrue(utils.is_within_bounds(-100))
+        self.assertFalse(utils.is_within_bounds(0, min_value=1, max_value=10))
+        self.assertFalse(utils.is_within_bounds(11, min_value=1, max_value=10))
+        self.assertFalse(utils.is_within_bounds(float("nan"), min_value=0.0))
+        self.assertFalse(utils.is_within_bounds(float("nan"), max_value=1.0))
+        self.assertTrue(utils.is_within_bounds(float("nan")))
+
     def test_timezone_string_class(self):
         timezone_string_1 = utils.TimezoneString("UTC-02:30")
         self.assertEqual(timezone_string_1.tz_name, "UTC-02:30")
@@ -1,6 +1,8 @@
+import pickle
 import unittest
 
-from valcheck import fields, validators
+from valcheck import exceptions, fields, models, settings, validators
+from valcheck.apis.validators import ApiRequestValidator
 
 
 class ValidatorA(validators.Validator):
@@ -10,6 +12,12 @@ class ValidatorA(validators.Validator):
     d = fields.IntegerField()
 
 
+class CustomError(models.Error):
+    def __init__(self, *, severity: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.severity = severity
+
+
 class TestValidator(unittest.TestCase):
 
     def test_deep_copy_in_validator(self):
@@ -85,3 +93,456 @@ class TestValidator(unittest.TestCase):
             msg="Param extra_data does not match",
         )
 
+    def test_schema_plan(self):
+        plan = ValidatorA.get_schema_plan()
+        self.assertIsInstance(plan, validators.SchemaPlan)
+        self.assertIs(plan, ValidatorA.get_schema_plan())
+        self.assertEqual(plan.field_identifiers, ("a", "b", "c", "d"))
+        self.assertEqual(plan.sources, frozenset(["a", "b", "c", "d"]))
+        self.assertEqual(list(plan.target_to_field.keys()), ["a", "b", "c", "d"])
+        self.assertTrue(all(field.field_identifier == field.source for field in plan.fields))
+        with self.assertRaises(TypeError):
+            plan.field_info["e"] = fields.IntegerField()
+
+        # the plan must be shared across instances, and must not hold any per-instance data
+        val_1 = ValidatorA(data={"a": 1, "b": 2, "c": 3, "d": 4})
+        val_2 = ValidatorA(data={"a": 5, "b": 6, "c": 7, "d": 8})
+        self.assertIs(val_1.get_schema_plan(), val_2.get_schema_plan())
+        val_1.run_validations()
+        val_2.run_validations()
+        self.assertEqual(val_1.validated_data, {"a": 1, "b": 2, "c": 3, "d": 4})
+        self.assertEqual(val_2.validated_data, {"a": 5, "b": 6, "c": 7, "d": 8})
+
+        # sub-classes get their own plan, which includes the fields of the parent classes
+        class ValidatorAChild(ValidatorA):
+            e = fields.IntegerField(source="e_source", target="e_target")
+
+        child_plan = ValidatorAChild.get_schema_plan()
+        self.assertIsNot(child_plan, plan)
+        self.assertEqual(child_plan.field_identifiers, ("a", "b", "c", "d", "e"))
+        self.assertEqual(child_plan.source_to_field["e_source"].target, "e_target")
+        self.assertEqual(plan.field_identifiers, ("a", "b", "c", "d"))
+
+    def test_schema_plan_is_checked_at_class_creation(self):
+        with self.assertRaises(exceptions.InvalidFieldIdentifierException):
+            class InvalidIdentifierValidator(validators.Validator):
+                Invalid_identifier = fields.IntegerField()
+
+        with self.assertRaises(exceptions.DuplicateSourcesException):
+            class DuplicateSourcesValidator(validators.Validator):
+                x = fields.IntegerField(source="same")
+                y = fields.IntegerField(source="same")
+
+        with self.assertRaises(exceptions.DuplicateTargetsException):
+            class DuplicateTargetsValidator(validators.Validator):
+                x = fields.IntegerField(target="same")
+                y = fields.IntegerField(target="same")
+
+    def test_compiled_validator(self):
+        class CompiledValidator(ValidatorA, compiled=True):
+            e = fields.StringField(required=False, default_factory=lambda: "default")
+            f = fields.IntegerField(nullable=True, converter_factory=lambda value: None if value is None else value * 10)
+
+            def model_validator(self):
+                if self.get_validated_value("a") > self.get_validated_value("b"):
+                    return [models.Error(description="a must be <= b")]
+                return []
+
+        class CompiledValidatorChild(CompiledValidator):
+            pass
+
+        class NotCompiledValidatorChild(CompiledValidator, compiled=False):
+            def model_validators_to_consider(self):
+                return [CompiledValidator]
+
+        self.assertIsNotNone(CompiledValidator.get_schema_plan().compiled_field_validator)
+        self.assertIsNotNone(CompiledValidatorChild.get_schema_plan().compiled_field_validator)
+        self.assertIsNone(NotCompiledValidatorChild.get_schema_plan().compiled_field_validator)
+        self.assertIsNone(ValidatorA.get_schema_plan().compiled_field_validator)
+
+        for validator_model in (CompiledValidator, NotCompiledValidatorChild):
+            val = validator_model(data={"a": 1, "b": 2, "c": 3, "d": 4, "f": 5})
+            val.run_validations()
+            self.assertEqual(val.errors, [])
+            self.assertEqual(val.validated_data, {"a": 1, "b": 2, "c": 3, "d": 4, "e": "default", "f": 50})
+
+            val = validator_model(data={"a": 1, "b": 2, "c": 3, "d": 4, "f": None})
+            val.run_validations()
+            self.assertEqual(val.validated_data, {"a": 1, "b": 2, "c": 3, "d": 4, "e": "default", "f": None})
+
+            val = validator_model(data={"a": 3, "b": 2, "c": 3, "d": 4, "f": 5})
+            val.run_validations()
+            self.assertEqual([error.description for error in val.errors], ["a must be <= b"])
+            self.assertEqual(val.validated_data, {})
+
+            val = validator_model(data={"a": "1", "c": None, "d": 4, "e": 5, "f": 5})
+            val.run_validations()
+            self.assertEqual(
+                [error.validator_message for error in val.errors],
+                [
+                    "Invalid IntegerField 'a'",
+                    "Missing IntegerField 'b'",
+                    "Invalid IntegerField 'c' || Cannot be null",
+                    "Invalid StringField 'e'",
+                ],
+            )
+
+    def test_compiled_validator_with_overridden_field_methods(self):
+        class TrimmedStringField(fields.StringField):
+            def validate_entire_field(self, field_value, /, **kwargs):
+                if isinstance(field_value, str):
+                    field_value = field_value.strip()
+                return super().validate_entire_field(field_value, **kwargs)
+
+        class LowerCaseStringField(fields.StringField):
+            def _convert_field_value_if_needed(self, field_value, /):
+                return field_value.lower() if isinstance(field_value, str) else field_value
+
+        class OverridesValidator(validators.Validator):
+            x = TrimmedStringField(allow_empty=False)
+            y = LowerCaseStringField(nullable=True)
+
+        class CompiledOverridesValidator(OverridesValidator, compiled=True):
+            pass
+
+        for validator_model in (OverridesValidator, CompiledOverridesValidator):
+            val = validator_model(data={"x": "  hello  ", "y": "WORLD"})
+            val.run_validations()
+            self.assertEqual(val.validated_data, {"x": "hello", "y": "world"}, msg=validator_model)
+            val = validator_model(data={"x": "   ", "y": None})
+            val.run_validations()
+            self.assertEqual([error.validator_message for error in val.errors], ["Invalid TrimmedStringField 'x' || Must be a non-empty string"])
+
+    def test_validate_many(self):
+        records = [
+            {"a": 1, "b": 2, "c": 3, "d": 4},
+            {"a": "1", "b": "2", "c": 3, "d": 4},
+            "not a dictionary",
+            {"a": 5, "b": 6, "c": 7, "d": 8, "e": 9},
+        ]
+        results = ValidatorA.validate_many(record for record in records)
+        self.assertFalse(isinstance(results, list))  # results must be yielded lazily
+        results = list(results)
+        self.assertEqual([result.index for result in results], [0, 1, 2, 3])
+        self.assertEqual([result.is_valid for result in results], [True, False, False, True])
+        self.assertEqual(results[0].validated_data, {"a": 1, "b": 2, "c": 3, "d": 4})
+        self.assertEqual(results[0].errors, [])
+        self.assertIsNone(results[1].validated_data)
+        self.assertEqual(len(results[1].errors), 2)
+        self.assertEqual(len(results[2].errors), 1)
+        self.assertEqual(results[3].validated_data, {"a": 5, "b": 6, "c": 7, "d": 8})
+        self.assertEqual(results[3].as_dict()["index"], 3)
+
+        # stops once the error budget is exhausted, without consuming the remaining records
+        consumed = []
+
+        def generate_records():
+            for record in records:
+                consumed.append(record)
+                yield record
+
+        results = list(ValidatorA.validate_many(generate_records(), max_errors=2))
+        self.assertEqual([result.index for result in results], [0, 1])
+        self.assertEqual(len(consumed), 2)
+        results = list(ValidatorA.validate_many(records, max_errors=3))
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+
+        # the error budget is shared with the nested validators of each record
+        class RowValidator(validators.Validator):
+            x = fields.IntegerField()
+
+        class PayloadValidator(validators.Validator):
+            rows = fields.ModelListField(validator_model=RowValidator)
+
+        payloads = [{"rows": [{"x": "1"}] * 1000}, {"rows": [{"x": "1"}] * 1000}]
+        results = list(PayloadValidator.validate_many(payloads, max_errors=1))
+        self.assertEqual([len(result.errors) for result in results], [1])
+        results = list(PayloadValidator.validate_many(payloads, max_errors=1500))
+        self.assertEqual([len(result.errors) for result in results], [1000, 500])
+
+    def test_fail_fast(self):
+        class RowValidator(validators.Validator):
+            x = fields.IntegerField()
+            y = fields.IntegerField()
+
+        class PayloadValidator(validators.Validator):
+            rows = fields.ModelListField(validator_model=RowValidator)
+            row = fields.ModelDictionaryField(validator_model=RowValidator)
+            z = fields.IntegerField()
+
+        class CompiledPayloadValidator(PayloadValidator, compiled=True):
+            pass
+
+        invalid_rows = [{"x": "1", "y": "2"} for _ in range(100)]
+        data = {"rows": invalid_rows, "row": {"x": "1", "y": "2"}, "z": "3"}
+        for validator_model in (PayloadValidator, CompiledPayloadValidator):
+            val = validator_model(data=data)
+            val.run_validations()
+            self.assertEqual(len(val.errors), 203)
+
+            val = validator_model(data=data)
+            val.run_validations(fail_fast=True)
+            self.assertEqual(len(val.errors), 1)
+            self.assertEqual(val.errors[0].field_path, "rows --> x")
+            self.assertEqual(val.validated_data, {})
+
+            val = validator_model(data={**data, "rows": []})
+            val.run_validations(fail_fast=True)
+            self.assertEqual(len(val.errors), 1)
+            self.assertEqual(val.errors[0].field_path, "row --> x")
+
+            val = validator_model(data={"rows": [{"x": 1, "y": 2}], "row": {"x": 1, "y": 2}, "z": 3})
+            val.run_validations(fail_fast=True)
+            self.assertEqual(val.errors, [])
+            self.assertEqual(val.validated_data, {"rows": [{"x": 1, "y": 2}], "row": {"x": 1, "y": 2}, "z": 3})
+
+    def test_is_valid(self):
+        class RowValidator(validators.Validator):
+            x = fields.IntegerField(converter_factory=str)
+            y = fields.StringField(required=False, nullable=True, validators=[lambda value: len(value) <= 3])
+
+        class PayloadValidator(validators.Validator):
+            rows = fields.ModelListField(validator_model=RowValidator, allow_empty=False)
+            row = fields.ModelDictionaryField(validator_model=RowValidator)
+
+        class StrictPayloadValidator(PayloadValidator):
+            def model_validator(self):
+                if len(self.get_validated_value("rows")) > 1:
+                    return [models.Error(description="Expected at most 1 row")]
+                return []
+
+        class CustomIntegerField(fields.IntegerField):
+            def validate(self, field_value, /, **kwargs):
+                field_value, errors = super().validate(field_value, **kwargs)
+                if not errors and field_value < 0:
+                    return (None, [self.create_invalid_field_error(suffix="Must be non-negative")])
+                return (field_value, errors)
+
+        class CustomValidator(validators.Validator):
+            x = CustomIntegerField()
+
+        class ConvertingFieldsValidator(validators.Validator):
+            day = fields.DateStringField(to_date_obj=True, validators=[lambda value: value.year >= 2000])
+            number = fields.IntegerStringField(to_integer=True, validators=[lambda value: isinstance(value, int)])
+            payload = fields.JsonStringField(required=False, to_python_obj=True, validators=[lambda value: "id" in value])
+
+        class TrimmedStringField(fields.StringField):
+            def validate_entire_field(self, field_value, /, **kwargs):
+                if isinstance(field_value, str):
+                    field_value = field_value.strip()
+                return super().validate_entire_field(field_value, **kwargs)
+
+        class BlankAsNullStringField(fields.StringField):
+            def _can_be_set_to_null(self, field_value, /):
+                return self.nullable and (field_value is None or field_value == "")
+
+            def _convert_field_value_if_needed(self, field_value, /):
+                return None if field_value == "" else super()._convert_field_value_if_needed(field_value)
+
+        class OverridesValidator(validators.Validator):
+            x = TrimmedStringField(allow_empty=False)
+            y = BlankAsNullStringField(allow_empty=False, nullable=True)
+
+        self.assertIs(CustomIntegerField.is_valid_value, fields.Field.is_valid_value)
+        test_cases = [
+            (PayloadValidator, {"rows": [{"x": 1, "y": None}], "row": {"x": 2, "y": "abc"}}),
+            (PayloadValidator, {"rows": [{"x": 1}, {"x": 2}], "row": {"x": 2}}),
+            (PayloadValidator, {"rows": [], "row": {"x": 2}}),
+            (PayloadValidator, {"rows": [{"x": 1}, "x"], "row": {"x": 2}}),
+            (PayloadValidator, {"rows": [{"x": 1}], "row": {"x": 2, "y": "abcd"}}),
+            (PayloadValidator, {"rows": [{"x": 1}]}),
+            (StrictPayloadValidator, {"rows": [{"x": 1}], "row": {"x": 2}}),
+            (StrictPayloadValidator, {"rows": [{"x": 1}, {"x": 2}], "row": {"x": 2}}),
+            (CustomValidator, {"x": 1}),
+            (CustomValidator, {"x": -1}),
+            (ConvertingFieldsValidator, {"day": "2020-04-20", "number": "12", "payload": '{"id": 1}'}),
+            (ConvertingFieldsValidator, {"day": "1999-04-20", "number": "12"}),
+            (ConvertingFieldsValidator, {"day": "2020-04-20", "number": "1.5"}),
+            (ConvertingFieldsValidator, {"day": "2020-04-20", "number": "12", "payload": '{"key": 1}'}),
+            (OverridesValidator, {"x": "  hello  ", "y": "world"}),
+            (OverridesValidator, {"x": "   ", "y": "world"}),
+            (OverridesValidator, {"x": "hello", "y": ""}),
+            (OverridesValidator, {"x": "hello", "y": 1}),
+        ]
+        for validator_model, data in test_cases:
+            val = validator_model(data=data)
+            val.run_validations()
+            self.assertEqual(validator_model.is_valid(data), not val.errors, msg=data)
+        self.assertFalse(PayloadValidator.is_valid(None))
+        self.assertFalse(PayloadValidator.is_valid([]))
+
+    def test_max_errors(self):
+        class RowValidator(validators.Validator):
+            x = fields.IntegerField()
+            y = fields.IntegerField()
+
+        class PayloadValidator(validators.Validator):
+            rows = fields.ModelListField(validator_model=RowValidator)
+            capped_rows = fields.ModelListField(validator_model=RowValidator, max_errors=5, required=False)
+            z = fields.IntegerField()
+
+        class CompiledPayloadValidator(PayloadValidator, compiled=True):
+            pass
+
+        invalid_rows = [{"x": "1", "y": "2"} for _ in range(100)]
+        for validator_model in (PayloadValidator, CompiledPayloadValidator):
+            val = validator_model(data={"rows": invalid_rows, "z": "3"})
+            self.assertFalse(val.errors_truncated)
+            self.assertEqual(val.skipped_row_count, 0)
+            val.run_validations()
+            self.assertEqual(len(val.errors), 201)
+            self.assertFalse(val.errors_truncated)
+            self.assertEqual(val.skipped_row_count, 0)
+
+            val = validator_model(data={"rows": invalid_rows, "z": "3"})
+            val.run_validations(max_errors=7)
+            self.assertEqual(len(val.errors), 7)
+            self.assertTrue(val.errors_truncated)
+            self.assertEqual(val.skipped_row_count, 96)
+            self.assertEqual(val.validated_data, {})
+
+            val = validator_model(data={"rows": [{"x": 1, "y": 2}], "capped_rows": invalid_rows, "z": "3"})
+            val.run_validations()
+            self.assertEqual(len(val.errors), 6)
+            self.assertEqual([error.field_path for error in val.errors[:5]], ["capped_rows --> x", "capped_rows --> y"] * 2 + ["capped_rows --> x"])
+            self.assertEqual(val.errors[5].field_path, "z")
+            self.assertTrue(val.errors_truncated)
+            self.assertEqual(val.skipped_row_count, 97)
+
+            val = validator_model(data={"rows": [{"x": "1", "y": 2}], "z": "3"})
+            val.run_validations(max_errors=2)
+            self.assertEqual(len(val.errors), 2)
+            self.assertFalse(val.errors_truncated)
+
+        # nested API request validators share the error budget of the parent validator
+        class ApiRowsValidator(ApiRequestValidator):
+            rows = fields.ModelListField(validator_model=RowValidator)
+
+        class ApiPayloadValidator(validators.Validator):
+            payload = fields.ModelDictionaryField(validator_model=ApiRowsValidator)
+
+        val = ApiPayloadValidator(data={"payload": {"rows": invalid_rows}})
+        val.run_validations(max_errors=3)
+        self.assertEqual(len(val.errors), 3)
+        self.assertTrue(val.errors_truncated)
+        self.assertEqual(val.skipped_row_count, 98)
+
+    def test_lazy_validator_messages(self):
+        num_sample_values = []
+
+        class RowValidator(validators.Validator):
+            day = fields.DateStringField(sample_value_factory=lambda: num_sample_values.append(1) or "2020-04-20")
+
+        class PayloadValidator(validators.Validator):
+            rows = fields.ModelListField(validator_model=RowValidator)
+            row = fields.ModelDictionaryField(validator_model=RowValidator)
+
+        val = PayloadValidator(data={"rows": [{"day": "2020-04-20"}, {"day": "x"}], "row": {}})
+        val.run_validations()
+        self.assertEqual(len(val.errors), 2)
+        self.assertEqual(num_sample_values, [])
+        self.assertEqual(
+            [error.validator_message for error in val.errors],
+            [
+                "Invalid ModelListField 'rows' || Invalid DateStringField 'day' || Must be a valid date-string of format '%Y-%m-%d'."
+                " Eg: '2020-04-20' <Row number: 2>",
+                "Invalid ModelDictionaryField 'row' || Missing DateStringField 'day'",
+            ],
+        )
+        self.assertEqual(num_sample_values, [1])
+        val.errors[1].validator_message = "Overridden"
+        self.assertEqual(val.errors[1].as_dict()["validator_message"], "Overridden")
+
+    def test_errors_are_derived_from_the_field_error(self):
+        field_error = models.Error(description="Invalid price", code="E1", details={"limits": [0, 100]})
+
+        class ItemValidator(validators.Validator):
+            price = fields.IntegerField(error=field_error)
+
+        errors = []
+        for _ in range(2):
+            val = ItemValidator(data={"price": "1"})
+            val.run_validations()
+            errors += val.errors
+        self.assertFalse(hasattr(errors[0], "__dict__"))
+        self.assertEqual([(error.description, error.code) for error in errors], [("Invalid price", "E1")] * 2)
+        errors[0].details["limits"].append(200)
+        self.assertEqual(errors[0].details, {"limits": [0, 100, 200]})
+        self.assertEqual(errors[1].details, {"limits": [0, 100]})
+        self.assertEqual(ItemValidator.get_schema_plan().field_info["price"].error.details, {"limits": [0, 100]})
+        self.assertEqual(errors[1].copy().as_dict(), errors[1].as_dict())
+
+        # empty details are not shared either
+        val = ValidatorA(data={})
+        val.run_validations()
+        val.errors[0].details["x"] = 1
+        self.assertEqual(val.errors[1].details, {})
+        self.assertEqual(ValidatorA.get_schema_plan().field_info["a"].error.details, {})
+
+    def test_field_path_segments(self):
+        class RowValidator(validators.Validator):
+            x = fields.IntegerField()
+
+        class PayloadValidator(validators.Validator):
+            rows = fields.ModelListField(validator_model=RowValidator)
+            row = fields.ModelDictionaryField(validator_model=RowValidator, source="row/~1")
+
+        val = PayloadValidator(data={"rows": [{"x": 1}, {"x": "2"}, "3"], "row/~1": {"x": "4"}})
+        val.run_validations()
+        self.assertEqual([error.field_path_segments for error in val.errors], [("rows", 1, "x"), ("rows", 2), ("row/~1", "x")])
+        self.assertEqual([error.field_path for error in val.errors], ["rows --> x", "rows", "row/~1 --> x"])
+        self.assertEqual(
+            [error.as_dict(include_field_path_pointer=True)["field_path_pointer"] for error in val.errors],
+            ["/rows/1/x", "/rows/2", "/row~1~01/x"],
+        )
+        error = models.Error(field_path_part="a1/a2")
+        error.append_to_field_path("parent")
+        error.append_to_field_path("child", at_beginning=False, separator=".")
+        self.assertEqual(error.field_path, "parent --> a1/a2.child")
+        self.assertEqual(pickle.loads(pickle.dumps(val.errors[0])).field_path_pointer, "/rows/1/x")
+
+    def test_errors_are_picklable(self):
+        error = CustomError(severity="high", description="Invalid price", details={"limits": [0, 100]})
+        error.validator_message = "Invalid IntegerField 'price'"
+        error.prepend_to_field_path("rows", 1, "price")
+        unpickled_error = pickle.loads(pickle.dumps(error))
+        self.assertIs(unpickled_error.__class__, CustomError)
+        self.assertEqual(unpickled_error.severity, "high")
+        self.assertEqual(unpickled_error.as_dict(include_field_path_pointer=True), error.as_dict(include_field_path_pointer=True))
+
+    def test_slotted_objects(self):
+        class SlottedValidator(validators.Validator):
+            __slots__ = ()
+            a = fields.IntegerField()
+
+        val = SlottedValidator(data={"a": 1})
+        val.run_validations()
+        self.assertEqual(val.validated_data, {"a": 1})
+        validated_field = SlottedValidator.get_schema_plan().fields[0].validate_entire_field(1)
+        for obj in [val, validated_field, validated_field.field, fields.DateStringField(), fields.ChoiceField(choices=[1])]:
+            self.assertFalse(hasattr(obj, "__dict__"), msg=obj.__class__.__name__)
+
+    def test_production_mode(self):
+        class RowValidator(validators.Validator):
+            x = fields.IntegerField(validators=[lambda value: 1 if value > 0 else 0])
+
+        self.assertFalse(settings.is_production_mode())
+        with self.assertRaises(AssertionError):
+            RowValidator(data={"x": 1}).run_validations()
+        settings.set_production_mode(True)
+        try:
+            self.assertTrue(settings.is_production_mode())
+            val = RowValidator(data={"x": 1})
+            val.run_validations()
+            self.assertEqual(val.validated_data, {"x": 1})
+            val = RowValidator(data={"x": "1"})
+            val.run_validations()
+            self.assertEqual(len(val.errors), 1)
+            # The arguments passed in by users are still checked
+            with self.assertRaises(AssertionError):
+                models.Error(details="x")
+            with self.assertRaises(AssertionError):
+                models.Error().field_path = ["x"]
+        finally:
+            settings.set_production_mode(False)
+        self.assertFalse(settings.is_production_mode())
@@ -8,15 +8,25 @@ from valcheck.validators import Validator
 class ApiRequestValidator(Validator):
     """Class that represents an API request Validator."""
 
-    def run_validations(self, *, raise_exception: Optional[bool] = False, **kwargs: Any) -> None:
+    def run_validations(
+            self,
+            *,
+            raise_exception: Optional[bool] = False,
+            fail_fast: Optional[bool] = False,
+            max_errors: Optional[int] = None,
+            **kwargs: Any,
+        ) -> None:
         """
         Runs validations and registers errors/validated-data.
         If `raise_exception=True` and validations fail, raises `valcheck.apis.exceptions.ApiRequestValidationException`.
+        If `max_errors` is passed, stops once the count of errors reaches `max_errors`.
+        If `fail_fast=True`, stops at the first error (same as `max_errors=1`).
 
         Accepted kwargs:
             - http_status_code (int): The HTTP status code to use if `valcheck.apis.exceptions.ApiRequestValidationException` is raised. Default: 418.
+            - error_budget (ErrorBudget): The error budget shared with a parent validator (used by the nested validators).
         """
-        super().run_validations()
+        super().run_validations(fail_fast=fail_fast, max_errors=max_errors, error_budget=kwargs.get("error_budget", None))
         if raise_exception and self.errors:
             http_status_code: int = kwargs.get("http_status_code", status_codes.HTTP_418_IM_A_TEAPOT)
             raise ApiRequestValidationException(
@@ -0,0 +1,265 @@
+"""
+Code generation of specialized field validation functions (used by validators having `compiled=True`).
+
+The generated function inlines the decision tree of `valcheck.fields.Field.validate_entire_field()` for each field of
+a validator, with the branches that do not apply to a field (based on its `required`, `nullable`, `default_factory`,
+`validators` and `converter_factory` params) pruned away at compile time.
+Fields whose class overrides `validate_entire_field()` (or the helpers it uses) are validated by calling said method.
+"""
+
+from datetime import date
+import linecache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from uuid import UUID
+
+from valcheck import fields
+from valcheck.lookups import PrefetchedLookups
+from valcheck.models import Error, ErrorBudget
+from valcheck import utils
+
+
+CompiledFieldValidator = Callable[
+    [Dict[str, Any], ErrorBudget, Optional[PrefetchedLookups]],
+    Tuple[Dict[str, Any], List[Error]],
+]
+
+INDENT = " " * 4
+
+# The kwargs passed to the `validate()` and `validate_entire_field()` methods of the fields by the generated code
+FIELD_KWARGS = "error_budget=error_budget, prefetched_lookups=prefetched_lookups"
+
+
+def _join_conditions(*conditions: str) -> str:
+    """Joins the (non-empty) conditions with `and`. Returns an empty string if there are no conditions"""
+    conditions = [condition for condition in conditions if condition]
+    if len(conditions) <= 1:
+        return "".join(conditions)
+    return "(" + " and ".join(conditions) + ")"
+
+
+def _make_bounds_condition(field_name: str, expr: str, /, *, min_attr: str, min_value: Any, max_attr: str, max_value: Any) -> str:
+    """Returns the condition that checks if `expr` is within the bounds (given by the attributes of the field)"""
+    return _join_conditions(
+        f"{expr} >= {field_name}.{min_attr}" if min_value is not None else "",
+        f"{expr} <= {field_name}.{max_attr}" if max_value is not None else "",
+    )
+
+
+def _make_value_bounds_condition(field: fields.Field, field_name: str, value_name: str, /) -> str:
+    return _make_bounds_condition(
+        field_name,
+        value_name,
+        min_attr="min_value",
+        min_value=field.min_value,
+        max_attr="max_value",
+        max_value=field.max_value,
+    )
+
+
+def _make_length_bounds_condition(field: fields.Field, field_name: str, value_name: str, /) -> str:
+    return _make_bounds_condition(
+        field_name,
+        f"len({value_name})",
+        min_attr="min_length",
+        min_value=field.min_length,
+        max_attr="max_length",
+        max_value=field.max_length,
+    )
+
+
+# Mapping of field type to a callable that returns a Python expression (as a string) which evaluates to `True` if, and only if,
+# the `validate()` method of said field would accept the value as-is (without converting it).
+# The callable takes in the field, the name of the field (in the generated code) and the name of the value (in the generated code).
+# Only the exact types are looked up, since a sub-class of a field could override its `validate()` method.
+# Fields that are not in the mapping fall back to calling their `validate()` method.
+_INLINE_VALIDITY_CHECKS: Dict[Type[fields.Field], Callable[[fields.Field, str, str], str]] = {
+    fields.AnyField: lambda field, field_name, value_name: "True",
+    fields.BooleanField: lambda field, field_name, value_name: f"isinstance({value_name}, bool)",
+    fields.StringField: lambda field, field_name, value_name: _join_conditions(
+        f"isinstance({value_name}, str)",
+        f"bool({value_name})" if not field.allow_empty else "",
+        _make_length_bounds_condition(field, field_name, value_name),
+        f"{field_name}.pattern.fullmatch({value_name}) is not None" if field.pattern is not None else "",
+    ),
+    fields.UuidField: lambda field, field_name, value_name: f"isinstance({value_name}, UUID)",
+    fields.DateField: lambda field, field_name, value_name: f"{value_name}.__class__ is date",
+    fields.ChoiceField: lambda field, field_name, value_name: f"{field_name}.is_valid_value({value_name})",
+    fields.BytesField: lambda field, field_name, value_name: f"isinstance({value_name}, bytes)",
+    fields.NumberField: lambda field, field_name, value_name: _join_conditions(
+        f"isinstance({value_name}, (int, float))",
+        _make_value_bounds_condition(field, field_name, value_name),
+    ),
+    fields.IntegerField: lambda field, field_name, value_name: _join_conditions(
+        f"isinstance({value_name}, int)",
+        _make_value_bounds_condition(field, field_name, value_name),
+    ),
+    fields.FloatField: lambda field, field_name, value_name: _join_conditions(
+        f"isinstance({value_name}, float)",
+        _make_value_bounds_condition(field, field_name, value_name),
+    ),
+    fields.DictionaryField: lambda field, field_name, value_name: (
+        f"isinstance({value_name}, dict)" if field.allow_empty else f"(isinstance({value_name}, dict) and bool({value_name}))"
+    ),
+    fields.ListField: lambda field, field_name, value_name: _join_conditions(
+        f"isinstance({value_name}, list)",
+        f"bool({value_name})" if not field.allow_empty else "",
+        _make_length_bounds_condition(field, field_name, value_name),
+    ),
+}
+
+
+def _indent_lines(lines: List[str], /, *, level: int) -> List[str]:
+    return [INDENT * level + line for line in lines]
+
+
+def _make_register_lines(field: fields.Field, field_name: str, value_name: str, /, *, may_be_empty: bool) -> List[str]:
+    """Returns the lines that register the (converted) validated value of the field"""
+    target = repr(field.target)
+    if field.converter_factory is None:
+        if may_be_empty:
+            return [
+                f"if not isinstance({value_name}, Empty):",
+                f"{INDENT}validated_data[{target}] = {value_name}",
+            ]
+        return [f"validated_data[{target}] = {value_name}"]
+    return [
+        f"{value_name} = {field_name}_converter({value_name})",
+        f"if not isinstance({value_name}, Empty):",
+        f"{INDENT}validated_data[{target}] = {value_name}",
+    ]
+
+
+def _make_post_validation_lines(field: fields.Field, field_name: str, value_name: str, /, *, may_be_empty: bool) -> List[str]:
+    """Returns the lines that run the custom validators (if any), and register the validated value of the field"""
+    register_lines = _make_register_lines(field, field_name, value_name, may_be_empty=may_be_empty)
+    if not field.validators:
+        return register_lines
+    return [
+        f"failed_validator_index = {field_name}._get_failed_custom_validator_index({value_name})",
+        "if failed_validator_index is not None:",
+        f"{INDENT}suffix = {field_name}._make_custom_validation_failed_suffix(failed_validator_index)",
+        f"{INDENT}errors.append({field_name}.create_invalid_field_error(suffix=suffix))",
+        "else:",
+        *_indent_lines(register_lines, level=1),
+    ]
+
+
+def _make_validation_lines(field: fields.Field, field_name: str, value_name: str, /, *, may_be_empty: bool) -> List[str]:
+    """Returns the lines that validate the (non-null) value of the field"""
+    generic_lines = [
+        f"{value_name}, field_errors = {field_name}_validate({value_name}, {FIELD_KWARGS})",
+        "if field_errors:",
+        f"{INDENT}errors.extend(field_errors)",
+        "else:",
+        *_indent_lines(_make_post_validation_lines(field, field_name, value_name, may_be_empty=may_be_empty), level=1),
+    ]
+    make_inline_check = _INLINE_VALIDITY_CHECKS.get(field.__class__, None)
+    if make_inline_check is None:
+        return generic_lines
+    inline_check = make_inline_check(field, field_name, value_name)
+    return [
+        f"if {inline_check}:",
+        *_indent_lines(_make_post_validation_lines(field, field_name, value_name, may_be_empty=may_be_empty), level=1),
+        "else:",
+        *_indent_lines(generic_lines, level=1),
+    ]
+
+
+def _make_null_lines(field: fields.Field, field_name: str, value_name: str, /) -> List[str]:
+    """Returns the lines that handle a field value of `None`"""
+    if field.nullable:
+        return _make_register_lines(field, field_name, value_name, may_be_empty=False)
+    return [f"errors.append({field_name}.create_invalid_field_error(suffix='Cannot be null'))"]
+
+
+def _make_entire_field_lines(field: fields.Field, field_name: str, /) -> List[str]:
+    """Returns the lines that validate the field by calling its `validate_entire_field()` method"""
+    return [
+        f"# Field: {field.field_identifier} ({field.__class__.__name__})",
+        f"validated_field = {field_name}.validate_entire_field(data_get({field.source!r}, EMPTY), {FIELD_KWARGS})",
+        "if validated_field._errors:",
+        f"{INDENT}errors.extend(validated_field._errors)",
+        "elif not isinstance(validated_field._field_value, Empty):",
+        f"{INDENT}validated_data[{field.target!r}] = validated_field._field_value",
+    ]
+
+
+def _make_field_lines(field: fields.Field, field_name: str, /) -> List[str]:
+    """Returns the lines that perform all the validation checks of a field (mirrors `Field.validate_entire_field()`)"""
+    if field._overrides_inlined_methods:
+        return _make_entire_field_lines(field, field_name)
+    value_name = "value"
+    lines = [
+        f"# Field: {field.field_identifier} ({field.__class__.__name__})",
+        f"{value_name} = data_get({field.source!r}, EMPTY)",
+    ]
+    may_be_empty = False
+    if field.required:
+        lines += [
+            f"if isinstance({value_name}, Empty):",
+            f"{INDENT}errors.append({field_name}.create_missing_field_error())",
+            f"elif {value_name} is None:",
+        ]
+    elif field.default_factory:
+        may_be_empty = True  # The `default_factory` could return an empty value
+        lines += [
+            f"if isinstance({value_name}, Empty):",
+            f"{INDENT}{value_name} = {field_name}_default_factory()",
+            f"if {value_name} is None:",
+        ]
+    else:
+        lines += [
+            f"if isinstance({value_name}, Empty):",
+            f"{INDENT}pass",
+            f"elif {value_name} is None:",
+        ]
+    lines += _indent_lines(_make_null_lines(field, field_name, value_name), level=1)
+    lines += ["else:"]
+    lines += _indent_lines(_make_validation_lines(field, field_name, value_name, may_be_empty=may_be_empty), level=1)
+    return lines
+
+
+def compile_field_validator(field_info: Dict[str, fields.Field], /, *, name: str) -> CompiledFieldValidator:
+    """
+    Generates (and compiles) a function that validates all the given fields.
+    The function takes in the data (dictionary) to validate, the error budget of the validation run (returns as soon as
+    the budget is exhausted) and the prefetched lookups (refer to `valcheck.lookups.PrefetchedLookups`), and returns tuple of
+    `(validated_data, errors)`.
+
+    Parameters:
+        - field_info (Dict[str, Field]): Dictionary having keys = field identifiers, and values = bound field instances.
+        - name (str): Name used to identify the generated function (usually the name of the validator class).
+    """
+    namespace: Dict[str, Any] = {
+        "EMPTY": utils.set_as_empty(),
+        "Empty": utils.Empty,
+        "UUID": UUID,
+        "date": date,
+    }
+    body: List[str] = [
+        "data_get = data.get",
+        "errors = []",
+        "num_errors_before = error_budget.num_errors",
+        "validated_data = {}",
+    ]
+    for idx, field in enumerate(field_info.values()):
+        if idx > 0:
+            body += [
+                "if errors and error_budget.update(errors, num_errors_before=num_errors_before):",
+                f"{INDENT}error_budget.mark_as_truncated()",
+                f"{INDENT}return (validated_data, errors)",
+            ]
+        field_name = f"field_{idx}"
+        namespace[field_name] = field
+        namespace[f"{field_name}_validate"] = field.validate
+        namespace[f"{field_name}_converter"] = field.converter_factory
+        namespace[f"{field_name}_default_factory"] = field.default_factory
+        body += _make_field_lines(field, field_name)
+    body += ["return (validated_data, errors)"]
+    function_name = "validate_fields"
+    source = "\n".join([f"def {function_name}(data, error_budget, prefetched_lookups):", *_indent_lines(body, level=1)]) + "\n"
+    filename = f"<valcheck compiled field validator {name}>"
+    exec(compile(source, filename, "exec"), namespace)
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)  # For readable tracebacks
+    compiled_field_validator: CompiledFieldValidator = namespace[function_name]
+    return compiled_field_validator
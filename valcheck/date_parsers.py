@@ -0,0 +1,237 @@
+"""
+Parsers of date-strings and datetime-strings, compiled once per format (used by `DateStringField`, `DatetimeStringField`
+and the related functions in `valcheck.utils`).
+
+The format is compiled into a regex (having one group per directive) along with a converter per group, so that parsing
+a value takes one regex match plus a few int conversions, instead of `strptime()` interpreting the format on every call
+(and `strftime()` being called for the round-trip check of date-strings).
+The compiled regex only accepts the canonical (fixed-width, zero-padded, exact-case) form of each directive, which is
+a subset of what `strptime()` accepts. Values that are not accepted by the compiled regex (or whose components are out of
+range) fall back to `strptime()`, so the results are always the same as those of `strptime()`.
+
+Formats having directives that are not supported by the compiled regex (Eg: `%A`, `%j` or `%Z`) always use `strptime()`.
+Month names (`%B` and `%b`) are taken from the locale that is active when the format is compiled.
+"""
+
+from __future__ import annotations
+
+import calendar
+from datetime import date, datetime, timedelta, timezone
+import functools
+import re
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union
+
+
+# The `strftime()` of some platforms does not zero-pad years < 1000 (Eg: glibc formats year 999 as "999"), in which case
+# such date-strings never pass the round-trip check. The compiled parser leaves them to `strptime()`.
+_MIN_YEAR_OF_FAST_PATH = 1 if date(year=1, month=1, day=1).strftime("%Y") == "0001" else 1000
+
+# Directives that only hold date components (i.e; the ones supported by the compiled parsers of date-strings)
+_DATE_DIRECTIVES = frozenset("YymdBb")
+
+# Defaults of the components that are not in the format (same as the ones used by `strptime()`)
+_DEFAULT_COMPONENTS: Dict[str, Any] = {
+    "year": 1900,
+    "month": 1,
+    "day": 1,
+    "hour": 0,
+    "minute": 0,
+    "second": 0,
+    "microsecond": 0,
+    "tzinfo": None,
+}
+
+
+def _convert_two_digit_year(value: str, /) -> int:
+    """Converts the value of the `%y` directive into the year (same as `strptime()`, i.e; 00-68 => 20xx and 69-99 => 19xx)"""
+    year = int(value)
+    return year + 2000 if year <= 68 else year + 1900
+
+
+def _convert_fraction(value: str, /) -> int:
+    """Converts the value of the `%f` directive (1 to 6 digits) into microseconds"""
+    return int(value.ljust(6, "0"))
+
+
+@functools.lru_cache(maxsize=128)
+def _convert_utc_offset(value: str, /) -> timezone:
+    """Converts the value of the `%z` directive (Eg: "Z", "+05:30" or "-0230") into the timezone"""
+    if value == "Z":
+        return timezone.utc
+    offset = timedelta(hours=int(value[1:3]), minutes=int(value[-2:]))
+    return timezone(-offset if value[0] == "-" else offset)
+
+
+def _make_month_names_directive(month_names: List[str], /) -> Tuple[str, str, Callable[[str], int]]:
+    month_to_number = {name: number for number, name in enumerate(month_names) if name}
+    names = sorted(month_to_number.keys(), key=len, reverse=True)
+    pattern = "(" + "|".join(re.escape(name) for name in names) + ")"
+    return (pattern, "month", month_to_number.__getitem__)
+
+
+def _get_directives() -> Dict[str, Tuple[str, str, Callable[[str], Any]]]:
+    """
+    Returns dictionary having keys = directive characters, and values = tuple of `(pattern, component, converter)`,
+    where `pattern` has exactly one group, `component` is the name of the param of `datetime()`, and `converter`
+    converts the matched string into the value of said param.
+    """
+    return {
+        "Y": (r"([0-9]{4})", "year", int),
+        "y": (r"([0-9]{2})", "year", _convert_two_digit_year),
+        "m": (r"([0-9]{2})", "month", int),
+        "d": (r"([0-9]{2})", "day", int),
+        "H": (r"([0-9]{2})", "hour", int),
+        "M": (r"([0-9]{2})", "minute", int),
+        "S": (r"([0-9]{2})", "second", int),
+        "f": (r"([0-9]{1,6})", "microsecond", _convert_fraction),
+        "z": (r"(Z|[+-][0-9]{2}:?[0-5][0-9])", "tzinfo", _convert_utc_offset),
+        "B": _make_month_names_directive(list(calendar.month_name)),
+        "b": _make_month_names_directive(list(calendar.month_abbr)),
+    }
+
+
+class CompiledFormat:
+    """Class that represents a format compiled into a regex, along with the component and converter of each group"""
+
+    def __init__(self, *, regex: Pattern[str], components: Tuple[str, ...], converters: Tuple[Callable[[str], Any], ...]) -> None:
+        self.regex = regex
+        self.components = components
+        self.converters = converters
+        self.has_year = "year" in components
+
+    def parse_components(self, value: str, /) -> Optional[Dict[str, Any]]:
+        """
+        Returns dictionary having the components (params of `datetime()`) of the given `value`, or `None` if the value
+        is not in the canonical form of the format.
+        Raises `ValueError` if a component is out of range (Eg: an UTC offset of 24 hours or more).
+        """
+        match = self.regex.fullmatch(value)
+        if match is None:
+            return None
+        components = dict(_DEFAULT_COMPONENTS)
+        for component, converter, matched_string in zip(self.components, self.converters, match.groups()):
+            components[component] = converter(matched_string)
+        return components
+
+
+def compile_format(format_: str, /, *, allowed_directives: Optional[frozenset] = None) -> Optional[CompiledFormat]:
+    """
+    Compiles the given strptime-format into a `CompiledFormat`.
+    Returns `None` if the format has a directive that is not supported (or not in `allowed_directives`, if passed), or has
+    more than one directive for the same component.
+    """
+    directives = _get_directives()
+    patterns: List[str] = []
+    components: List[str] = []
+    converters: List[Callable[[str], Any]] = []
+    idx = 0
+    while idx < len(format_):
+        char = format_[idx]
+        if char != "%":
+            patterns.append(re.escape(char))
+            idx += 1
+            continue
+        directive = format_[idx + 1 : idx + 2]
+        idx += 2
+        if directive == "%":
+            patterns.append("%")
+            continue
+        if directive not in directives or (allowed_directives is not None and directive not in allowed_directives):
+            return None
+        pattern, component, converter = directives[directive]
+        if component in components:
+            return None
+        patterns.append(pattern)
+        components.append(component)
+        converters.append(converter)
+    return CompiledFormat(regex=re.compile("".join(patterns)), components=tuple(components), converters=tuple(converters))
+
+
+def _parse_date_string_via_strptime(value: str, format_: str, /) -> Optional[date]:
+    try:
+        date_obj = datetime.strptime(value, format_).date()
+        is_valid = date_obj.strftime(format_) == value
+    except Exception:
+        return None
+    return date_obj if is_valid else None
+
+
+def _parse_datetime_string_via_strptime(value: str, format_: str, /) -> Optional[datetime]:
+    try:
+        return datetime.strptime(value, format_)
+    except Exception:
+        return None
+
+
+class DateStringParser:
+    """Parser of date-strings of a particular format. Use `get_date_string_parser()` to get the (cached) parser of a format"""
+
+    def __init__(self, format_: str, /) -> None:
+        assert isinstance(format_, str), "Param `format_` must be of type 'str'"
+        self.format_ = format_
+        self._compiled_format = compile_format(format_, allowed_directives=_DATE_DIRECTIVES)
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        return (self.__class__, (self.format_,))
+
+    @property
+    def has_fast_path(self) -> bool:
+        return self._compiled_format is not None
+
+    def parse(self, value: Union[str, object], /) -> Optional[date]:
+        """Returns the date object if the given `value` is a valid date-string, else `None`"""
+        if not isinstance(value, str):
+            return None
+        if self._compiled_format is not None:
+            components = self._compiled_format.parse_components(value)
+            if components is not None and (
+                not self._compiled_format.has_year or components["year"] >= _MIN_YEAR_OF_FAST_PATH
+            ):
+                try:
+                    return date(components["year"], components["month"], components["day"])
+                except ValueError:
+                    pass
+        return _parse_date_string_via_strptime(value, self.format_)
+
+
+class DatetimeStringParser:
+    """
+    Parser of datetime-strings of a particular format. Use `get_datetime_string_parser()` to get the (cached) parser of a format.
+    """
+
+    def __init__(self, format_: str, /) -> None:
+        assert isinstance(format_, str), "Param `format_` must be of type 'str'"
+        self.format_ = format_
+        self._compiled_format = compile_format(format_)
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        return (self.__class__, (self.format_,))
+
+    @property
+    def has_fast_path(self) -> bool:
+        return self._compiled_format is not None
+
+    def parse(self, value: Union[str, object], /) -> Optional[datetime]:
+        """Returns the datetime object if the given `value` is a valid datetime-string, else `None`"""
+        if not isinstance(value, str):
+            return None
+        if self._compiled_format is not None:
+            try:
+                components = self._compiled_format.parse_components(value)
+                if components is not None:
+                    return datetime(**components)
+            except ValueError:
+                pass
+        return _parse_datetime_string_via_strptime(value, self.format_)
+
+
+@functools.lru_cache(maxsize=256)
+def get_date_string_parser(format_: str, /) -> DateStringParser:
+    """Returns the (cached) parser of date-strings of the given format"""
+    return DateStringParser(format_)
+
+
+@functools.lru_cache(maxsize=256)
+def get_datetime_string_parser(format_: str, /) -> DatetimeStringParser:
+    """Returns the (cached) parser of datetime-strings of the given format"""
+    return DatetimeStringParser(format_)
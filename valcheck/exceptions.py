@@ -51,6 +51,7 @@ class BaseValidationException(Exception):
         Accepted kwargs:
             - include_validator_message (bool)
             - include_field_path (bool)
+            - include_field_path_pointer (bool)
         """
         return {
             "errors": [error.as_dict(**kwargs) for error in self.errors],
@@ -1,34 +1,203 @@
 from __future__ import annotations
 
+import copy
 from datetime import date, datetime, timezone
+import functools
+import inspect
+import math
 import random
-from typing import Any, Callable, Iterable, List, Literal, Optional, Type, Union
+import re
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Literal, Optional, Pattern, Tuple, Type, Union
 import uuid
+import warnings
+
+from valcheck.date_parsers import (
+    DateStringParser,
+    DatetimeStringParser,
+    get_date_string_parser,
+    get_datetime_string_parser,
+)
+from valcheck.lookups import LookupIndex, LookupKey, PrefetchedLookups
+from valcheck.models import Error, ErrorBudget, ErrorMessage
+from valcheck import settings, utils
+
+
+def _assert_valid_value_bounds(min_value: Any, max_value: Any, /) -> None:
+    for param_name, value in [("min_value", min_value), ("max_value", max_value)]:
+        assert value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)), (
+            f"Param `{param_name}` must be a number (either integer or float)"
+        )
+        assert not (isinstance(value, float) and math.isnan(value)), f"Param `{param_name}` must not be NaN"
+    if min_value is not None and max_value is not None:
+        assert min_value <= max_value, "Param `min_value` must be <= `max_value`"
+
+
+def _assert_valid_length_bounds(min_length: Any, max_length: Any, /) -> None:
+    for param_name, value in [("min_length", min_length), ("max_length", max_length)]:
+        assert value is None or (isinstance(value, int) and not isinstance(value, bool) and value >= 0), (
+            f"Param `{param_name}` must be an integer >= 0"
+        )
+    if min_length is not None and max_length is not None:
+        assert min_length <= max_length, "Param `min_length` must be <= `max_length`"
+
+
+def _fit_sample_value_to_bounds(value: Any, /, *, min_value: Any = None, max_value: Any = None) -> Any:
+    if min_value is not None and value < min_value:
+        return min_value
+    if max_value is not None and value > max_value:
+        return max_value
+    return value
+
+
+def _make_choice_set(choices: Iterable[Any], /) -> Optional[FrozenSet[Any]]:
+    """Returns the choices as a frozenset (for O(1) membership checks), or `None` if any of the choices is unhashable"""
+    try:
+        return frozenset(choices)
+    except TypeError:
+        return None
+
+
+def _is_choice(value: Any, /, *, choices: Iterable[Any], choice_set: Optional[FrozenSet[Any]]) -> bool:
+    """
+    Checks if the given `value` is one of the `choices`.
+    Looks up the `choice_set` if available, and falls back to scanning the `choices` for unhashable values.
+    """
+    if choice_set is not None:
+        try:
+            return value in choice_set
+        except TypeError:
+            pass
+    return value in choices
+
+
+# Methods of `Field` whose logic is inlined into the fast paths (the `Field.is_valid_entire_field()` predicate, and the code
+# generated by `valcheck.compiler`). Fields whose class overrides any of these methods are checked via their
+# `validate_entire_field()` method instead.
+_INLINED_FIELD_METHODS = (
+    "validate_entire_field",
+    "_convert_field_value_if_needed",
+    "_can_be_set_to_null",
+    "_cannot_be_set_to_null",
+)
+
+
+def _overrides_inlined_field_methods(field_class: Type[Field], /) -> bool:
+    return any(
+        getattr(field_class, method_name) is not getattr(Field, method_name)
+        for method_name in _INLINED_FIELD_METHODS
+    )
+
+
+def _is_legacy_validate_method(method: Callable, /) -> bool:
+    """
+    Checks if the given `validate()` method has the legacy signature, i.e; `validate(self) -> List[Error]`, wherein the
+    value is read from (and the converted value is written to) the `field_value` attribute of the field.
+    """
+    try:
+        parameters = list(inspect.signature(method).parameters.values())[1:]
+    except (TypeError, ValueError):
+        return False
+    positional_kinds = (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        inspect.Parameter.VAR_POSITIONAL,
+    )
+    return not any(parameter.kind in positional_kinds for parameter in parameters)
+
+
+def _get_legacy_field_value(field: Field) -> Union[Any, utils.Empty]:
+    return field.__dict__.get("_legacy_field_value", utils.set_as_empty())
+
+
+def _set_legacy_field_value(field: Field, value: Union[Any, utils.Empty]) -> None:
+    field.__dict__["_legacy_field_value"] = value
+
+
+def _make_legacy_parent_class(legacy_field_class: Type[Field], /) -> Type[Field]:
+    """
+    Returns a class having the same parent classes as the given legacy field class, whose `validate()` method can also be
+    called without params (as the legacy `validate(self)` methods call `super().validate()`). Said method validates the
+    `field_value` via the `validate()` method of the parent classes, and writes the validated value back to `field_value`.
+    """
+    def validate(self: Field, /, *args: Any, **kwargs: Any) -> Union[Tuple[Any, List[Error]], List[Error]]:
+        if args:
+            return super(legacy_parent_class, self).validate(*args, **kwargs)
+        field_value, errors = super(legacy_parent_class, self).validate(self.field_value, **kwargs)
+        if not errors:
+            self.field_value = field_value
+        return errors
+
+    legacy_parent_class = type(
+        f"_LegacyParentOf{legacy_field_class.__name__}",
+        legacy_field_class.__bases__,
+        {"validate": validate, "__module__": legacy_field_class.__module__},
+    )
+    return legacy_parent_class
+
+
+def _adapt_legacy_validate_method(
+        legacy_field_class: Type[Field],
+        legacy_validate: Callable[[Field], List[Error]],
+        /,
+    ) -> Callable[..., Tuple[Any, List[Error]]]:
+    """
+    Adapts a legacy `validate(self) -> List[Error]` method (of the given legacy field class) to the current signature of
+    `Field.validate()`. The legacy method is called on a (shallow) copy of the field having the `field_value` set, so that the
+    field itself stays stateless. The `field_value` of said copy (which the legacy method may have converted) is the validated value.
+
+    Said copy is an instance of a sub-class of the field's class, wherein the parent classes of the legacy field class come
+    after the class returned by `_make_legacy_parent_class()` (in the MRO), so that `super().validate()` can be called without params.
+    """
+    legacy_parent_class = _make_legacy_parent_class(legacy_field_class)
+    copy_classes = {}  # Maps the class of the field to the class of its copy
+
+    @functools.wraps(legacy_validate)
+    def validate(self: Field, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        field_class = self.__class__
+        copy_class = copy_classes.get(field_class)
+        if copy_class is None:
+            copy_class = type(field_class.__name__, (field_class, legacy_parent_class), {"__module__": field_class.__module__})
+            copy_classes[field_class] = copy_class
+        field = copy.copy(self)
+        field.__class__ = copy_class
+        field.field_value = field_value
+        errors = legacy_validate(field)
+        if errors:
+            return (None, errors)
+        return (field.field_value, [])
 
-from valcheck.models import Error
-from valcheck import utils
+    return validate
 
 
 class ValidatedField:
-    """Class that represents a validated field"""
+    """
+    Class that represents a validated field.
+    Holds the per-run state (the field value and errors) of a validation, since the `valcheck.fields.Field` itself is stateless.
+    """
+
+    __slots__ = ("_field", "_field_value", "_errors")
 
     def __init__(
             self,
             *,
             field: Field,
+            field_value: Union[Any, utils.Empty],
             errors: List[Error],
         ) -> None:
-        assert isinstance(field, Field), "Param `field` must be of type `valcheck.fields.Field`"
-        assert utils.is_list_of_instances_of_type(errors, type_=Error, allow_empty=True), (
-            "Param `errors` must be a list where each item is of type `valcheck.models.Error`"
-        )
+        if settings.CHECK_INTERNAL_INVARIANTS:
+            assert isinstance(field, Field), "Param `field` must be of type `valcheck.fields.Field`"
+            assert utils.is_list_of_instances_of_type(errors, type_=Error, allow_empty=True), (
+                "Param `errors` must be a list where each item is of type `valcheck.models.Error`"
+            )
         self._field = field
+        self._field_value = field_value
         self._errors = errors
 
     def __str__(self) -> str:
         kwargs_list = [
             f"is_valid={not bool(self.errors)}",
             f"field_identifier={utils.wrap_in_quotes_if_string(self.field.field_identifier)}",
+            f"field_value={utils.wrap_in_quotes_if_string(self.field_value)}",
             f"field={self.field}",
         ]
         kwargs_string = "(" + ", ".join(kwargs_list) + ")"
@@ -40,23 +209,57 @@ class ValidatedField:
 
     @field.setter
     def field(self, value: Field) -> None:
-        assert isinstance(value, Field), "Param `field` must be of type `valcheck.fields.Field`"
+        if settings.CHECK_INTERNAL_INVARIANTS:
+            assert isinstance(value, Field), "Param `field` must be of type `valcheck.fields.Field`"
         self._field = value
 
+    @property
+    def field_value(self) -> Union[Any, utils.Empty]:
+        return self._field_value
+
+    @field_value.setter
+    def field_value(self, value: Union[Any, utils.Empty]) -> None:
+        self._field_value = value
+
     @property
     def errors(self) -> List[Error]:
         return self._errors
 
     @errors.setter
     def errors(self, value: List[Error]) -> None:
-        assert utils.is_list_of_instances_of_type(value, type_=Error, allow_empty=True), (
-            "Param `errors` must be a list where each item is of type `valcheck.models.Error`"
-        )
+        if settings.CHECK_INTERNAL_INVARIANTS:
+            assert utils.is_list_of_instances_of_type(value, type_=Error, allow_empty=True), (
+                "Param `errors` must be a list where each item is of type `valcheck.models.Error`"
+            )
         self._errors = value
 
 
 class Field:
-    """Class that represents a field (that needs to be validated)"""
+    """
+    Class that represents a field (that needs to be validated).
+
+    A field is a stateless specification, i.e; it does not hold the value being validated. The value is passed into
+    the `validate_entire_field()` and `validate()` methods instead, so a single field instance can be shared by all
+    the instances of a validator (and across threads).
+    """
+
+    __slots__ = (
+        "_field_identifier",
+        "source",
+        "target",
+        "required",
+        "nullable",
+        "default_factory",
+        "converter_factory",
+        "sample_value_factory",
+        "validators",
+        "error",
+        "type_alias",
+        "_num_checked_validators",
+    )
+
+    # True if the class overrides any of the methods whose logic is inlined into the fast paths (set for each sub-class)
+    _overrides_inlined_methods: bool = False
 
     def __init__(
             self,
@@ -116,7 +319,6 @@ class Field:
         )
 
         self._field_identifier = utils.set_as_empty()
-        self._field_value = utils.set_as_empty()
         self.source = source
         self.target = target
         self.required = required
@@ -125,9 +327,35 @@ class Field:
         self.converter_factory = converter_factory
         self.sample_value_factory = sample_value_factory
         self.validators = validators or []
+        self._num_checked_validators = 0  # Count of the custom validators (from the start) whose return type was checked
         self.error = error or Error()
         self.type_alias = type_alias or self.__class__.__name__
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Sub-classes written against the legacy `validate(self) -> List[Error]` signature (which read the value from the
+        # `field_value` attribute) are adapted to the current signature, with a deprecation warning.
+        if "validate" in cls.__dict__ and _is_legacy_validate_method(cls.__dict__["validate"]):
+            assert cls.__dictoffset__ != 0, (
+                f"'{cls.__name__}' overrides `validate()` with the legacy signature, so it must not declare `__slots__`"
+            )
+            warnings.warn(
+                (
+                    f"'{cls.__name__}.validate(self)' uses the legacy signature, and is adapted to the current one. Update it"
+                    " to `validate(self, field_value, /, **kwargs) -> Tuple[Any, List[Error]]`, which returns tuple of"
+                    " `(validated_value, errors)` instead of reading/writing the `field_value` attribute."
+                ),
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            cls.validate = _adapt_legacy_validate_method(cls, cls.__dict__["validate"])
+            cls.field_value = property(_get_legacy_field_value, _set_legacy_field_value)
+        # A sub-class that overrides `validate()` without overriding `is_valid_value()` must not inherit the
+        # predicate of its parent class, since it could diverge from its own `validate()` method.
+        if "validate" in cls.__dict__ and "is_valid_value" not in cls.__dict__:
+            cls.is_valid_value = Field.is_valid_value
+        cls._overrides_inlined_methods = _overrides_inlined_field_methods(cls)
+
     def copy(self) -> Field:
         """Returns deep-copy of current `Field` object"""
         return utils.make_deep_copy(self)
@@ -135,7 +363,6 @@ class Field:
     def __str__(self) -> str:
         kwargs_list = [
             f"field_identifier={utils.wrap_in_quotes_if_string(self.field_identifier)}",
-            f"field_value={utils.wrap_in_quotes_if_string(self.field_value)}",
             f"source={utils.wrap_in_quotes_if_string(self.source)}",
             f"target={utils.wrap_in_quotes_if_string(self.target)}",
             f"required={self.required}",
@@ -154,69 +381,143 @@ class Field:
         assert isinstance(value, str), "Param `field_identifier` must be of type 'str'"
         self._field_identifier = value
 
-    @property
-    def field_value(self) -> Union[Any, utils.Empty]:
-        return self._field_value
-
-    @field_value.setter
-    def field_value(self, value: Union[Any, utils.Empty]) -> None:
-        self._field_value = value
+    def _can_be_set_to_null(self, field_value: Union[Any, utils.Empty], /) -> bool:
+        return self.nullable and field_value is None
 
-    def _can_be_set_to_null(self) -> bool:
-        return self.nullable and self.field_value is None
+    def _cannot_be_set_to_null(self, field_value: Union[Any, utils.Empty], /) -> bool:
+        return not self.nullable and field_value is None
 
-    def _cannot_be_set_to_null(self) -> bool:
-        return not self.nullable and self.field_value is None
+    def _get_failed_custom_validator_index(self, field_value: Any, /) -> Optional[int]:
+        """
+        Calls the custom validators in order, and returns the index of the first one that fails (stops at said validator).
+        Returns `None` if all the custom validators pass.
+        The return type of each custom validator is checked once (the first time it is called), only if assertions are
+        enabled (i.e; not with `python -O`), and production mode is disabled (refer to `valcheck.settings`).
+        """
+        if self._num_checked_validators < len(self.validators) and settings.CHECK_INTERNAL_INVARIANTS:
+            return self._get_failed_custom_validator_index_and_check_return_types(field_value)
+        for idx, validator in enumerate(self.validators):
+            if not validator(field_value):
+                return idx
+        return None
 
-    def _has_valid_custom_validators(self) -> bool:
-        if not self.validators:
-            return True
-        validator_return_values = [validator(self.field_value) for validator in self.validators]
-        for return_value in validator_return_values:
+    def _get_failed_custom_validator_index_and_check_return_types(self, field_value: Any, /) -> Optional[int]:
+        """Same as `_get_failed_custom_validator_index()`, but also checks the return type of the validators that are called"""
+        for idx, validator in enumerate(self.validators):
+            return_value = validator(field_value)
             assert isinstance(return_value, bool), (
                 f"Expected the return type of `validators` to be 'bool', but got '{type(return_value).__name__}'"
             )
-        return all(validator_return_values)
+            if idx >= self._num_checked_validators:
+                self._num_checked_validators = idx + 1
+            if not return_value:
+                return idx
+        return None
+
+    def _has_valid_custom_validators(self, field_value: Any, /) -> bool:
+        return not self.validators or self._get_failed_custom_validator_index(field_value) is None
 
-    def _convert_field_value_if_needed(self) -> Any:
+    def _make_custom_validation_failed_suffix(self, validator_index: int, /) -> str:
+        """Returns the error message suffix that names the custom validator (at the given index) that failed"""
+        validator = self.validators[validator_index]
+        validator_name = getattr(validator, "__name__", validator.__class__.__name__)
+        return f"Custom validations failed (validator #{validator_index + 1}: {validator_name})"
+
+    def _convert_field_value_if_needed(self, field_value: Any, /) -> Any:
         """Returns the converted field value if a `converter_factory` is present; otherwise returns the same field value"""
-        return self.converter_factory(self.field_value) if self.converter_factory else self.field_value
+        return self.converter_factory(field_value) if self.converter_factory else field_value
 
-    def validate(self) -> List[Error]:
-        """Returns list of errors (each of type `valcheck.models.Error`)"""
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        """
+        Validates the given `field_value`.
+        Returns tuple of `(validated_value, errors)`, where errors is a list of errors (each of type `valcheck.models.Error`).
+        If the `field_value` is not valid, the `validated_value` is always `None`.
+
+        Sub-classes that override this method with the legacy signature, i.e; `validate(self) -> List[Error]` (reading the
+        value from `self.field_value`), are still supported, but emit a `DeprecationWarning` when they are defined. Said legacy
+        methods can call `super().validate()` without params, which validates (and sets the validated value to) `self.field_value`.
+
+        Accepted kwargs (used by the fields that validate nested data, and the lookup fields):
+            - error_budget (ErrorBudget): The error budget of the validation run (refer to `valcheck.models.ErrorBudget`).
+            - prefetched_lookups (PrefetchedLookups): The lookups prefetched for the batch of records being validated
+            (refer to `valcheck.lookups.PrefetchedLookups`).
+        """
         raise NotImplementedError()
 
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        """
+        Returns True if the given `field_value` would be accepted by the `validate()` method, else False.
+        Fields override this with a predicate that does not build any errors; the default implementation calls `validate()`.
+
+        Accepted kwargs:
+            - prefetched_lookups (PrefetchedLookups): The lookups prefetched for the batch of records being validated
+            (refer to `valcheck.lookups.PrefetchedLookups`).
+        """
+        _, errors = self.validate(field_value, error_budget=ErrorBudget(max_errors=1), **kwargs)
+        return not errors
+
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         """Returns a sample value for the field"""
         return None
 
-    def validate_entire_field(self) -> ValidatedField:
-        if utils.is_empty(self.field_value) and not self.required and self.default_factory:
-            self.field_value = self.default_factory()
-        validated_field = ValidatedField(field=self, errors=[])
-        if utils.is_empty(self.field_value) and not self.required and not self.default_factory:
+    def validate_entire_field(self, field_value: Union[Any, utils.Empty], /, **kwargs: Any) -> ValidatedField:
+        """
+        Validates the given `field_value` (which must be `valcheck.utils.Empty` if the field is missing), and
+        returns the validated field. The kwargs are passed to the `validate()` method.
+        """
+        if utils.is_empty(field_value) and not self.required and self.default_factory:
+            field_value = self.default_factory()
+        validated_field = ValidatedField(field=self, field_value=field_value, errors=[])
+        if utils.is_empty(field_value) and not self.required and not self.default_factory:
             return validated_field
-        if self._can_be_set_to_null():
-            validated_field.field.field_value = self._convert_field_value_if_needed()
+        if self._can_be_set_to_null(field_value):
+            validated_field._field_value = self._convert_field_value_if_needed(field_value)
             return validated_field
-        if utils.is_empty(self.field_value) and self.required:
-            validated_field.errors += [self.create_missing_field_error()]
+        if utils.is_empty(field_value) and self.required:
+            validated_field._errors.append(self.create_missing_field_error())
             return validated_field
-        if self._cannot_be_set_to_null():
+        if self._cannot_be_set_to_null(field_value):
             suffix = "Cannot be null"
-            validated_field.errors += [self.create_invalid_field_error(suffix=suffix)]
+            validated_field._errors.append(self.create_invalid_field_error(suffix=suffix))
             return validated_field
-        errors = self.validate()
+        field_value, errors = self.validate(field_value, **kwargs)
         if errors:
-            validated_field.errors += errors
+            validated_field._errors.extend(errors)
             return validated_field
-        if not self._has_valid_custom_validators():
-            suffix = "Custom validations failed"
-            validated_field.errors += [self.create_invalid_field_error(suffix=suffix)]
+        failed_validator_index = self._get_failed_custom_validator_index(field_value)
+        if failed_validator_index is not None:
+            suffix = self._make_custom_validation_failed_suffix(failed_validator_index)
+            validated_field._errors.append(self.create_invalid_field_error(suffix=suffix))
             return validated_field
-        validated_field.field.field_value = self._convert_field_value_if_needed()
+        validated_field._field_value = self._convert_field_value_if_needed(field_value)
         return validated_field
 
+    def is_valid_entire_field(self, field_value: Union[Any, utils.Empty], /, **kwargs: Any) -> bool:
+        """
+        Returns True if the given `field_value` (which must be `valcheck.utils.Empty` if the field is missing) is valid, else False.
+        Follows the same checks as the `validate_entire_field()` method, but does not call the `converter_factory`.
+        Fields without custom validators are checked via the `is_valid_value()` predicate, which does not build any errors.
+        Fields having custom validators are checked via the `validate()` method, since the custom validators take in the value
+        returned by it (which could be converted, Eg: a date-string into a date object if `to_date_obj=True`).
+        Fields whose class overrides `validate_entire_field()`, `_convert_field_value_if_needed()`, `_can_be_set_to_null()`
+        or `_cannot_be_set_to_null()` are checked via the `validate_entire_field()` method.
+        The kwargs are passed to said methods (refer to `is_valid_value()` for the accepted kwargs).
+        """
+        if self._overrides_inlined_methods:
+            return not self.validate_entire_field(field_value, error_budget=ErrorBudget(max_errors=1), **kwargs)._errors
+        if utils.is_empty(field_value):
+            if self.required:
+                return False
+            if not self.default_factory:
+                return True
+            field_value = self.default_factory()
+        if field_value is None:
+            return self.nullable
+        if not self.validators:
+            return self.is_valid_value(field_value, **kwargs)
+        validated_value, errors = self.validate(field_value, error_budget=ErrorBudget(max_errors=1), **kwargs)
+        return not errors and self._has_valid_custom_validators(validated_value)
+
     def invalid_field_error_message(
             self,
             *,
@@ -243,10 +544,16 @@ class Field:
             sep=" || ",
         )
 
-    def create_error_instance(self, *, validator_message: str) -> Error:
-        """Creates and returns a new `valcheck.models.Error` instance for the field"""
-        error_copy = self.error.copy()
-        error_copy.validator_message = validator_message
+    def create_error_instance(self, *, validator_message: Union[str, ErrorMessage]) -> Error:
+        """
+        Creates and returns a new `valcheck.models.Error` instance for the field.
+        The `validator_message` can be an `ErrorMessage`, in which case it is rendered only when read.
+        """
+        error_copy = self.error.derive()
+        if isinstance(validator_message, ErrorMessage):
+            error_copy.set_message_template(validator_message)
+        else:
+            error_copy.validator_message = validator_message
         error_copy.append_to_field_path(self.source)
         return error_copy
 
@@ -254,27 +561,48 @@ class Field:
             self,
             *,
             prefix: Optional[str] = None,
-            suffix: Optional[str] = None,
+            suffix: Optional[Union[str, Callable[[], str]]] = None,
         ) -> Error:
-        validator_message = self.invalid_field_error_message(prefix=prefix, suffix=suffix)
-        return self.create_error_instance(validator_message=validator_message)
+        """
+        Returns the error for an invalid field. The `suffix` can be a callable that returns the suffix, in which case
+        it is called only when the `validator_message` of the error is read.
+        """
+        message_template = ErrorMessage(
+            kind="Invalid",
+            field_type=self.type_alias,
+            field_name=self.source,
+            prefix=prefix,
+            suffix=suffix,
+        )
+        return self.create_error_instance(validator_message=message_template)
 
     def create_missing_field_error(
             self,
             *,
             prefix: Optional[str] = None,
-            suffix: Optional[str] = None,
+            suffix: Optional[Union[str, Callable[[], str]]] = None,
         ) -> Error:
-        validator_message = self.missing_field_error_message(prefix=prefix, suffix=suffix)
-        return self.create_error_instance(validator_message=validator_message)
+        message_template = ErrorMessage(
+            kind="Missing",
+            field_type=self.type_alias,
+            field_name=self.source,
+            prefix=prefix,
+            suffix=suffix,
+        )
+        return self.create_error_instance(validator_message=message_template)
 
 
 class AnyField(Field):
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         super(AnyField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        return []
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        return (field_value, [])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return True
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -289,13 +617,18 @@ class AnyField(Field):
 
 
 class BooleanField(Field):
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         super(BooleanField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if isinstance(self.field_value, bool):
-            return []
-        return [self.create_invalid_field_error()]
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if isinstance(field_value, bool):
+            return (field_value, [])
+        return (None, [self.create_invalid_field_error()])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return isinstance(field_value, bool)
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -305,25 +638,70 @@ class BooleanField(Field):
 
 
 class StringField(Field):
-    def __init__(self, *, allow_empty: Optional[bool] = True, **kwargs: Any) -> None:
+    __slots__ = ("allow_empty", "min_length", "max_length", "pattern")
+
+    def __init__(
+            self,
+            *,
+            allow_empty: Optional[bool] = True,
+            min_length: Optional[int] = None,
+            max_length: Optional[int] = None,
+            pattern: Optional[Union[str, Pattern[str]]] = None,
+            **kwargs: Any,
+        ) -> None:
+        """
+        Parameters:
+            - allow_empty (bool): True if the string can be empty, else False. Default: True
+            - min_length (int): Minimum length of the string (inclusive).
+            - max_length (int): Maximum length of the string (inclusive).
+            - pattern (str | compiled regex): Regex pattern that the entire string must match.
+        """
         assert isinstance(allow_empty, bool), "Param `allow_empty` must be of type 'bool'"
+        _assert_valid_length_bounds(min_length, max_length)
+        assert pattern is None or isinstance(pattern, (str, re.Pattern)), (
+            "Param `pattern` must be a string or a compiled regex pattern"
+        )
         self.allow_empty = allow_empty
+        self.min_length = min_length
+        self.max_length = max_length
+        self.pattern: Optional[Pattern[str]] = re.compile(pattern) if isinstance(pattern, str) else pattern
         super(StringField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if not utils.is_valid_object_of_type(self.field_value, type_=str):
-            return [self.create_invalid_field_error()]
-        if not utils.is_empty_value_allowed(self.field_value, allow_empty=self.allow_empty):
-            return [self.create_invalid_field_error(suffix="Must be a non-empty string")]
-        return []
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if not utils.is_valid_object_of_type(field_value, type_=str):
+            return (None, [self.create_invalid_field_error()])
+        if not utils.is_empty_value_allowed(field_value, allow_empty=self.allow_empty):
+            return (None, [self.create_invalid_field_error(suffix="Must be a non-empty string")])
+        if not utils.is_within_bounds(len(field_value), min_value=self.min_length, max_value=self.max_length):
+            suffix = utils.make_bounds_message(min_value=self.min_length, max_value=self.max_length, subject="Length")
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
+        if self.pattern is not None and self.pattern.fullmatch(field_value) is None:
+            suffix = f"Must match the pattern '{self.pattern.pattern}'"
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
+        return (field_value, [])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return (
+            isinstance(field_value, str)
+            and utils.is_empty_value_allowed(field_value, allow_empty=self.allow_empty)
+            and utils.is_within_bounds(len(field_value), min_value=self.min_length, max_value=self.max_length)
+            and (self.pattern is None or self.pattern.fullmatch(field_value) is not None)
+        )
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
             return self.sample_value_factory()
-        return "some string"
+        sample = "some string"
+        if self.min_length is not None and len(sample) < self.min_length:
+            sample = sample.ljust(self.min_length, "x")
+        if self.max_length is not None and len(sample) > self.max_length:
+            sample = sample[:self.max_length]
+        return sample
 
 
 class JsonStringField(Field):
+    __slots__ = ("which", "to_python_obj")
+
     def __init__(
             self,
             *,
@@ -338,30 +716,30 @@ class JsonStringField(Field):
         self.to_python_obj = to_python_obj
         super(JsonStringField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
         error_message = ""
         if self.which == "JSON_ARRAY":
-            parsed_obj, is_valid = utils.validate_json_array(self.field_value)
+            parsed_obj, is_valid = utils.validate_json_array(field_value)
             if not is_valid:
                 error_message = "Must be a valid JSON array"
         elif self.which == "JSON_OBJECT":
-            parsed_obj, is_valid = utils.validate_json_object(self.field_value)
+            parsed_obj, is_valid = utils.validate_json_object(field_value)
             if not is_valid:
                 error_message = "Must be a valid JSON object"
         elif self.which == "JSON_OBJECT_OR_ARRAY":
-            parsed_obj, is_valid = utils.validate_json_object_or_array(self.field_value)
+            parsed_obj, is_valid = utils.validate_json_object_or_array(field_value)
             if not is_valid:
                 error_message = "Must be a valid JSON object or JSON array"
         else:
-            parsed_obj, is_valid = utils.validate_json_string(self.field_value)
+            parsed_obj, is_valid = utils.validate_json_string(field_value)
             if not is_valid:
                 error_message = "Must be a valid JSON string"
 
         if error_message:
-            return [self.create_invalid_field_error(suffix=error_message)]
+            return (None, [self.create_invalid_field_error(suffix=error_message)])
         if self.to_python_obj:
-            self.field_value = parsed_obj
-        return []
+            field_value = parsed_obj
+        return (field_value, [])
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -372,13 +750,18 @@ class JsonStringField(Field):
 
 
 class EmailIdStringField(Field):
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         super(EmailIdStringField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if utils.is_valid_email_id_string(self.field_value):
-            return []
-        return [self.create_invalid_field_error()]
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if utils.is_valid_email_id_string(field_value):
+            return (field_value, [])
+        return (None, [self.create_invalid_field_error()])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return utils.is_valid_email_id_string(field_value)
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -387,19 +770,24 @@ class EmailIdStringField(Field):
 
 
 class UuidStringField(Field):
+    __slots__ = ("to_uuid_obj",)
+
     def __init__(self, *, to_uuid_obj: Optional[bool] = False, **kwargs: Any) -> None:
         assert isinstance(to_uuid_obj, bool), "Param `to_uuid_obj` must be of type 'bool'"
         self.to_uuid_obj = to_uuid_obj
         super(UuidStringField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        uuid_obj, is_valid = utils.validate_uuid_string(self.field_value)
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        uuid_obj, is_valid = utils.validate_uuid_string(field_value)
         if not is_valid:
             suffix = "Must be a valid UUID string"
-            return [self.create_invalid_field_error(suffix=suffix)]
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
         if self.to_uuid_obj and uuid_obj is not None:
-            self.field_value = uuid_obj
-        return []
+            field_value = uuid_obj
+        return (field_value, [])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return utils.is_valid_uuid_string(field_value)
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -408,13 +796,18 @@ class UuidStringField(Field):
 
 
 class UuidField(Field):
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         super(UuidField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if isinstance(self.field_value, uuid.UUID):
-            return []
-        return [self.create_invalid_field_error()]
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if isinstance(field_value, uuid.UUID):
+            return (field_value, [])
+        return (None, [self.create_invalid_field_error()])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return isinstance(field_value, uuid.UUID)
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -423,21 +816,37 @@ class UuidField(Field):
 
 
 class DateStringField(Field):
+    __slots__ = ("to_date_obj", "_format", "_date_parser")
+
     def __init__(self, *, format_: Optional[str] = "%Y-%m-%d", to_date_obj: Optional[bool] = False, **kwargs: Any) -> None:
-        assert isinstance(format_, str), "Param `format_` must be of type 'str'"
         assert isinstance(to_date_obj, bool), "Param `to_date_obj` must be of type 'bool'"
         self.format_ = format_
         self.to_date_obj = to_date_obj
         super(DateStringField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        date_obj, is_valid = utils.validate_date_string(self.field_value, self.format_)
-        if not is_valid:
-            suffix = f"Must be a valid date-string of format '{self.format_}'. Eg: '{self.sample_value()}'"
-            return [self.create_invalid_field_error(suffix=suffix)]
-        if self.to_date_obj and date_obj is not None:
-            self.field_value = date_obj
-        return []
+    @property
+    def format_(self) -> str:
+        return self._format
+
+    @format_.setter
+    def format_(self, value: str) -> None:
+        assert isinstance(value, str), "Param `format_` must be of type 'str'"
+        self._format = value
+        self._date_parser: DateStringParser = get_date_string_parser(value)
+
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        date_obj = self._date_parser.parse(field_value)
+        if date_obj is None:
+            return (None, [self.create_invalid_field_error(suffix=self._make_invalid_date_string_suffix)])
+        if self.to_date_obj:
+            field_value = date_obj
+        return (field_value, [])
+
+    def _make_invalid_date_string_suffix(self) -> str:
+        return f"Must be a valid date-string of format '{self.format_}'. Eg: '{self.sample_value()}'"
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return self._date_parser.parse(field_value) is not None
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -446,13 +855,18 @@ class DateStringField(Field):
 
 
 class DateField(Field):
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         super(DateField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if isinstance(self.field_value, date) and self.field_value.__class__ is date:
-            return []
-        return [self.create_invalid_field_error()]
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if isinstance(field_value, date) and field_value.__class__ is date:
+            return (field_value, [])
+        return (None, [self.create_invalid_field_error()])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return field_value.__class__ is date
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -461,6 +875,8 @@ class DateField(Field):
 
 
 class DatetimeStringField(Field):
+    __slots__ = ("to_datetime_obj", "allowed_tz_names", "_format", "_datetime_parser")
+
     def __init__(
             self,
             *,
@@ -469,7 +885,6 @@ class DatetimeStringField(Field):
             allowed_tz_names: Optional[List[str]] = None,
             **kwargs: Any,
         ) -> None:
-        assert isinstance(format_, str), "Param `format_` must be of type 'str'"
         assert isinstance(to_datetime_obj, bool), "Param `to_datetime_obj` must be of type 'bool'"
         assert allowed_tz_names is None or isinstance(allowed_tz_names, list), "Param `allowed_tz_names` must be of type 'list'"
         self.format_ = format_
@@ -477,29 +892,40 @@ class DatetimeStringField(Field):
         self.allowed_tz_names = allowed_tz_names
         super(DatetimeStringField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        datetime_obj, is_valid = utils.validate_datetime_string(self.field_value, self.format_)
-        if not is_valid or datetime_obj is None:
-            suffix = (
-                f"Must be a valid datetime-string of format '{self.format_}'."
-                f" Eg: '{self.sample_value()}'."
-            )
-            return [self.create_invalid_field_error(suffix=suffix)]
+    @property
+    def format_(self) -> str:
+        return self._format
+
+    @format_.setter
+    def format_(self, value: str) -> None:
+        assert isinstance(value, str), "Param `format_` must be of type 'str'"
+        self._format = value
+        self._datetime_parser: DatetimeStringParser = get_datetime_string_parser(value)
+
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        datetime_obj = self._datetime_parser.parse(field_value)
+        if datetime_obj is None:
+            return (None, [self.create_invalid_field_error(suffix=self._make_invalid_datetime_string_suffix)])
         if self.allowed_tz_names:
             assert utils.is_timezone_aware(datetime_obj), (
                 f"'{self.__class__.__name__}' has param `format_` set to '{self.format_}' which is not timezone-aware."
                 " Therefore the param `allowed_tz_names` must not be passed."
             )
             if not utils.is_datetime_of_timezone(datetime_obj, allowed_tz_names=self.allowed_tz_names):
-                suffix = (
-                    f"Must be a valid datetime-string of format '{self.format_}'."
-                    f" Must be of one of the following timezones [{' | '.join(self.allowed_tz_names)}]."
-                    f" Eg: '{self.sample_value()}'."
-                )
-                return [self.create_invalid_field_error(suffix=suffix)]
+                return (None, [self.create_invalid_field_error(suffix=self._make_invalid_timezone_suffix)])
         if self.to_datetime_obj and datetime_obj is not None:
-            self.field_value = datetime_obj
-        return []
+            field_value = datetime_obj
+        return (field_value, [])
+
+    def _make_invalid_datetime_string_suffix(self) -> str:
+        return f"Must be a valid datetime-string of format '{self.format_}'. Eg: '{self.sample_value()}'."
+
+    def _make_invalid_timezone_suffix(self) -> str:
+        return (
+            f"Must be a valid datetime-string of format '{self.format_}'."
+            f" Must be of one of the following timezones [{' | '.join(self.allowed_tz_names)}]."
+            f" Eg: '{self.sample_value()}'."
+        )
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -522,6 +948,8 @@ class DatetimeStringField(Field):
 
 
 class DatetimeField(Field):
+    __slots__ = ("timezone_aware", "allowed_tz_names")
+
     def __init__(
             self,
             *,
@@ -537,26 +965,26 @@ class DatetimeField(Field):
         self.allowed_tz_names = allowed_tz_names
         super(DatetimeField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
         if not (
-            isinstance(self.field_value, datetime)
-            and self.field_value.__class__ is datetime
+            isinstance(field_value, datetime)
+            and field_value.__class__ is datetime
         ):
             suffix = "Invalid data-type"
-            return [self.create_invalid_field_error(suffix=suffix)]
-        if not (self.field_value.tzinfo is not None if self.timezone_aware else self.field_value.tzinfo is None):
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
+        if not (field_value.tzinfo is not None if self.timezone_aware else field_value.tzinfo is None):
             suffix = (
                 "Invalid timezone awareness/naivety."
                 f" Expected a {'timezone-aware' if self.timezone_aware else 'timezone-naive'} datetime object."
             )
-            return [self.create_invalid_field_error(suffix=suffix)]
-        if self.allowed_tz_names and not utils.is_datetime_of_timezone(self.field_value, allowed_tz_names=self.allowed_tz_names):
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
+        if self.allowed_tz_names and not utils.is_datetime_of_timezone(field_value, allowed_tz_names=self.allowed_tz_names):
             suffix = (
                 "Invalid timezone."
                 f" Must be of one of the following timezones [{' | '.join(self.allowed_tz_names)}]."
             )
-            return [self.create_invalid_field_error(suffix=suffix)]
-        return []
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
+        return (field_value, [])
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -578,16 +1006,30 @@ class DatetimeField(Field):
 
 
 class ChoiceField(Field):
+    __slots__ = ("_choices", "_choice_set", "_invalid_choice_suffix")
+
     def __init__(self, *, choices: Iterable[Any], **kwargs: Any) -> None:
-        assert utils.is_collection_of_items(choices) and bool(choices), "Param `choices` must be a non-empty iterable"
         self.choices = choices
         super(ChoiceField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if self.field_value in self.choices:
-            return []
-        suffix = f"Must be a valid choice i.e; one of {list(self.choices)}"
-        return [self.create_invalid_field_error(suffix=suffix)]
+    @property
+    def choices(self) -> Iterable[Any]:
+        return self._choices
+
+    @choices.setter
+    def choices(self, value: Iterable[Any]) -> None:
+        assert utils.is_collection_of_items(value) and bool(value), "Param `choices` must be a non-empty iterable"
+        self._choices = value
+        self._choice_set = _make_choice_set(value)
+        self._invalid_choice_suffix = f"Must be a valid choice i.e; one of {list(value)}"
+
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if _is_choice(field_value, choices=self._choices, choice_set=self._choice_set):
+            return (field_value, [])
+        return (None, [self.create_invalid_field_error(suffix=self._invalid_choice_suffix)])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return _is_choice(field_value, choices=self._choices, choice_set=self._choice_set)
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -596,20 +1038,37 @@ class ChoiceField(Field):
 
 
 class MultiChoiceField(Field):
+    __slots__ = ("_choices", "_choice_set", "_invalid_choice_suffix")
+
     def __init__(self, *, choices: Iterable[Any], **kwargs: Any) -> None:
-        assert utils.is_collection_of_items(choices) and bool(choices), "Param `choices` must be a non-empty iterable"
         self.choices = choices
         super(MultiChoiceField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if (
-            utils.is_collection_of_items(self.field_value)
-            and bool(self.field_value)
-            and all([item in self.choices for item in self.field_value])
-        ):
-            return []
-        suffix = f"Must be a valid list of choices i.e; one or more of {list(self.choices)}"
-        return [self.create_invalid_field_error(suffix=suffix)]
+    @property
+    def choices(self) -> Iterable[Any]:
+        return self._choices
+
+    @choices.setter
+    def choices(self, value: Iterable[Any]) -> None:
+        assert utils.is_collection_of_items(value) and bool(value), "Param `choices` must be a non-empty iterable"
+        self._choices = value
+        self._choice_set = _make_choice_set(value)
+        self._invalid_choice_suffix = f"Must be a valid list of choices i.e; one or more of {list(value)}"
+
+    def _is_valid_collection_of_choices(self, field_value: Any, /) -> bool:
+        """Checks if the given `field_value` is a non-empty collection of choices (stops at the first invalid item)"""
+        if not utils.is_collection_of_items(field_value) or not field_value:
+            return False
+        choices, choice_set = self._choices, self._choice_set
+        return all(_is_choice(item, choices=choices, choice_set=choice_set) for item in field_value)
+
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if self._is_valid_collection_of_choices(field_value):
+            return (field_value, [])
+        return (None, [self.create_invalid_field_error(suffix=self._invalid_choice_suffix)])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return self._is_valid_collection_of_choices(field_value)
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -619,14 +1078,57 @@ class MultiChoiceField(Field):
         )
 
 
+class LookupField(Field):
+    """
+    Field whose allowed values are held in a lookup index (refer to `valcheck.lookups`) instead of an in-memory collection.
+    Use this instead of `ChoiceField` for very large sets of allowed values (Eg: catalogs of IDs).
+    The lookups are batched when the field is validated via `ModelListField` or `Validator.validate_many()`.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, *, index: LookupIndex, **kwargs: Any) -> None:
+        """
+        Parameters:
+            - index (LookupIndex): The lookup index having the allowed values.
+        """
+        assert isinstance(index, LookupIndex), "Param `index` must be of type `valcheck.lookups.LookupIndex`"
+        self.index = index
+        super(LookupField, self).__init__(**kwargs)
+
+    def _get_prefetched_results(self, kwargs: Dict[str, Any], /) -> Optional[Dict[LookupKey, bool]]:
+        """Returns the prefetched results of the lookup index (from the `prefetched_lookups` kwarg), if any"""
+        prefetched_lookups: Optional[PrefetchedLookups] = kwargs.get("prefetched_lookups", None)
+        return prefetched_lookups.get(self.index) if prefetched_lookups else None
+
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if self.index.contains(field_value, prefetched_results=self._get_prefetched_results(kwargs)):
+            return (field_value, [])
+        suffix = "Must be a valid value i.e; one of the values of the lookup index"
+        return (None, [self.create_invalid_field_error(suffix=suffix)])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return self.index.contains(field_value, prefetched_results=self._get_prefetched_results(kwargs))
+
+    def sample_value(self, **kwargs: Any) -> Union[Any, None]:
+        if self.sample_value_factory:
+            return self.sample_value_factory()
+        return self.index.sample_value()
+
+
 class BytesField(Field):
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         super(BytesField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if isinstance(self.field_value, bytes):
-            return []
-        return [self.create_invalid_field_error()]
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if isinstance(field_value, bytes):
+            return (field_value, [])
+        return (None, [self.create_invalid_field_error()])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return isinstance(field_value, bytes)
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -635,65 +1137,145 @@ class BytesField(Field):
 
 
 class NumberField(Field):
-    def __init__(self, **kwargs: Any) -> None:
+    __slots__ = ("min_value", "max_value")
+
+    def __init__(
+            self,
+            *,
+            min_value: Optional[Union[int, float]] = None,
+            max_value: Optional[Union[int, float]] = None,
+            **kwargs: Any,
+        ) -> None:
+        """
+        Parameters:
+            - min_value (int | float): Minimum value (inclusive).
+            - max_value (int | float): Maximum value (inclusive).
+        """
+        _assert_valid_value_bounds(min_value, max_value)
+        self.min_value = min_value
+        self.max_value = max_value
         super(NumberField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if isinstance(self.field_value, (int, float)):
-            return []
-        suffix = "Must be a valid number (either integer or float)"
-        return [self.create_invalid_field_error(suffix=suffix)]
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if not isinstance(field_value, (int, float)):
+            suffix = "Must be a valid number (either integer or float)"
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
+        if not utils.is_within_bounds(field_value, min_value=self.min_value, max_value=self.max_value):
+            suffix = utils.make_bounds_message(min_value=self.min_value, max_value=self.max_value)
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
+        return (field_value, [])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return (
+            isinstance(field_value, (int, float))
+            and utils.is_within_bounds(field_value, min_value=self.min_value, max_value=self.max_value)
+        )
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
             return self.sample_value_factory()
-        return 3.14
+        return _fit_sample_value_to_bounds(3.14, min_value=self.min_value, max_value=self.max_value)
 
 
 class IntegerField(Field):
-    def __init__(self, **kwargs: Any) -> None:
+    __slots__ = ("min_value", "max_value")
+
+    def __init__(
+            self,
+            *,
+            min_value: Optional[Union[int, float]] = None,
+            max_value: Optional[Union[int, float]] = None,
+            **kwargs: Any,
+        ) -> None:
+        """
+        Parameters:
+            - min_value (int | float): Minimum value (inclusive).
+            - max_value (int | float): Maximum value (inclusive).
+        """
+        _assert_valid_value_bounds(min_value, max_value)
+        self.min_value = min_value
+        self.max_value = max_value
         super(IntegerField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if isinstance(self.field_value, int):
-            return []
-        return [self.create_invalid_field_error()]
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if not isinstance(field_value, int):
+            return (None, [self.create_invalid_field_error()])
+        if not utils.is_within_bounds(field_value, min_value=self.min_value, max_value=self.max_value):
+            suffix = utils.make_bounds_message(min_value=self.min_value, max_value=self.max_value)
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
+        return (field_value, [])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return (
+            isinstance(field_value, int)
+            and utils.is_within_bounds(field_value, min_value=self.min_value, max_value=self.max_value)
+        )
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
             return self.sample_value_factory()
-        return 314
+        return _fit_sample_value_to_bounds(314, min_value=self.min_value, max_value=self.max_value)
 
 
 class FloatField(Field):
-    def __init__(self, **kwargs: Any) -> None:
+    __slots__ = ("min_value", "max_value")
+
+    def __init__(
+            self,
+            *,
+            min_value: Optional[Union[int, float]] = None,
+            max_value: Optional[Union[int, float]] = None,
+            **kwargs: Any,
+        ) -> None:
+        """
+        Parameters:
+            - min_value (int | float): Minimum value (inclusive).
+            - max_value (int | float): Maximum value (inclusive).
+        """
+        _assert_valid_value_bounds(min_value, max_value)
+        self.min_value = min_value
+        self.max_value = max_value
         super(FloatField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if isinstance(self.field_value, float):
-            return []
-        return [self.create_invalid_field_error()]
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if not isinstance(field_value, float):
+            return (None, [self.create_invalid_field_error()])
+        if not utils.is_within_bounds(field_value, min_value=self.min_value, max_value=self.max_value):
+            suffix = utils.make_bounds_message(min_value=self.min_value, max_value=self.max_value)
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
+        return (field_value, [])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return (
+            isinstance(field_value, float)
+            and utils.is_within_bounds(field_value, min_value=self.min_value, max_value=self.max_value)
+        )
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
             return self.sample_value_factory()
-        return 3.14
+        return float(_fit_sample_value_to_bounds(3.14, min_value=self.min_value, max_value=self.max_value))
 
 
 class NumberStringField(Field):
+    __slots__ = ("to_number",)
+
     def __init__(self, *, to_number: Optional[bool] = False, **kwargs: Any) -> None:
         assert isinstance(to_number, bool), "Param `to_number` must be of type 'bool'"
         self.to_number = to_number
         super(NumberStringField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        number, is_valid = utils.validate_number_string(self.field_value)
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        number, is_valid = utils.validate_number_string(field_value)
         if not is_valid:
             suffix = "Must be a valid number (either integer or float) cast as a string"
-            return [self.create_invalid_field_error(suffix=suffix)]
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
         if self.to_number and number is not None:
-            self.field_value = number
-        return []
+            field_value = number
+        return (field_value, [])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return utils.is_valid_number_string(field_value)
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -702,19 +1284,24 @@ class NumberStringField(Field):
 
 
 class IntegerStringField(Field):
+    __slots__ = ("to_integer",)
+
     def __init__(self, *, to_integer: Optional[bool] = False, **kwargs: Any) -> None:
         assert isinstance(to_integer, bool), "Param `to_integer` must be of type 'bool'"
         self.to_integer = to_integer
         super(IntegerStringField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        number_as_int, is_valid = utils.validate_integer_string(self.field_value)
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        number_as_int, is_valid = utils.validate_integer_string(field_value)
         if not is_valid:
             suffix = "Must be a valid integer cast as a string"
-            return [self.create_invalid_field_error(suffix=suffix)]
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
         if self.to_integer and number_as_int is not None:
-            self.field_value = number_as_int
-        return []
+            field_value = number_as_int
+        return (field_value, [])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return utils.is_valid_integer_string(field_value)
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -723,19 +1310,24 @@ class IntegerStringField(Field):
 
 
 class FloatStringField(Field):
+    __slots__ = ("to_float",)
+
     def __init__(self, *, to_float: Optional[bool] = False, **kwargs: Any) -> None:
         assert isinstance(to_float, bool), "Param `to_float` must be of type 'bool'"
         self.to_float = to_float
         super(FloatStringField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        number_as_float, is_valid = utils.validate_float_string(self.field_value)
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        number_as_float, is_valid = utils.validate_float_string(field_value)
         if not is_valid:
             suffix = "Must be a valid float cast as a string"
-            return [self.create_invalid_field_error(suffix=suffix)]
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
         if self.to_float and number_as_float is not None:
-            self.field_value = number_as_float
-        return []
+            field_value = number_as_float
+        return (field_value, [])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return utils.is_valid_float_string(field_value)
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -744,17 +1336,22 @@ class FloatStringField(Field):
 
 
 class DictionaryField(Field):
+    __slots__ = ("allow_empty",)
+
     def __init__(self, *, allow_empty: Optional[bool] = True, **kwargs: Any) -> None:
         assert isinstance(allow_empty, bool), "Param `allow_empty` must be of type 'bool'"
         self.allow_empty = allow_empty
         super(DictionaryField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if not utils.is_valid_object_of_type(self.field_value, type_=dict):
-            return [self.create_invalid_field_error()]
-        if not utils.is_empty_value_allowed(self.field_value, allow_empty=self.allow_empty):
-            return [self.create_invalid_field_error(suffix="Must be a non-empty dictionary")]
-        return []
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if not utils.is_valid_object_of_type(field_value, type_=dict):
+            return (None, [self.create_invalid_field_error()])
+        if not utils.is_empty_value_allowed(field_value, allow_empty=self.allow_empty):
+            return (None, [self.create_invalid_field_error(suffix="Must be a non-empty dictionary")])
+        return (field_value, [])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return isinstance(field_value, dict) and utils.is_empty_value_allowed(field_value, allow_empty=self.allow_empty)
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -767,25 +1364,60 @@ class DictionaryField(Field):
 
 
 class ListField(Field):
-    def __init__(self, *, allow_empty: Optional[bool] = True, **kwargs: Any) -> None:
+    __slots__ = ("allow_empty", "min_length", "max_length")
+
+    def __init__(
+            self,
+            *,
+            allow_empty: Optional[bool] = True,
+            min_length: Optional[int] = None,
+            max_length: Optional[int] = None,
+            **kwargs: Any,
+        ) -> None:
+        """
+        Parameters:
+            - allow_empty (bool): True if the list can be empty, else False. Default: True
+            - min_length (int): Minimum length of the list (inclusive).
+            - max_length (int): Maximum length of the list (inclusive).
+        """
         assert isinstance(allow_empty, bool), "Param `allow_empty` must be of type 'bool'"
+        _assert_valid_length_bounds(min_length, max_length)
         self.allow_empty = allow_empty
+        self.min_length = min_length
+        self.max_length = max_length
         super(ListField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if not utils.is_valid_object_of_type(self.field_value, type_=list):
-            return [self.create_invalid_field_error()]
-        if not utils.is_empty_value_allowed(self.field_value, allow_empty=self.allow_empty):
-            return [self.create_invalid_field_error(suffix="Must be a non-empty list")]
-        return []
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if not utils.is_valid_object_of_type(field_value, type_=list):
+            return (None, [self.create_invalid_field_error()])
+        if not utils.is_empty_value_allowed(field_value, allow_empty=self.allow_empty):
+            return (None, [self.create_invalid_field_error(suffix="Must be a non-empty list")])
+        if not utils.is_within_bounds(len(field_value), min_value=self.min_length, max_value=self.max_length):
+            suffix = utils.make_bounds_message(min_value=self.min_length, max_value=self.max_length, subject="Length")
+            return (None, [self.create_invalid_field_error(suffix=suffix)])
+        return (field_value, [])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return (
+            isinstance(field_value, list)
+            and utils.is_empty_value_allowed(field_value, allow_empty=self.allow_empty)
+            and utils.is_within_bounds(len(field_value), min_value=self.min_length, max_value=self.max_length)
+        )
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
             return self.sample_value_factory()
-        return [1, 2, 3]
+        sample = [1, 2, 3]
+        if self.min_length is not None and len(sample) < self.min_length:
+            sample += [sample[-1]] * (self.min_length - len(sample))
+        if self.max_length is not None and len(sample) > self.max_length:
+            sample = sample[:self.max_length]
+        return sample
 
 
 class ModelDictionaryField(Field):
+    __slots__ = ("validator_model",)
+
     def __init__(self, *, validator_model: Type, **kwargs: Any) -> None:
         from valcheck.validators import Validator
         assert validator_model is not Validator and issubclass(validator_model, Validator), (
@@ -801,21 +1433,29 @@ class ModelDictionaryField(Field):
         self.validator_model = validator_model
         super(ModelDictionaryField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if not isinstance(self.field_value, dict):
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if not isinstance(field_value, dict):
             suffix = "Field must be a dictionary"
             error = self.create_invalid_field_error(suffix=suffix)
-            return [error]
-        validator = self.validator_model(data=self.field_value)
-        validator.run_validations()
+            return (None, [error])
+        validator = self.validator_model(data=field_value)
+        validator.run_validations(
+            error_budget=kwargs.get("error_budget", None),
+            prefetched_lookups=kwargs.get("prefetched_lookups", None),
+        )
         error_objs = validator.errors
         for error_obj in error_objs:
-            suffix = error_obj.validator_message
-            error_obj.validator_message = self.invalid_field_error_message(suffix=suffix)
+            error_obj.wrap_validator_message(field_type=self.type_alias, field_name=self.source)
             error_obj.append_to_field_path(self.source)
-        if not error_objs:
-            self.field_value = validator.validated_data
-        return error_objs
+        if error_objs:
+            return (None, error_objs)
+        return (validator.validated_data, [])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        return isinstance(field_value, dict) and self.validator_model.is_valid(
+            field_value,
+            prefetched_lookups=kwargs.get("prefetched_lookups", None),
+        )
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
@@ -826,7 +1466,23 @@ class ModelDictionaryField(Field):
 
 
 class ModelListField(Field):
-    def __init__(self, *, validator_model: Type, allow_empty: Optional[bool] = True, **kwargs: Any) -> None:
+    __slots__ = ("validator_model", "allow_empty", "max_errors")
+
+    def __init__(
+            self,
+            *,
+            validator_model: Type,
+            allow_empty: Optional[bool] = True,
+            max_errors: Optional[int] = None,
+            **kwargs: Any,
+        ) -> None:
+        """
+        Parameters:
+            - validator_model (Type[Validator]): The validator model used to validate each row.
+            - allow_empty (bool): True if the list can be empty, else False. Default: True
+            - max_errors (int): Maximum count of errors to collect for the field. Once reached, the remaining rows are skipped,
+            and the skipped rows are reported via `Validator.errors_truncated` and `Validator.skipped_row_count`.
+        """
         from valcheck.validators import Validator
         assert validator_model is not Validator and issubclass(validator_model, Validator), (
             "Param `validator_model` must be a sub-class of `valcheck.validators.Validator`"
@@ -839,41 +1495,92 @@ class ModelListField(Field):
             )
             raise ValueError(msg)
         assert isinstance(allow_empty, bool), "Param `allow_empty` must be of type 'bool'"
+        assert max_errors is None or (isinstance(max_errors, int) and max_errors >= 1), (
+            "Param `max_errors` must be an integer >= 1"
+        )
         self.validator_model = validator_model
         self.allow_empty = allow_empty
+        self.max_errors = max_errors
         super(ModelListField, self).__init__(**kwargs)
 
-    def validate(self) -> List[Error]:
-        if not isinstance(self.field_value, list):
+    def _is_error_limit_reached(self, errors: List[Error], /, *, error_budget: ErrorBudget, num_errors_before: int) -> bool:
+        """
+        Checks if either the field's `max_errors` or the error budget of the validation run is exhausted.
+        Drops the errors that exceed the limit (in-place).
+        """
+        is_limit_reached = False
+        if self.max_errors is not None and len(errors) >= self.max_errors:
+            if len(errors) > self.max_errors:
+                del errors[self.max_errors:]
+                error_budget.mark_as_truncated()
+            is_limit_reached = True
+        if error_budget.update(errors, num_errors_before=num_errors_before):
+            is_limit_reached = True
+        return is_limit_reached
+
+    def validate(self, field_value: Any, /, **kwargs: Any) -> Tuple[Any, List[Error]]:
+        if not isinstance(field_value, list):
             suffix = "Field must be a list"
             error = self.create_invalid_field_error(suffix=suffix)
-            return [error]
-        if not self.allow_empty and not self.field_value:
+            return (None, [error])
+        if not self.allow_empty and not field_value:
             suffix = "Field must be a non-empty list"
             error = self.create_invalid_field_error(suffix=suffix)
-            return [error]
+            return (None, [error])
+        prefetched_lookups = self.validator_model._prefetch_lookups(
+            field_value,
+            prefetched_lookups=kwargs.get("prefetched_lookups", None),
+        )
+        return self._validate_rows(
+            field_value,
+            error_budget=kwargs.get("error_budget", None) or ErrorBudget(),
+            prefetched_lookups=prefetched_lookups,
+        )
+
+    def _validate_rows(
+            self,
+            field_value: List[Any],
+            /,
+            *,
+            error_budget: ErrorBudget,
+            prefetched_lookups: Optional[PrefetchedLookups],
+        ) -> Tuple[Any, List[Error]]:
+        num_errors_before = error_budget.num_errors
         errors: List[Error] = []
         validated_field_value = []
-        for idx, item in enumerate(self.field_value):
+        for idx, item in enumerate(field_value):
             row_number = idx + 1
-            row_number_string = f"<Row number: {row_number}>"
             if not isinstance(item, dict):
-                suffix = f"Row must be a dictionary {row_number_string}"
+                suffix = f"Row must be a dictionary <Row number: {row_number}>"
                 error = self.create_invalid_field_error(suffix=suffix)
+                error.append_to_field_path(idx, at_beginning=False)
                 errors.append(error)
-                continue
-            validator = self.validator_model(data=item)
-            validator.run_validations()
-            error_objs = validator.errors
-            validated_field_value.append(validator.validated_data)
-            for error_obj in error_objs:
-                suffix = f"{error_obj.validator_message} {row_number_string}"
-                error_obj.validator_message = self.invalid_field_error_message(suffix=suffix)
-                error_obj.append_to_field_path(self.source)
-            errors.extend(error_objs)
-        if not errors:
-            self.field_value = validated_field_value
-        return errors
+            else:
+                validator = self.validator_model(data=item)
+                validator.run_validations(error_budget=error_budget, prefetched_lookups=prefetched_lookups)
+                error_objs = validator.errors
+                validated_field_value.append(validator.validated_data)
+                for error_obj in error_objs:
+                    error_obj.wrap_validator_message(field_type=self.type_alias, field_name=self.source, row_number=row_number)
+                    error_obj.prepend_to_field_path(self.source, idx)
+                errors.extend(error_objs)
+            if errors and self._is_error_limit_reached(errors, error_budget=error_budget, num_errors_before=num_errors_before):
+                if row_number < len(field_value):
+                    error_budget.mark_as_truncated(skipped_row_count=len(field_value) - row_number)
+                break
+        if errors:
+            return (None, errors)
+        return (validated_field_value, [])
+
+    def is_valid_value(self, field_value: Any, /, **kwargs: Any) -> bool:
+        if not isinstance(field_value, list) or (not self.allow_empty and not field_value):
+            return False
+        is_valid = self.validator_model.is_valid
+        prefetched_lookups = self.validator_model._prefetch_lookups(
+            field_value,
+            prefetched_lookups=kwargs.get("prefetched_lookups", None),
+        )
+        return all(isinstance(item, dict) and is_valid(item, prefetched_lookups=prefetched_lookups) for item in field_value)
 
     def sample_value(self, **kwargs: Any) -> Union[Any, None]:
         if self.sample_value_factory:
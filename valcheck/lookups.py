@@ -0,0 +1,340 @@
+"""
+Lookup indexes used by `valcheck.fields.LookupField`, i.e; sets of allowed values that are too large to be held in memory
+as a Python collection (Eg: catalogs of tens of millions of IDs).
+
+Each index answers membership queries for one value at a time via `contains()`, and for a batch of values via
+`contains_many()`. The `prefetch()` method looks up a batch of values at once, and returns the results, which the subsequent
+`contains()` calls can be served from (via their `prefetched_results` param). It is used by `ModelListField` and
+`Validator.validate_many()`, which pass the prefetched results down to the fields (refer to `PrefetchedLookups`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import mmap
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+
+# Key of a value in the prefetched results. Equal values of different types (Eg: `1`, `1.0` and `True`) are kept apart,
+# since an index can give them different results (Eg: a Bloom filter hashes them differently).
+LookupKey = Tuple[type, Any]
+
+
+def _group_unique_hashable_values_by_type(values: Iterable[Any], /) -> Dict[type, List[Any]]:
+    """
+    Returns dictionary having keys = types, and values = the unique values of said type (in order of first occurrence),
+    skipping the unhashable values.
+    """
+    unique_values: Dict[LookupKey, None] = {}
+    for value in values:
+        try:
+            unique_values[(value.__class__, value)] = None
+        except TypeError:
+            continue
+    values_by_type: Dict[type, List[Any]] = {}
+    for type_, value in unique_values:
+        values_by_type.setdefault(type_, []).append(value)
+    return values_by_type
+
+
+class LookupIndex:
+    """
+    Base class of a lookup index.
+    Sub-classes must implement the `_contains()` method, and can override the `_contains_many()` method to look up a batch
+    of values more efficiently than one value at a time.
+
+    An index is shared (not copied) by the copies of a field, and resources such as file handles and database connections
+    are opened lazily, so that an index can be pickled (Eg: to be sent to the worker processes of `valcheck.parallel`).
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> LookupIndex:
+        return self
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_local", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _contains(self, value: Any, /) -> bool:
+        """Returns True if the given `value` is in the index, else False"""
+        raise NotImplementedError()
+
+    def _contains_many(self, values: List[Any], /) -> Set[Any]:
+        """
+        Takes in a list of unique (hashable) values, all of the same type, and returns the set of the values that are in the index.
+        Must give the same results as `_contains()`.
+        """
+        return {value for value in values if self._contains(value)}
+
+    def sample_value(self) -> Optional[Any]:
+        """Returns one of the values of the index (used to generate sample data), or `None` if the index has no values"""
+        return None
+
+    def prefetch(self, values: Iterable[Any], /) -> Dict[LookupKey, bool]:
+        """
+        Looks up the given values in batches (one per type of value), and returns dictionary having keys = `(type, value)`,
+        and values = True if the value is in the index, else False. Unhashable values are skipped.
+        The returned dictionary can be passed to `contains()` as the `prefetched_results`.
+        """
+        results: Dict[LookupKey, bool] = {}
+        for type_, unique_values in _group_unique_hashable_values_by_type(values).items():
+            found_values = self._contains_many(unique_values)
+            for value in unique_values:
+                results[(type_, value)] = value in found_values
+        return results
+
+    def contains(self, value: Any, /, *, prefetched_results: Optional[Dict[LookupKey, bool]] = None) -> bool:
+        """
+        Returns True if the given `value` is in the index, else False.
+
+        Parameters:
+            - prefetched_results (Dict[LookupKey, bool]): The results returned by `prefetch()`. If the `value` was prefetched,
+            its result is returned (instead of looking it up).
+        """
+        if prefetched_results is not None:
+            try:
+                return prefetched_results[(value.__class__, value)]
+            except (KeyError, TypeError):
+                pass
+        return self._contains(value)
+
+    def contains_many(self, values: Iterable[Any], /) -> Dict[Any, bool]:
+        """
+        Looks up the given values in a batch, and returns dictionary having keys = values, and values = True if the value
+        is in the index, else False. Unhashable values are skipped.
+        Equal values of different types (Eg: `1` and `True`) share a key of the returned dictionary (the result of the value
+        that occurs last is kept), so use `contains()` to look up such values.
+        """
+        return {value: is_found for (_, value), is_found in self.prefetch(values).items()}
+
+
+# The prefetched results of a batch of records, i.e; dictionary having keys = lookup indexes, and values = the results returned
+# by their `prefetch()` method. Passed down to the fields via the `prefetched_lookups` kwarg, so that its lifetime is that of
+# the validation of said batch (it is not shared with other validations).
+PrefetchedLookups = Dict[LookupIndex, Dict[LookupKey, bool]]
+
+
+class SortedFileLookupIndex(LookupIndex):
+    """
+    Lookup index backed by a text file having one value per line (separated by `\\n`), sorted in byte order
+    (Eg: `LC_ALL=C sort -u values.txt`). The file is memory-mapped and searched by binary search, so a lookup takes
+    O(log n) reads of the file, and the file is paged in by the OS on demand (shared by all processes).
+    Only string values can be in the index.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], /, *, encoding: Optional[str] = "utf-8") -> None:
+        """
+        Parameters:
+            - path (str | PathLike): Path to the sorted file.
+            - encoding (str): Encoding of the file. Default: "utf-8"
+        """
+        assert isinstance(path, (str, os.PathLike)), "Param `path` must be a path to the sorted file"
+        assert os.path.isfile(path), f"The file '{path}' does not exist"
+        assert isinstance(encoding, str), "Param `encoding` must be of type 'str'"
+        super().__init__()
+        self.path = path
+        self.encoding = encoding
+        self._mmap: Optional[mmap.mmap] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state["_mmap"] = None
+        return state
+
+    def _get_mmap(self) -> Optional[mmap.mmap]:
+        """Returns the memory-mapped file (opened on first use), or `None` if the file is empty"""
+        if self._mmap is None and os.path.getsize(self.path) > 0:
+            with open(self.path, mode="rb") as fp:
+                self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def sample_value(self) -> Optional[str]:
+        mm = self._get_mmap()
+        if mm is None:
+            return None
+        line_end = mm.find(b"\n")
+        return mm[:line_end if line_end != -1 else len(mm)].decode(self.encoding)
+
+    def _contains(self, value: Any, /) -> bool:
+        if not isinstance(value, str):
+            return False
+        try:
+            target = value.encode(self.encoding)
+        except UnicodeEncodeError:
+            return False
+        if b"\n" in target:
+            return False
+        mm = self._get_mmap()
+        if mm is None:
+            return False
+        # Binary search over the byte offsets, where `low` is always the start of a line
+        low, high = 0, len(mm)
+        while low < high:
+            middle = (low + high) // 2
+            line_start = mm.rfind(b"\n", 0, middle) + 1
+            line_end = mm.find(b"\n", line_start)
+            if line_end == -1:
+                line_end = len(mm)
+            line = mm[line_start:line_end]
+            if line == target:
+                return True
+            if line < target:
+                low = line_end + 1
+            else:
+                high = line_start
+        return False
+
+
+class SqliteLookupIndex(LookupIndex):
+    """
+    Lookup index backed by a column of a table in a SQLite database (opened in read-only mode).
+    The column should be indexed (or be the primary key), so that a lookup is O(log n).
+    Each thread uses its own connection.
+    """
+
+    # Maximum count of values per `IN (...)` query (kept well below the SQLite limit on the count of host parameters)
+    BATCH_SIZE = 500
+
+    # Types of the values that can be looked up (the values of other types are never in the index)
+    SUPPORTED_TYPES = (str, int, float, bytes)
+
+    def __init__(self, path: Union[str, os.PathLike], /, *, table: str, column: str) -> None:
+        """
+        Parameters:
+            - path (str | PathLike): Path to the SQLite database.
+            - table (str): Name of the table.
+            - column (str): Name of the column having the allowed values.
+        """
+        assert isinstance(path, (str, os.PathLike)), "Param `path` must be a path to the SQLite database"
+        assert os.path.isfile(path), f"The file '{path}' does not exist"
+        assert isinstance(table, str) and table.isidentifier(), "Param `table` must be a valid identifier"
+        assert isinstance(column, str) and column.isidentifier(), "Param `column` must be a valid identifier"
+        super().__init__()
+        self.path = path
+        self.table = table
+        self.column = column
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Returns the connection of the current thread (opened on first use)"""
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None:
+            uri = f"file:{os.path.abspath(self.path)}?mode=ro"
+            connection = sqlite3.connect(uri, uri=True)
+            self._local.connection = connection
+        return connection
+
+    def sample_value(self) -> Optional[Any]:
+        query = f'SELECT "{self.column}" FROM "{self.table}" LIMIT 1'
+        row = self._get_connection().execute(query).fetchone()
+        return row[0] if row is not None else None
+
+    def _contains(self, value: Any, /) -> bool:
+        if not isinstance(value, self.SUPPORTED_TYPES):
+            return False
+        query = f'SELECT 1 FROM "{self.table}" WHERE "{self.column}" = ? LIMIT 1'
+        row = self._get_connection().execute(query, (value,)).fetchone()
+        return row is not None
+
+    def _contains_many(self, values: List[Any], /) -> Set[Any]:
+        supported_values = [value for value in values if isinstance(value, self.SUPPORTED_TYPES)]
+        found_values: Set[Any] = set()
+        connection = self._get_connection()
+        for idx in range(0, len(supported_values), self.BATCH_SIZE):
+            batch = supported_values[idx : idx + self.BATCH_SIZE]
+            # Each value is compared via `=` (same as `_contains()`), so that the type affinity of the column applies
+            # (Eg: the integer 1 matches the text '1' of a TEXT column). The matches are mapped back via their position.
+            candidates = ", ".join([f"({position}, ?)" for position in range(len(batch))])
+            query = (
+                f"WITH candidates(position, value) AS (VALUES {candidates})"
+                f' SELECT position FROM candidates WHERE EXISTS'
+                f' (SELECT 1 FROM "{self.table}" WHERE "{self.column}" = candidates.value)'
+            )
+            found_values.update(batch[row[0]] for row in connection.execute(query, batch))
+        return found_values
+
+
+class BloomFilterLookupIndex(LookupIndex):
+    """
+    Lookup index that puts an in-memory Bloom filter in front of another (exact) lookup index.
+    Values that are not in the Bloom filter are rejected without querying the `fallback` index, and the rest are checked
+    against the `fallback` index (so false positives of the Bloom filter never reach the result).
+    Useful when most of the values being looked up are expected to be invalid, and the `fallback` index is slow.
+
+    Only string values are looked up in the Bloom filter, since their key is canonical (the `fallback` index could match
+    values of other types that are not equal to any of the allowed values, Eg: `1.0` for the value `1`). Values of other
+    types are checked against the `fallback` index directly. If any of the allowed values is not a string, the Bloom filter
+    is not used at all, since a string could match it in the `fallback` index (Eg: '1' for the value `1`).
+    """
+
+    def __init__(
+            self,
+            values: Iterable[Any],
+            /,
+            *,
+            fallback: LookupIndex,
+            expected_count: int,
+            false_positive_rate: Optional[float] = 0.01,
+        ) -> None:
+        """
+        Parameters:
+            - values (Iterable[Any]): The allowed values (consumed once, to build the Bloom filter).
+            - fallback (LookupIndex): The exact lookup index having the same allowed values.
+            - expected_count (int): Expected count of allowed values (used to size the Bloom filter).
+            - false_positive_rate (float): Target false positive rate of the Bloom filter. Default: 0.01
+        """
+        assert isinstance(fallback, LookupIndex), "Param `fallback` must be of type `valcheck.lookups.LookupIndex`"
+        assert isinstance(expected_count, int) and expected_count >= 1, "Param `expected_count` must be an integer >= 1"
+        assert isinstance(false_positive_rate, float) and 0 < false_positive_rate < 1, (
+            "Param `false_positive_rate` must be a float between 0 and 1"
+        )
+        super().__init__()
+        self.fallback = fallback
+        num_bits = max(8, math.ceil(-expected_count * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.num_bits = num_bits
+        self.num_hashes = max(1, round(num_bits / expected_count * math.log(2)))
+        self._bits = bytearray((num_bits + 7) // 8)
+        self.is_enabled = True
+        for value in values:
+            if not isinstance(value, str):
+                self.is_enabled = False
+                continue
+            for bit_index in self._get_bit_indices(value):
+                self._bits[bit_index >> 3] |= 1 << (bit_index & 7)
+
+    def _get_bit_indices(self, value: str, /) -> Iterator[int]:
+        """Yields the indices of the bits of the given string `value` (via double hashing)"""
+        digest = hashlib.blake2b(value.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        hash_1 = int.from_bytes(digest[:8], "little")
+        hash_2 = int.from_bytes(digest[8:], "little") | 1
+        for idx in range(self.num_hashes):
+            yield (hash_1 + idx * hash_2) % self.num_bits
+
+    def _might_contain(self, value: Any, /) -> bool:
+        """Returns False if the given `value` is certainly not in the index (only strings can be ruled out), else True"""
+        if not self.is_enabled or not isinstance(value, str):
+            return True
+        bits = self._bits
+        return all(bits[bit_index >> 3] & (1 << (bit_index & 7)) for bit_index in self._get_bit_indices(value))
+
+    def sample_value(self) -> Optional[Any]:
+        return self.fallback.sample_value()
+
+    def _contains(self, value: Any, /) -> bool:
+        return self._might_contain(value) and self.fallback.contains(value)
+
+    def _contains_many(self, values: List[Any], /) -> Set[Any]:
+        candidates = [value for value in values if self._might_contain(value)]
+        if not candidates:
+            return set()
+        return self.fallback._contains_many(candidates)
@@ -1,12 +1,99 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, Union
 
-from valcheck import utils
+from valcheck import settings, utils
+
+
+# Separator of the segments of the (legacy) string representation of the field path
+FIELD_PATH_SEPARATOR = " --> "
+
+
+def _escape_json_pointer_token(segment: Union[str, int], /) -> str:
+    return str(segment).replace("~", "~0").replace("/", "~1")
+
+
+class ErrorMessage:
+    """
+    Class that represents the (structured) template of the `validator_message` of an error, which is rendered only when
+    the message is read. Errors that are only counted or discarded never pay for building the message.
+
+    The `suffix` can either be a string, a callable that returns the string (called when rendering), or another
+    `ErrorMessage` (used when the errors of a nested validator are wrapped by the field of the parent validator).
+    """
+
+    __slots__ = ("kind", "field_type", "field_name", "prefix", "suffix", "row_number")
+
+    def __init__(
+            self,
+            *,
+            kind: Literal["Invalid", "Missing"],
+            field_type: str,
+            field_name: Optional[str],
+            prefix: Optional[str] = None,
+            suffix: Optional[Union[str, Callable[[], str], ErrorMessage]] = None,
+            row_number: Optional[int] = None,
+        ) -> None:
+        """
+        Parameters:
+            - kind (str): Kind of the error. Options: ['Invalid', 'Missing']
+            - field_type (str): Type alias of the field (Eg: 'StringField').
+            - field_name (str): Name of the field (its source).
+            - prefix (str): Prefix of the message.
+            - suffix (str | Callable[[], str] | ErrorMessage): Suffix of the message.
+            - row_number (int): Row number (starts from 1) of the nested validator's errors within a list-field.
+        """
+        self.kind = kind
+        self.field_type = field_type
+        self.field_name = field_name
+        self.prefix = prefix
+        self.suffix = suffix
+        self.row_number = row_number
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> ErrorMessage:
+        # Never modified after being created, so copies of an error can share it
+        return self
+
+    def render(self) -> str:
+        """Returns the message as a string"""
+        suffix = self.suffix
+        if isinstance(suffix, ErrorMessage):
+            suffix = suffix.render()
+        elif callable(suffix):
+            suffix = suffix()
+        if self.row_number is not None:
+            suffix = f"{suffix or ''} <Row number: {self.row_number}>"
+        return utils.make_message(
+            f"{self.kind} {self.field_type} '{self.field_name}'",
+            prefix=self.prefix,
+            suffix=suffix,
+            sep=" || ",
+        )
 
 
 class Error:
-    """Class that represents an error"""
+    """
+    Class that represents an error.
+
+    The errors of a field are derived from the field's `error` (via `derive()`), which is cheap. The derived error
+    shares the `details` with the error it was derived from, and each of them makes its own (deep) copy of the `details`
+    the first time they are accessed (copy-on-access, since the returned dictionary could be modified in-place). Errors
+    whose `details` are never accessed, or are empty, never pay for the deep-copy.
+
+    The field path is kept as a tuple of segments (field names, and the indices of rows within list-fields), and is
+    rendered only when read, either as a string (via `field_path`, which leaves out the indices of rows) or as a
+    JSON Pointer (via `field_path_pointer`, as per RFC 6901).
+    """
+
+    __slots__ = (
+        "description",
+        "code",
+        "_details",
+        "_owns_details",
+        "_validator_message",
+        "_message_template",
+        "_field_path",
+    )
 
     def __init__(
             self,
@@ -22,58 +109,160 @@ class Error:
         assert (field_path_part is None or isinstance(field_path_part, str)), "Param `field_path_part` must be a string"
         self.description = description or ""
         self.code = code or ""
-        self.details = details or {}
+        self._details: Dict[str, Any] = details or {}
+        self._owns_details = True
         self._validator_message = ""
-        self._field_path = field_path_part or ""
+        self._message_template: Optional[ErrorMessage] = None
+        self._field_path: Tuple[Union[str, int], ...] = (field_path_part,) if field_path_part else ()
+
+    def derive(self) -> Error:
+        """
+        Returns a new error having the same attributes as the current error, without running the checks of `__init__()`,
+        and without copying the `details` (which are shared until accessed, refer to the `details` property).
+        """
+        cls = self.__class__
+        error = cls.__new__(cls)
+        error.description = self.description
+        error.code = self.code
+        error._details = self._details
+        error._owns_details = False
+        error._validator_message = self._validator_message
+        error._message_template = self._message_template
+        error._field_path = self._field_path
+        self._owns_details = False
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict:
+            error.__dict__.update(utils.make_deep_copy(instance_dict))
+        return error
 
     def copy(self) -> Error:
-        """Returns deep-copy of current `Error` object"""
-        return utils.make_deep_copy(self)
+        """Returns copy of current `Error` object (the `details` are deep-copied when first accessed, refer to `derive()`)"""
+        return self.derive()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Error:
+        return self.derive()
+
+    def __reduce__(self) -> Tuple[Callable[..., Error], Tuple[Any, ...]]:
+        """Pickles the error as a compact tuple of its attributes (keeps the cost of sending errors across processes low)"""
+        return (
+            _rebuild_error,
+            (
+                self.__class__,
+                self.description,
+                self.code,
+                self._details,
+                self.validator_message,
+                self._field_path,
+                getattr(self, "__dict__", None),
+            ),
+        )
+
+    @property
+    def details(self) -> Dict[str, Any]:
+        """The details of the error. If shared with another error, they are deep-copied on first access (refer to `derive()`)"""
+        if not self._owns_details:
+            self._details = utils.make_deep_copy(self._details) if self._details else {}
+            self._owns_details = True
+        return self._details
+
+    @details.setter
+    def details(self, value: Dict[str, Any]) -> None:
+        assert isinstance(value, dict), "The param `details` must be a dictionary"
+        self._details = value
+        self._owns_details = True
 
     @property
     def validator_message(self) -> str:
+        if self._message_template is not None:
+            self._validator_message = self._message_template.render()
+            self._message_template = None
         return self._validator_message
 
     @validator_message.setter
     def validator_message(self, value: str) -> None:
         assert isinstance(value, str), "The param `validator_message` must be a string"
         self._validator_message = value
+        self._message_template = None
+
+    def set_message_template(self, message_template: ErrorMessage, /) -> None:
+        """Sets the template of the `validator_message`, which is rendered only when the `validator_message` is read"""
+        if settings.CHECK_INTERNAL_INVARIANTS:
+            assert isinstance(message_template, ErrorMessage), (
+                "Param `message_template` must be of type `valcheck.models.ErrorMessage`"
+            )
+        self._message_template = message_template
+
+    def wrap_validator_message(self, *, field_type: str, field_name: Optional[str], row_number: Optional[int] = None) -> None:
+        """
+        Wraps the `validator_message` as the suffix of the invalid-field message of the given (parent) field (in-place).
+        Used for the errors of nested validators. The message is still rendered only when read.
+        """
+        suffix = self._message_template if self._message_template is not None else self._validator_message
+        self._message_template = ErrorMessage(
+            kind="Invalid",
+            field_type=field_type,
+            field_name=field_name,
+            suffix=suffix,
+            row_number=row_number,
+        )
 
     @property
     def field_path(self) -> str:
-        return self._field_path
+        """The field path as a string, having the field names separated by `FIELD_PATH_SEPARATOR` (Eg: 'rows --> x')"""
+        return FIELD_PATH_SEPARATOR.join([segment for segment in self._field_path if not isinstance(segment, int)])
 
     @field_path.setter
     def field_path(self, value: str) -> None:
         assert isinstance(value, str), "The param `field_path` must be a string"
-        self._field_path = value
+        self._field_path = (value,) if value else ()
+
+    @property
+    def field_path_segments(self) -> Tuple[Union[str, int], ...]:
+        """The field path as a tuple of segments, i.e; field names (str) and indices of rows within list-fields (int)"""
+        return self._field_path
+
+    @property
+    def field_path_pointer(self) -> str:
+        """The field path as a JSON Pointer (Eg: '/rows/0/x'), as per RFC 6901"""
+        return "".join(["/" + _escape_json_pointer_token(segment) for segment in self._field_path])
 
     def append_to_field_path(
             self,
-            s: str,
+            s: Union[str, int],
             /,
             *,
             at_beginning: Optional[bool] = True,
-            separator: Optional[str] = " --> ",
+            separator: Optional[str] = FIELD_PATH_SEPARATOR,
         ) -> None:
-        """Appends the given string `s` to the `field_path` (in-place)"""
-        if not self.field_path:
-            self.field_path += s
+        """
+        Appends the given segment `s` to the `field_path` (in-place). The segment is either a field name (str) or
+        the index of a row within a list-field (int).
+        """
+        if separator != FIELD_PATH_SEPARATOR:
+            # Custom separators are only supported by the string representation of the field path
+            field_path = self.field_path
+            if field_path:
+                field_path = f"{s}{separator}{field_path}" if at_beginning else f"{field_path}{separator}{s}"
+            else:
+                field_path = str(s)
+            self.field_path = field_path
             return
-        self.field_path = (
-            s + separator + self.field_path
-            if at_beginning else
-            self.field_path + separator + s
-        )
+        self._field_path = (s,) + self._field_path if at_beginning else self._field_path + (s,)
+
+    def prepend_to_field_path(self, *segments: Union[str, int]) -> None:
+        """Prepends the given segments to the `field_path` (in-place)"""
+        self._field_path = segments + self._field_path
 
     def as_dict(
             self,
             *,
             include_validator_message: Optional[bool] = True,
             include_field_path: Optional[bool] = True,
+            include_field_path_pointer: Optional[bool] = False,
         ) -> Dict[str, Any]:
         assert isinstance(include_validator_message, bool), "Param `include_validator_message` must be of type 'bool'"
         assert isinstance(include_field_path, bool), "Param `include_field_path` must be of type 'bool'"
+        assert isinstance(include_field_path_pointer, bool), "Param `include_field_path_pointer` must be of type 'bool'"
         dict_ = {
             "description": self.description,
             "code": self.code,
@@ -83,8 +272,136 @@ class Error:
             dict_["validator_message"] = self.validator_message
         if include_field_path:
             dict_["field_path"] = self.field_path
+        if include_field_path_pointer:
+            dict_["field_path_pointer"] = self.field_path_pointer
         return dict_
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({self.as_dict()})"
 
+
+class ErrorBudget:
+    """
+    Class that keeps track of the count of errors collected during a validation run, and whether the errors were truncated
+    because the budget (`max_errors`) was exhausted. Shared by the validator and all its nested validators.
+    """
+
+    __slots__ = ("max_errors", "num_errors", "is_truncated", "skipped_row_count")
+
+    def __init__(self, *, max_errors: Optional[int] = None) -> None:
+        """
+        Parameters:
+            - max_errors (int): Maximum count of errors to collect. If `None`, there is no limit.
+        """
+        assert max_errors is None or (isinstance(max_errors, int) and max_errors >= 1), (
+            "Param `max_errors` must be an integer >= 1"
+        )
+        self.max_errors = max_errors
+        self.num_errors = 0
+        self.is_truncated = False
+        self.skipped_row_count = 0
+
+    @property
+    def is_exhausted(self) -> bool:
+        """True if the count of errors collected has reached `max_errors`"""
+        return self.max_errors is not None and self.num_errors >= self.max_errors
+
+    def update(self, errors: List[Error], /, *, num_errors_before: int) -> bool:
+        """
+        Updates the count of errors, given the errors collected so far in the current scope (validator/field), and the count of
+        errors that were collected before said scope started.
+        If the budget is exhausted, drops the errors that exceed the budget (in-place), and returns `True`.
+        """
+        self.num_errors = num_errors_before + len(errors)
+        if self.max_errors is None or self.num_errors < self.max_errors:
+            return False
+        num_errors_allowed = self.max_errors - num_errors_before
+        if len(errors) > num_errors_allowed:
+            del errors[num_errors_allowed:]
+            self.num_errors = self.max_errors
+            self.is_truncated = True
+        return True
+
+    def mark_as_truncated(self, *, skipped_row_count: Optional[int] = 0) -> None:
+        """Marks the errors as truncated, i.e; some of the validations were skipped since the budget was exhausted"""
+        self.is_truncated = True
+        self.skipped_row_count += skipped_row_count
+
+
+def _rebuild_error(
+        cls: Type[Error],
+        description: str,
+        code: str,
+        details: Dict[str, Any],
+        validator_message: str,
+        field_path: Tuple[Union[str, int], ...],
+        instance_dict: Optional[Dict[str, Any]],
+        /,
+    ) -> Error:
+    """
+    Re-builds an error (of the given class) from the tuple of attributes returned by `Error.__reduce__()`.
+    The `__init__()` method of the class is not called, since the `__init__()` of a sub-class could take other params.
+    """
+    error = cls.__new__(cls)
+    error.description = description
+    error.code = code
+    error._details = details
+    error._owns_details = True
+    error._validator_message = validator_message
+    error._message_template = None
+    error._field_path = field_path
+    if instance_dict:
+        error.__dict__.update(instance_dict)
+    return error
+
+
+class ValidationResult:
+    """Class that represents the (compact) result of validating one record out of a batch of records"""
+
+    __slots__ = ("index", "validated_data", "errors")
+
+    def __init__(
+            self,
+            *,
+            index: int,
+            validated_data: Optional[Dict[str, Any]],
+            errors: List[Error],
+        ) -> None:
+        """
+        Parameters:
+            - index (int): Index of the record in the batch (starts from 0).
+            - validated_data (Dict[str, Any]): Dictionary having the validated data (if the record is valid); otherwise `None`.
+            - errors (List[Error]): List of errors (each of type `valcheck.models.Error`). Empty if the record is valid.
+        """
+        self.index = index
+        self.validated_data = validated_data
+        self.errors = errors
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    def as_dict(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Accepted kwargs:
+            - include_validator_message (bool)
+            - include_field_path (bool)
+            - include_field_path_pointer (bool)
+        """
+        return {
+            "index": self.index,
+            "validated_data": self.validated_data,
+            "errors": [error.as_dict(**kwargs) for error in self.errors],
+        }
+
+    def __reduce__(self) -> Tuple[Callable[..., ValidationResult], Tuple[Any, ...]]:
+        """Pickles the result as a compact tuple of its attributes"""
+        return (_rebuild_validation_result, (self.index, self.validated_data, self.errors))
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(index={self.index}, is_valid={self.is_valid}, error_count={len(self.errors)})"
+
+
+def _rebuild_validation_result(index: int, validated_data: Optional[Dict[str, Any]], errors: List[Error], /) -> ValidationResult:
+    """Re-builds a validation result from the tuple of attributes returned by `ValidationResult.__reduce__()`"""
+    return ValidationResult(index=index, validated_data=validated_data, errors=errors)
@@ -0,0 +1,182 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+import importlib
+import itertools
+import os
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type
+
+from valcheck.models import ValidationResult
+from valcheck.validators import Validator
+
+
+# State of a worker process (set once per worker by `_initialise_worker()`)
+_worker_validator_model: Optional[Type[Validator]] = None
+_worker_context: Optional[Dict[str, Any]] = None
+
+
+def _import_validator_model(module_name: str, qualified_name: str, /) -> Type[Validator]:
+    obj: Any = importlib.import_module(module_name)
+    for attr in qualified_name.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _initialise_worker(module_name: str, qualified_name: str, context: Optional[Dict[str, Any]], /) -> None:
+    """Imports the validator model once per worker process (instead of pickling it along with every chunk)"""
+    global _worker_validator_model, _worker_context
+    _worker_validator_model = _import_validator_model(module_name, qualified_name)
+    _worker_context = context
+
+
+def _validate_chunk(start_index: int, chunk: List[Any], /) -> List[ValidationResult]:
+    """Validates a chunk of records (in a worker process)"""
+    validator_model = _worker_validator_model
+    context = _worker_context
+    prefetched_lookups = validator_model._prefetch_lookups(chunk)
+    return [
+        validator_model._validate_record(
+            record,
+            index=start_index + offset,
+            context=context,
+            prefetched_lookups=prefetched_lookups,
+        )
+        for offset, record in enumerate(chunk)
+    ]
+
+
+def _iter_chunks(records: Iterable[Any], /, *, chunk_size: int) -> Iterator[Tuple[int, List[Any]]]:
+    """Yields tuple of `(start_index, chunk)` for each chunk of records"""
+    iterator = iter(records)
+    start_index = 0
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield (start_index, chunk)
+        start_index += len(chunk)
+
+
+def _cancel_futures(futures: Iterable[Future], /) -> None:
+    """
+    Cancels the given futures (the ones that have not started running), so that the executor does not validate the chunks
+    whose results will not be consumed. Same as `executor.shutdown(cancel_futures=True)`, which needs Python 3.9+.
+    """
+    for future in futures:
+        future.cancel()
+
+
+def _iter_results_ordered(
+        executor: ProcessPoolExecutor,
+        chunks: Iterable[Tuple[int, List[Any]]],
+        /,
+        *,
+        max_pending_chunks: int,
+    ) -> Iterator[ValidationResult]:
+    pending: Deque[Future] = deque()
+    try:
+        for start_index, chunk in chunks:
+            pending.append(executor.submit(_validate_chunk, start_index, chunk))
+            if len(pending) >= max_pending_chunks:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        _cancel_futures(pending)
+
+
+def _iter_results_unordered(
+        executor: ProcessPoolExecutor,
+        chunks: Iterable[Tuple[int, List[Any]]],
+        /,
+        *,
+        max_pending_chunks: int,
+    ) -> Iterator[ValidationResult]:
+    pending: Set[Future] = set()
+    try:
+        for start_index, chunk in chunks:
+            pending.add(executor.submit(_validate_chunk, start_index, chunk))
+            if len(pending) >= max_pending_chunks:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    finally:
+        _cancel_futures(pending)
+
+
+def validate_in_parallel(
+        records: Iterable[Dict[str, Any]],
+        /,
+        *,
+        validator_model: Type[Validator],
+        context: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = 1000,
+        max_workers: Optional[int] = None,
+        ordered: Optional[bool] = True,
+        mp_context: Optional[Any] = None,
+    ) -> Iterator[ValidationResult]:
+    """
+    Validates the given records across a pool of worker processes, and lazily yields one `valcheck.models.ValidationResult`
+    per record. Meant for CPU-bound validation of very large batches of records.
+
+    The records are consumed in chunks, and only a bounded number of chunks are in flight at any time, so a generator
+    can be passed in to keep the memory usage flat. Each worker imports the `validator_model` once (it must be importable,
+    i.e; defined at the top-level of a module), and validates each chunk via `Validator.validate_many()` semantics.
+
+    Parameters:
+        - records (Iterable[Dict[str, Any]]): Iterable of records (dictionaries) to validate. Must be picklable.
+        - validator_model (Type[Validator]): The validator model used to validate each record.
+        - context (Dict[str, Any]): Dictionary having the context used for validations. Sent once to each worker.
+        - chunk_size (int): Count of records sent to a worker at a time. Default: 1000.
+        - max_workers (int): Count of worker processes. Defaults to the count of CPUs.
+        - ordered (bool): If `ordered=True`, yields the results in the order of the records; otherwise yields them as soon as
+        each chunk is validated (the `index` of each result can be used to map it back to its record). Default: True.
+        - mp_context: Multiprocessing context used to start the workers (optional). Refer to `concurrent.futures.ProcessPoolExecutor`.
+    """
+    assert validator_model is not Validator and issubclass(validator_model, Validator), (
+        "Param `validator_model` must be a sub-class of `valcheck.validators.Validator`"
+    )
+    assert "<locals>" not in validator_model.__qualname__, (
+        "Param `validator_model` must be importable by the worker processes, i.e; it must be defined at the top-level of a module"
+    )
+    assert isinstance(chunk_size, int) and chunk_size >= 1, "Param `chunk_size` must be an integer >= 1"
+    assert max_workers is None or (isinstance(max_workers, int) and max_workers >= 1), "Param `max_workers` must be an integer >= 1"
+    assert isinstance(ordered, bool), "Param `ordered` must be of type 'bool'"
+    return _validate_in_parallel(
+        records,
+        validator_model=validator_model,
+        context=context,
+        chunk_size=chunk_size,
+        num_workers=max_workers or os.cpu_count() or 1,
+        ordered=ordered,
+        mp_context=mp_context,
+    )
+
+
+def _validate_in_parallel(
+        records: Iterable[Dict[str, Any]],
+        /,
+        *,
+        validator_model: Type[Validator],
+        context: Optional[Dict[str, Any]],
+        chunk_size: int,
+        num_workers: int,
+        ordered: bool,
+        mp_context: Optional[Any],
+    ) -> Iterator[ValidationResult]:
+    """Generator that does the work of `validate_in_parallel()` (whose params are checked before the generator is created)"""
+    executor = ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=mp_context,
+        initializer=_initialise_worker,
+        initargs=(validator_model.__module__, validator_model.__qualname__, context),
+    )
+    chunks = _iter_chunks(records, chunk_size=chunk_size)
+    iter_results = _iter_results_ordered if ordered else _iter_results_unordered
+    try:
+        yield from iter_results(executor, chunks, max_pending_chunks=2 * num_workers)
+    finally:
+        executor.shutdown(wait=True)
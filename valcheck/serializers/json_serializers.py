@@ -1,30 +1,104 @@
+import copy
 from datetime import date, datetime
-from typing import Any, Callable, Dict, Optional, Type, Union
+import json
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Type, Union
 from uuid import UUID
 
 from valcheck import utils
 from valcheck.meta_classes import Singleton
 
+try:
+    import orjson  # Optional dependency (used as the opt-in "orjson" backend of `JsonSerializer.to_json_bytes()`, if installed)
+except ImportError:
+    orjson = None
+
+
+def _encode_compact_json_via_json(obj: Any, /) -> bytes:
+    try:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates (Eg: "\ud800") cannot be encoded as UTF-8, so non-ASCII characters are escaped instead
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
+
+
+def _raise_not_json_serializable(obj: Any, /) -> Any:
+    if isinstance(obj, float):
+        return float(obj)  # Subclasses of float (encoded natively by the `json` module)
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def _encode_compact_json_via_orjson(obj: Any, /) -> bytes:
+    return orjson.dumps(
+        obj,
+        default=_raise_not_json_serializable,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+    )
+
+
+# Backends of `JsonSerializer.to_json_bytes()`, i.e; callables that take in a JSON serializable object, and return
+# the compact JSON (UTF-8 encoded bytes). The "orjson" backend is available only if the `orjson` package is installed.
+JSON_BYTES_BACKENDS: Dict[str, Callable[[Any], bytes]] = {
+    "json": _encode_compact_json_via_json,
+}
+if orjson is not None:
+    JSON_BYTES_BACKENDS["orjson"] = _encode_compact_json_via_orjson
+
+
+# Sentinel for the types that are missing from the cache of resolved serializers
+_MISSING = object()
+
 
 class JsonSerializer:
     """Class that represents a JSON serializer."""
 
-    def __init__(self, *, include_default_serializers: Optional[bool] = False) -> None:
+    def __init__(
+            self,
+            *,
+            include_default_serializers: Optional[bool] = False,
+            parse_json_strings: Optional[bool] = True,
+        ) -> None:
+        """
+        Parameters:
+            - include_default_serializers (bool): True if the default serializers must be registered, else False. Default: False
+            - parse_json_strings (bool): Used only if `include_default_serializers=True`. If True, the default serializers include
+            one for strings, which converts each string containing a JSON object/array into the respective Python object
+            (strings are left as-is otherwise). Set to False to skip said check, which makes serialization of string-heavy
+            objects faster. Default: True
+        """
         assert isinstance(include_default_serializers, bool), "Param `include_default_serializers` must be of type 'bool'"
+        assert isinstance(parse_json_strings, bool), "Param `parse_json_strings` must be of type 'bool'"
         self._json_serializable_mapper: Dict[Type, Callable] = {}
+        # Cache having keys = types seen so far, and values = the serializer resolved for said type (via its MRO), or `None`
+        # if the values of said type need no conversion. Cleared whenever serializers are registered.
+        self._resolved_serializers: Dict[Type, Optional[Callable]] = {}
         if include_default_serializers:
-            self._register_default_serializers_by_type()
+            self._register_default_serializers_by_type(parse_json_strings=parse_json_strings)
 
-    def _register_default_serializers_by_type(self) -> None:
-        self.register_serializers_by_type({
+    def _register_default_serializers_by_type(self, *, parse_json_strings: Optional[bool] = True) -> None:
+        mapper: Dict[Type, Callable] = {
             bytes: lambda value: str(value),
             date: lambda value: value.strftime("%Y-%m-%d"),
             datetime: lambda value: value.strftime("%Y-%m-%d %H:%M:%S.%f%z"),
             set: lambda value: list(value),
-            str: lambda value: self.from_json_string(value) if utils.is_valid_json_object_or_array(value) else value,
             tuple: lambda value: list(value),
             UUID: lambda value: str(value),
-        })
+        }
+        if parse_json_strings:
+            mapper[str] = self._parse_json_object_or_array_string
+        self.register_serializers_by_type(mapper)
+
+    def _parse_json_object_or_array_string(self, value: str, /) -> Any:
+        """
+        Returns the Python object if the given string contains a JSON object/array, else returns the string as-is.
+        The string is parsed at most once, and only if its first non-whitespace character is one of `{` or `[`.
+        """
+        if not utils.might_be_json_object_or_array(value):
+            return value
+        try:
+            parsed_obj = self.from_json_string(value)
+        except Exception:
+            return value
+        return parsed_obj if isinstance(parsed_obj, (dict, list)) else value
 
     def register_serializers_by_type(self, mapper: Dict[Type, Callable], /) -> None:
         """
@@ -32,6 +106,12 @@ class JsonSerializer:
         Internally uses a type-to-callable mapping to convert a Python object (of the given type) to a JSON serializable value.
         Can be used to over-write the default serializers (if any).
 
+        The serializer of a type also applies to its sub-classes (Eg: the serializer of `Enum` applies to `IntEnum` values),
+        unless a serializer is registered for the sub-class itself. The serializer is resolved via the MRO of the value's type,
+        i.e; the most specific registered type wins. Dictionaries and lists are always walked, so serializers registered for
+        `dict` or `list` do not apply (the ones registered for their sub-classes do). Booleans are an exception, wherein the
+        serializer registered for `int` does not apply to them (the one registered for `bool` does).
+
         Params:
             - mapper (dict): Dictionary where keys = the type to serialize, and
             values = the callable that takes in the unserializable value as a param, and returns the serializable value.
@@ -40,6 +120,7 @@ class JsonSerializer:
             assert isinstance(type_, type), "Keys of `mapper` must each be of type 'type'"
             assert callable(callable_), "Values of `mapper` must each be a callable"
         self._json_serializable_mapper.update(mapper)
+        self._resolved_serializers.clear()
 
     def from_json_string(self, s: Union[str, bytes, bytearray], /, **kwargs: Any) -> Any:
         """Converts JSON string into a Python object"""
@@ -49,56 +130,309 @@ class JsonSerializer:
         """Converts Python object into a JSON string after making it JSON serializable"""
         return utils.to_json_string(self.make_json_serializable(obj), **kwargs)
 
+    def to_json_bytes(self, obj: Any, /, *, backend: Union[str, Callable[[Any], bytes]] = "json") -> bytes:
+        """
+        Converts Python object into compact JSON (UTF-8 encoded bytes) after making it JSON serializable.
+        Unlike `to_json_string()`, the JSON has no whitespace (separators are `(",", ":")`), the keys are not sorted, and
+        non-ASCII characters are not escaped. Suitable for HTTP responses.
+
+        Parameters:
+            - backend (str | callable): Either the name of one of the `JSON_BYTES_BACKENDS` (Eg: "json" or "orjson"), or a callable
+            that takes in the JSON serializable object and returns the JSON bytes. Default: "json".
+
+        Note: The "json" backend escapes non-ASCII characters if the object has lone surrogates (Eg: "\\ud800"), since they
+        cannot be encoded as UTF-8.
+
+        Note: The "orjson" backend (faster, but opt-in) rejects the `datetime`/`date`/`time` objects and dataclasses that
+        are left unconverted (like the "json" backend), but differs from it as follows:
+            - Encodes `UUID` objects, enums and numpy arrays natively (the "json" backend rejects them, unless they are `int`/`str` enums).
+            - Accepts `datetime`/`date`/`time`, `UUID` and enum keys in dictionaries (the "json" backend rejects them).
+            - Encodes non-finite floats as `null` (instead of `NaN`/`Infinity`, which are not valid JSON).
+            - Rejects integers that do not fit in 64 bits, and strings with lone surrogates.
+            - Formats some floats differently (Eg: `1e16` instead of `1e+16`).
+        """
+        if isinstance(backend, str):
+            assert backend in JSON_BYTES_BACKENDS, (
+                f"Param `backend` must be one of {list(JSON_BYTES_BACKENDS.keys())} (or a callable), but got '{backend}'"
+            )
+            backend = JSON_BYTES_BACKENDS[backend]
+        assert callable(backend), "Param `backend` must be either the name of a backend, or a callable"
+        return backend(self.make_json_serializable(obj))
+
+    def iter_encode(
+            self,
+            obj: Any,
+            /,
+            *,
+            indent: Optional[Union[int, str]] = None,
+            sort_keys: Optional[bool] = False,
+            ensure_ascii: Optional[bool] = True,
+            allow_nan: Optional[bool] = True,
+        ) -> Iterator[str]:
+        """
+        Lazily encodes the given Python object into JSON, and yields the JSON string in chunks.
+        The registered serializers are applied on the fly (same as `make_json_serializable()`), so neither the JSON serializable
+        copy of the object nor the entire JSON string is held in memory. The memory used is proportional to the nesting depth
+        of the object (and the width of its dictionaries if `sort_keys=True`), rather than to its size.
+
+        The chunks put together are the same as `json.dumps(self.make_json_serializable(obj), **kwargs)`, where
+        kwargs are the given params.
+
+        Parameters:
+            - indent (int | str): Same as the `indent` param of `json.dumps()`. Default: None
+            - sort_keys (bool): Same as the `sort_keys` param of `json.dumps()`. Default: False
+            - ensure_ascii (bool): Same as the `ensure_ascii` param of `json.dumps()`. Default: True
+            - allow_nan (bool): Same as the `allow_nan` param of `json.dumps()`. Default: True
+        """
+        assert indent is None or isinstance(indent, (int, str)), "Param `indent` must be of type 'int' or 'str'"
+        assert isinstance(sort_keys, bool), "Param `sort_keys` must be of type 'bool'"
+        assert isinstance(ensure_ascii, bool), "Param `ensure_ascii` must be of type 'bool'"
+        assert isinstance(allow_nan, bool), "Param `allow_nan` must be of type 'bool'"
+        return _iter_encode(
+            obj,
+            get_serializable_function_of_type=self._get_serializable_function_of_type,
+            indent=" " * indent if isinstance(indent, int) else indent,
+            sort_keys=sort_keys,
+            ensure_ascii=ensure_ascii,
+            allow_nan=allow_nan,
+        )
+
+    def dump(
+            self,
+            obj: Any,
+            fp: IO,
+            /,
+            *,
+            buffer_size: Optional[int] = 65536,
+            encoding: Optional[str] = None,
+            **kwargs: Any,
+        ) -> None:
+        """
+        Encodes the given Python object into JSON (via `iter_encode()`), and writes it to the given file-like object in chunks.
+
+        Parameters:
+            - obj (Any): The Python object.
+            - fp (file-like object): Any object having a `write()` method (Eg: a file, a buffer, or `socket.makefile("wb")`).
+            - buffer_size (int): Approximate size (count of characters) of each chunk written. Default: 65536
+            - encoding (str): If passed, the chunks are encoded into bytes (using said encoding) before being written. Use this
+            for file-like objects opened in binary mode. Default: None
+
+        Accepted kwargs: Same as the params of `iter_encode()`.
+        """
+        assert callable(getattr(fp, "write", None)), "Param `fp` must be a file-like object having a `write()` method"
+        assert isinstance(buffer_size, int) and buffer_size >= 1, "Param `buffer_size` must be an integer >= 1"
+        assert encoding is None or isinstance(encoding, str), "Param `encoding` must be of type 'str'"
+        buffer: List[str] = []
+        buffered_size = 0
+        for chunk in self.iter_encode(obj, **kwargs):
+            buffer.append(chunk)
+            buffered_size += len(chunk)
+            if buffered_size >= buffer_size:
+                data = "".join(buffer)
+                fp.write(data if encoding is None else data.encode(encoding))
+                buffer.clear()
+                buffered_size = 0
+        if buffer:
+            data = "".join(buffer)
+            fp.write(data if encoding is None else data.encode(encoding))
+
     def make_json_serializable(self, obj: Any, /) -> Any:
-        """Returns Python object which is JSON serializable (a new copy is returned)"""
-        obj_copy = utils.make_deep_copy(obj)
-        obj_copy = self._make_json_serializable(obj_copy)
-        return obj_copy
+        """
+        Returns Python object which is JSON serializable (a new copy is returned, and the given `obj` is left unmodified).
+        The object is walked once, building new containers (dictionaries and lists) along the way. Values that need no
+        conversion (Eg: strings, numbers and `None`) are shared with the given `obj`, rather than being copied.
+        """
+        return self._make_json_serializable(obj)
 
     def _get_serializable_function(self, value: Any, /) -> Union[Callable, None]:
         """Returns the serializable function for the given `value`. Returns `None` if the function is not registered."""
-        func: Union[Callable, None] = self._json_serializable_mapper.get(type(value), None)
+        return self._get_serializable_function_of_type(type(value))
+
+    def _get_serializable_function_of_type(self, type_: Type, /) -> Union[Callable, None]:
+        """
+        Returns the serializable function for the values of the given type (resolved via the MRO of the type, and cached).
+        Returns `None` if no function is registered for the type (or any of its base classes).
+        """
+        try:
+            return self._resolved_serializers[type_]
+        except KeyError:
+            pass
+        func: Union[Callable, None] = None
+        is_bool_type = issubclass(type_, bool)
+        for class_ in type_.__mro__:
+            if class_ is dict or class_ is list:
+                break
+            if class_ is int and is_bool_type:
+                continue  # booleans are not serialized as integers
+            func = self._json_serializable_mapper.get(class_, None)
+            if func is not None:
+                break
+        self._resolved_serializers[type_] = func
         return func
 
     def _make_json_serializable(self, obj: Any, /) -> Any:
-        """Returns Python object which is JSON serializable. Modifies the given `obj` in-place."""
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if isinstance(value, dict):
-                    obj[key] = self._make_json_serializable(value)
-                elif isinstance(value, list):
-                    obj[key] = self._make_json_serializable(value)
-                else:
-                    func = self._get_serializable_function(value)
-                    if not func:
-                        continue
-                    obj[key] = func(value)
-                    if isinstance(obj[key], (dict, list)):
-                        obj[key] = self._make_json_serializable(obj[key])
-        elif isinstance(obj, list):
-            for idx, item in enumerate(obj):
-                if isinstance(item, dict):
-                    obj[idx] = self._make_json_serializable(item)
-                elif isinstance(item, list):
-                    obj[idx] = self._make_json_serializable(item)
+        """
+        Returns Python object which is JSON serializable. Does not modify the given `obj`.
+        Dictionaries and lists are always walked. Their sub-classes are walked too, unless a serializer is registered for them.
+        """
+        resolved_serializers_get = self._resolved_serializers.get
+        get_serializable_function_of_type = self._get_serializable_function_of_type
+
+        def walk(value: Union[dict, list], /) -> Union[dict, list]:
+            type_ = type(value)
+            if type_ is dict:
+                return {key: convert(item) for key, item in value.items()}
+            if type_ is list:
+                return [convert(item) for item in value]
+            value_copy = copy.copy(value)  # keeps the sub-class of `dict` / `list`
+            for key, item in (value.items() if isinstance(value, dict) else enumerate(value)):
+                value_copy[key] = convert(item)
+            return value_copy
+
+        def convert(value: Any, /) -> Any:
+            type_ = type(value)
+            if type_ is dict:
+                return {key: convert(item) for key, item in value.items()}
+            if type_ is list:
+                return [convert(item) for item in value]
+            func = resolved_serializers_get(type_, _MISSING)
+            if func is _MISSING:
+                func = get_serializable_function_of_type(type_)
+            if func is not None:
+                value = func(value)
+            elif not isinstance(value, (dict, list)):
+                return value
+            return walk(value) if isinstance(value, (dict, list)) else value
+
+        return convert(obj)
+
+
+def _iter_encode(
+        obj: Any,
+        /,
+        *,
+        get_serializable_function_of_type: Callable[[Type], Optional[Callable]],
+        indent: Optional[str],
+        sort_keys: bool,
+        ensure_ascii: bool,
+        allow_nan: bool,
+    ) -> Iterator[str]:
+    """
+    Generator that yields the JSON string of the given object in chunks (refer to `JsonSerializer.iter_encode()`).
+    Mirrors the pure-Python encoder of the `json` module, with the serializers (resolved via the given function) applied to each
+    value (same as `JsonSerializer.make_json_serializable()`). Tuples (that no serializer converts) are not walked by
+    `make_json_serializable()`, so the values within them are encoded as-is.
+    """
+    encode_string = json.encoder.encode_basestring_ascii if ensure_ascii else json.encoder.encode_basestring
+    item_separator = "," if indent is not None else ", "
+    key_separator = ": "
+    markers = set()
+
+    def convert(value: Any, /) -> Any:
+        type_ = type(value)
+        if type_ is dict or type_ is list:
+            return value
+        func = get_serializable_function_of_type(type_)
+        return value if func is None else func(value)
+
+    def encode_float(value: float, /) -> str:
+        if value != value:
+            text = "NaN"
+        elif value == float("inf"):
+            text = "Infinity"
+        elif value == float("-inf"):
+            text = "-Infinity"
+        else:
+            return float.__repr__(value)
+        if not allow_nan:
+            raise ValueError(f"Out of range float values are not JSON compliant: {value!r}")
+        return text
+
+    def encode_scalar(value: Any, /) -> Optional[str]:
+        """Returns the JSON string of the given (converted) value, or `None` if the value is a container"""
+        if isinstance(value, str):
+            return encode_string(value)
+        if value is None:
+            return "null"
+        if value is True:
+            return "true"
+        if value is False:
+            return "false"
+        if isinstance(value, int):
+            return int.__repr__(value)
+        if isinstance(value, float):
+            return encode_float(value)
+        if isinstance(value, (list, tuple, dict)):
+            return None
+        raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
+
+    def encode_key(key: Any, /) -> str:
+        if isinstance(key, str):
+            return encode_string(key)
+        if key is True or key is False or key is None or isinstance(key, (int, float)):
+            return encode_string(encode_scalar(key))
+        raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+    def enter(container: Any, /) -> None:
+        marker_id = id(container)
+        if marker_id in markers:
+            raise ValueError("Circular reference detected")
+        markers.add(marker_id)
+
+    def iter_container(container: Any, level: int, is_raw: bool, /) -> Iterator[str]:
+        """
+        Yields the JSON string of the given container in chunks. The items of a raw container (a tuple, or any container
+        within a tuple) are encoded as-is, since `make_json_serializable()` does not walk tuples.
+        """
+        is_dict = isinstance(container, dict)
+        if not container:
+            yield "{}" if is_dict else "[]"
+            return
+        enter(container)
+        if indent is not None:
+            newline_indent = "\n" + indent * (level + 1)
+            separator = item_separator + newline_indent
+            opening = ("{" if is_dict else "[") + newline_indent
+            closing = "\n" + indent * level + ("}" if is_dict else "]")
+        else:
+            separator = item_separator
+            opening = "{" if is_dict else "["
+            closing = "}" if is_dict else "]"
+        prefix = opening
+        if is_dict:
+            items = sorted(container.items()) if sort_keys else container.items()
+            for key, value in items:
+                if not is_raw:
+                    value = convert(value)
+                chunk = encode_scalar(value)
+                if chunk is not None:
+                    yield prefix + encode_key(key) + key_separator + chunk
                 else:
-                    func = self._get_serializable_function(item)
-                    if not func:
-                        continue
-                    obj[idx] = func(item)
-                    if isinstance(obj[idx], (dict, list)):
-                        obj[idx] = self._make_json_serializable(obj[idx])
+                    yield prefix + encode_key(key) + key_separator
+                    yield from iter_container(value, level + 1, is_raw or isinstance(value, tuple))
+                prefix = separator
         else:
-            func = self._get_serializable_function(obj)
-            if func:
-                obj = func(obj)
-                if isinstance(obj, (dict, list)):
-                    obj = self._make_json_serializable(obj)
-        return obj
+            for value in container:
+                if not is_raw:
+                    value = convert(value)
+                chunk = encode_scalar(value)
+                if chunk is not None:
+                    yield prefix + chunk
+                else:
+                    yield prefix
+                    yield from iter_container(value, level + 1, is_raw or isinstance(value, tuple))
+                prefix = separator
+        yield closing
+        markers.discard(id(container))
+
+    obj = convert(obj)
+    chunk = encode_scalar(obj)
+    if chunk is not None:
+        yield chunk
+    else:
+        yield from iter_container(obj, 0, isinstance(obj, tuple))
 
 
 class JsonSerializerSingleton(JsonSerializer, metaclass=Singleton):
     """Class that represents a JSON serializer which is a singleton."""
     pass
-
-
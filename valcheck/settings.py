@@ -0,0 +1,38 @@
+"""
+Global settings of valcheck.
+
+Production mode:
+    By default, valcheck runs internal consistency checks on its hot paths (Eg: that the `errors` of a `ValidatedField`
+    are of type `valcheck.models.Error`, that the custom `validators` of a field return a boolean (checked the first time
+    each of them is called), and that the output of `model_validator()` is a list of errors). These checks catch mistakes
+    made while writing validators, and never affect the outcome of validating the data.
+
+    In production mode, said checks are skipped, which makes validation faster. Every data-validation check is still
+    performed, so the validated data and errors are the same as in the default mode. The checks of the arguments passed
+    in by users (Eg: to the constructor and setters of `valcheck.models.Error`) are always performed.
+    Unlike `python -O`, production mode only affects valcheck (the assertions of other libraries are left as-is).
+
+    Production mode can be enabled either by setting the environment variable `VALCHECK_PRODUCTION_MODE=1` (read when
+    valcheck is imported), or by calling `valcheck.settings.set_production_mode(True)`.
+"""
+
+import os
+
+
+_TRUTHY_VALUES = frozenset(["1", "true", "yes", "on"])
+
+# True if the internal consistency checks must be run (i.e; production mode is disabled).
+# Read via `settings.CHECK_INTERNAL_INVARIANTS` (not imported by name), so that changes made at runtime are picked up.
+CHECK_INTERNAL_INVARIANTS: bool = os.environ.get("VALCHECK_PRODUCTION_MODE", "").strip().lower() not in _TRUTHY_VALUES
+
+
+def set_production_mode(enabled: bool, /) -> None:
+    """Enables/disables production mode, wherein the internal consistency checks are skipped"""
+    global CHECK_INTERNAL_INVARIANTS
+    assert isinstance(enabled, bool), "Param `enabled` must be of type 'bool'"
+    CHECK_INTERNAL_INVARIANTS = not enabled
+
+
+def is_production_mode() -> bool:
+    """Returns True if production mode is enabled, else False"""
+    return not CHECK_INTERNAL_INVARIANTS
@@ -0,0 +1,168 @@
+import codecs
+import io
+import os
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Tuple, Type, Union
+
+from valcheck.models import Error, ErrorBudget, ValidationResult
+from valcheck import utils
+from valcheck.validators import Validator
+
+
+JsonLinesSource = Union[str, os.PathLike, IO[bytes], IO[str]]
+
+
+def _is_ascii_compatible_encoding(encoding: Optional[str], /) -> bool:
+    """
+    Checks if the given encoding is ASCII compatible (Eg: UTF-8, Latin-1), i.e; the newline is the single byte `b"\\n"`, so
+    that the raw bytes can be split into lines. Returns False for encodings like UTF-16 and UTF-32.
+    """
+    if encoding is None:
+        return False
+    try:
+        return "a\n".encode(encoding).endswith(b"a\n")
+    except (LookupError, UnicodeError):
+        return False
+
+
+def _get_binary_stream(fp: Union[IO[bytes], IO[str]], /) -> Tuple[Union[IO[bytes], IO[str]], Optional[str]]:
+    """
+    Returns tuple of `(stream, encoding)`.
+    For a text-mode file object that wraps a binary stream (Eg: a file opened via `open(path, mode="r")`) having an ASCII
+    compatible encoding, returns said binary stream along with the encoding of the text, so that the byte offsets are those of
+    the raw bytes (newline translation and the encoding of the file do not affect them). Otherwise returns the given file
+    object as-is, and `None`.
+    """
+    buffer = getattr(fp, "buffer", None)
+    if isinstance(fp, io.TextIOBase) and buffer is not None and _is_ascii_compatible_encoding(fp.encoding):
+        return (buffer, fp.encoding)
+    return (fp, None)
+
+
+def _iter_lines_with_byte_offsets(
+        lines: Iterable[Union[bytes, str]],
+        /,
+        *,
+        encoding: Optional[str] = None,
+    ) -> Iterator[Tuple[int, int, Union[bytes, str]]]:
+    """
+    Yields tuple of `(line_number, byte_offset, line)` for each line.
+    The byte offset of a line of a text stream is computed from its encoding (via the given `encoding`, which defaults to UTF-8).
+    """
+    encoder = codecs.getincrementalencoder(encoding or "utf-8")()
+    byte_offset = 0
+    for line_idx, line in enumerate(lines):
+        yield (line_idx + 1, byte_offset, line)
+        byte_offset += len(line) if isinstance(line, bytes) else len(encoder.encode(line))
+
+
+def _add_location_to_errors(errors: Iterable[Error], /, *, line_number: int, byte_offset: int) -> None:
+    """Adds the location of the line to the `details` of each error (in-place)"""
+    for error in errors:
+        error.details = {
+            **error.details,
+            "line_number": line_number,
+            "byte_offset": byte_offset,
+        }
+
+
+def _validate_json_line(
+        line: Union[bytes, str],
+        /,
+        *,
+        validator_model: Type[Validator],
+        line_number: int,
+        byte_offset: int,
+        context: Optional[Dict[str, Any]] = None,
+        error_budget: Optional[ErrorBudget] = None,
+        encoding: Optional[str] = None,
+    ) -> ValidationResult:
+    index = line_number - 1
+    try:
+        if encoding is not None and isinstance(line, bytes):
+            line = line.decode(encoding)
+        record = utils.from_json_string(line)
+    except ValueError as exc:
+        error = Error()
+        error.validator_message = f"Invalid JSON line || {exc}"
+        result = ValidationResult(index=index, validated_data=None, errors=[error])
+        if error_budget is not None:
+            error_budget.update(result.errors, num_errors_before=error_budget.num_errors)
+    else:
+        result = validator_model._validate_record(record, index=index, context=context, error_budget=error_budget)
+    _add_location_to_errors(result.errors, line_number=line_number, byte_offset=byte_offset)
+    return result
+
+
+def _validate_json_lines(
+        lines: Iterable[Union[bytes, str]],
+        /,
+        *,
+        validator_model: Type[Validator],
+        context: Optional[Dict[str, Any]] = None,
+        max_errors: Optional[int] = None,
+        encoding: Optional[str] = None,
+    ) -> Iterator[ValidationResult]:
+    error_budget = ErrorBudget(max_errors=max_errors)
+    for line_number, byte_offset, line in _iter_lines_with_byte_offsets(lines, encoding=encoding):
+        if not line.strip():
+            continue
+        yield _validate_json_line(
+            line,
+            validator_model=validator_model,
+            line_number=line_number,
+            byte_offset=byte_offset,
+            context=context,
+            error_budget=error_budget,
+            encoding=encoding,
+        )
+        if error_budget.is_exhausted:
+            return
+
+
+def validate_json_lines(
+        source: JsonLinesSource,
+        /,
+        *,
+        validator_model: Type[Validator],
+        context: Optional[Dict[str, Any]] = None,
+        max_errors: Optional[int] = None,
+    ) -> Iterator[ValidationResult]:
+    """
+    Validates a JSON Lines (NDJSON) file line by line against the given `validator_model`, and lazily yields one
+    `valcheck.models.ValidationResult` per (non-blank) line. Only one line is held in memory at a time.
+
+    The `index` of each result is the 0-based index of the line (i.e; `line_number - 1`), and the `details` of each error
+    include the `line_number` (starts from 1) and the `byte_offset` (of the start of the line).
+    Lines that are not valid JSON, or that are not JSON objects, are reported as errors.
+
+    Parameters:
+        - source (str | PathLike | file object): Path to the file, or a file object opened in binary mode (recommended) or text mode.
+        A text-mode file object having an ASCII compatible encoding (Eg: UTF-8) is read via its underlying binary stream
+        (its `buffer`), so the byte offsets are those of the raw bytes of the file, and it must not have been partially read.
+        Other text streams (Eg: `io.StringIO`, or files encoded as UTF-16) are read line by line, and the byte offsets are
+        computed from the encoding of the stream (UTF-8 if it has none) after the newline translation of each line.
+        - validator_model (Type[Validator]): The validator model used to validate each line.
+        - context (Dict[str, Any]): Dictionary having the context used for validations (shared by all lines).
+        - max_errors (int): If passed, stops once the total count of errors (across all lines) reaches `max_errors`. The error
+        budget is shared by all the lines (and their nested validators), so the total count of errors never exceeds `max_errors`.
+    """
+    assert validator_model is not Validator and issubclass(validator_model, Validator), (
+        "Param `validator_model` must be a sub-class of `valcheck.validators.Validator`"
+    )
+    assert max_errors is None or (isinstance(max_errors, int) and max_errors >= 1), (
+        "Param `max_errors` must be an integer >= 1"
+    )
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, mode="rb") as fp:
+            yield from _validate_json_lines(fp, validator_model=validator_model, context=context, max_errors=max_errors)
+        return
+    stream, encoding = _get_binary_stream(source)
+    if encoding is None and isinstance(source, io.TextIOBase):
+        encoding = getattr(source, "encoding", None)  # Used to compute the byte offsets of the lines of the text stream
+    yield from _validate_json_lines(
+        stream,
+        validator_model=validator_model,
+        context=context,
+        max_errors=max_errors,
+        encoding=encoding,
+    )
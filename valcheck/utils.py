@@ -5,6 +5,8 @@ import re
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from uuid import UUID
 
+from valcheck.date_parsers import get_date_string_parser, get_datetime_string_parser
+
 
 class Empty:
     """Class used to denote an empty/missing value"""
@@ -142,6 +144,33 @@ def is_empty_value_allowed(obj: Any, /, *, allow_empty: Optional[bool] = True) -
     return True if allow_empty else bool(obj)
 
 
+def is_within_bounds(value: Any, /, *, min_value: Optional[Any] = None, max_value: Optional[Any] = None) -> bool:
+    """
+    Returns True if `min_value <= value <= max_value` (the bounds that are `None` are not checked).
+    The comparisons are negated (instead of using `<` and `>`), so that values which are not comparable with the bounds
+    (Eg: `float("nan")`) are out of bounds.
+    """
+    if min_value is not None and not (min_value <= value):
+        return False
+    if max_value is not None and not (value <= max_value):
+        return False
+    return True
+
+
+def make_bounds_message(*, min_value: Optional[Any] = None, max_value: Optional[Any] = None, subject: Optional[str] = "") -> str:
+    """
+    Returns the message that describes the given bounds.
+    Eg: `make_bounds_message(min_value=1, max_value=10, subject="Length")` returns "Length must be >= 1 and <= 10".
+    """
+    conditions = []
+    if min_value is not None:
+        conditions.append(f">= {min_value}")
+    if max_value is not None:
+        conditions.append(f"<= {max_value}")
+    message = "Must be " if not subject else f"{subject} must be "
+    return message + " and ".join(conditions)
+
+
 def integerify_if_possible(value: Union[int, float], /) -> Union[int, float]:
     value_as_int = int(value)
     return value_as_int if value == value_as_int else value
@@ -245,15 +274,8 @@ def validate_date_string(value: Any, format_: str, /) -> Tuple[Union[date, None]
     Returns tuple of `(date_obj, is_valid)`.
     If the date string is not valid, always returns `(None, False)`.
     """
-    if not isinstance(value, str):
-        return (None, False)
-    try:
-        date_obj = datetime.strptime(value, format_).date()
-        is_valid = date_obj.strftime(format_) == value
-    except Exception:
-        return (None, False)
-    else:
-        return (date_obj, True) if is_valid else (None, False)
+    date_obj = get_date_string_parser(format_).parse(value)
+    return (date_obj, True) if date_obj is not None else (None, False)
 
 
 def is_valid_date_string(value: Any, format_: str, /) -> bool:
@@ -374,11 +396,8 @@ def validate_datetime_string(
         - raise_if_tz_uncomparable (bool): If set to `True`, raises `ValueError` if the given datetime string is timezone-naive and
         the param `allowed_tz_names` is passed in, since we cannot check if a timezone-naive datetime string belongs to a particular timezone.
     """
-    if not isinstance(value, str):
-        return (None, False)
-    try:
-        datetime_obj = datetime.strptime(value, format_)
-    except Exception:
+    datetime_obj = get_datetime_string_parser(format_).parse(value)
+    if datetime_obj is None:
         return (None, False)
     if allowed_tz_names:
         if not is_timezone_aware(datetime_obj):
@@ -447,7 +466,29 @@ def is_valid_json_string(value: Any, /) -> bool:
     return is_valid
 
 
+# Characters that are considered whitespace by the JSON spec (the only ones allowed before a JSON value)
+_JSON_WHITESPACE_CHARS = " \t\n\r"
+
+
+def _get_first_json_char(value: str, /) -> str:
+    """Returns the first non-whitespace character of the given string (empty string if there is none)"""
+    first_char = value[:1]
+    if first_char and first_char in _JSON_WHITESPACE_CHARS:
+        return value.lstrip(_JSON_WHITESPACE_CHARS)[:1]
+    return first_char
+
+
+def might_be_json_object_or_array(value: Any, /) -> bool:
+    """
+    Cheap pre-check that returns `False` if the given value is definitely not a string containing a JSON object or JSON array,
+    i.e; if its first non-whitespace character is not one of `{` or `[`. Does not parse the string.
+    """
+    return isinstance(value, str) and _get_first_json_char(value) in ("{", "[")
+
+
 def validate_json_object(value: Any, /) -> Tuple[Union[dict, None], bool]:
+    if not isinstance(value, str) or _get_first_json_char(value) != "{":
+        return (None, False)
     parsed_obj, is_valid = validate_json_string(value)
     if is_valid and isinstance(parsed_obj, dict):
         return (parsed_obj, True)
@@ -461,6 +502,8 @@ def is_valid_json_object(value: Any, /) -> bool:
 
 
 def validate_json_array(value: Any, /) -> Tuple[Union[list, None], bool]:
+    if not isinstance(value, str) or _get_first_json_char(value) != "[":
+        return (None, False)
     parsed_obj, is_valid = validate_json_string(value)
     if is_valid and isinstance(parsed_obj, list):
         return (parsed_obj, True)
@@ -474,6 +517,8 @@ def is_valid_json_array(value: Any, /) -> bool:
 
 
 def validate_json_object_or_array(value: Any, /) -> Tuple[Union[dict, list, None], bool]:
+    if not might_be_json_object_or_array(value):
+        return (None, False)
     parsed_obj, is_valid = validate_json_string(value)
     if is_valid and (isinstance(parsed_obj, dict) or isinstance(parsed_obj, list)):
         return (parsed_obj, True)
@@ -1,8 +1,25 @@
 from __future__ import annotations
 
+import itertools
 import string
-from typing import Any, Callable, Dict, List, Literal, Optional, Type, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
+from valcheck.compiler import CompiledFieldValidator, compile_field_validator
 from valcheck.exceptions import (
     DuplicateSourcesException,
     DuplicateTargetsException,
@@ -10,15 +27,91 @@ from valcheck.exceptions import (
     MissingFieldException,
     ValidationException,
 )
-from valcheck.fields import Field, ModelDictionaryField, ModelListField
-from valcheck.models import Error
-from valcheck import utils
+from valcheck.fields import Field, LookupField, ModelDictionaryField, ModelListField
+from valcheck.lookups import PrefetchedLookups
+from valcheck.models import Error, ErrorBudget, ValidationResult
+from valcheck import settings, utils
+
+
+class SchemaPlan:
+    """
+    Class that represents the compiled field plan of a validator class.
+    Built once per class (at class-creation time), and shared by all instances of said class.
+    """
+
+    def __init__(self, *, field_info: Dict[str, Field], compiled: Optional[bool] = False, name: Optional[str] = None) -> None:
+        """
+        Parameters:
+            - field_info (Dict[str, Field]): Dictionary having keys = field identifiers, and values = bound field instances.
+            The field instances must already have their `field_identifier`, `source` and `target` set.
+            - compiled (bool): If `compiled=True`, generates a specialized function that validates all the fields.
+            Refer to `valcheck.compiler.compile_field_validator()`.
+            - name (str): Name of the validator class (used to identify the generated function).
+        """
+        assert isinstance(compiled, bool), "Param `compiled` must be of type 'bool'"
+        self._field_info: Mapping[str, Field] = MappingProxyType(dict(field_info))
+        self._fields: Tuple[Field, ...] = tuple(field_info.values())
+        self._source_to_field: Mapping[str, Field] = MappingProxyType({field.source: field for field in self._fields})
+        self._target_to_field: Mapping[str, Field] = MappingProxyType({field.target: field for field in self._fields})
+        self._sources: FrozenSet[str] = frozenset(self._source_to_field.keys())
+        self._lookup_fields: Tuple[LookupField, ...] = tuple(field for field in self._fields if isinstance(field, LookupField))
+        self._compiled_field_validator: Optional[CompiledFieldValidator] = (
+            compile_field_validator(field_info, name=name or "") if compiled else None
+        )
+
+    @property
+    def field_info(self) -> Mapping[str, Field]:
+        """Read-only mapping having keys = field identifiers, and values = bound field instances (in order of declaration)"""
+        return self._field_info
+
+    @property
+    def fields(self) -> Tuple[Field, ...]:
+        return self._fields
+
+    @property
+    def field_identifiers(self) -> Tuple[str, ...]:
+        return tuple(self._field_info.keys())
+
+    @property
+    def source_to_field(self) -> Mapping[str, Field]:
+        return self._source_to_field
+
+    @property
+    def target_to_field(self) -> Mapping[str, Field]:
+        return self._target_to_field
+
+    @property
+    def sources(self) -> FrozenSet[str]:
+        return self._sources
+
+    @property
+    def lookup_fields(self) -> Tuple[LookupField, ...]:
+        """The fields whose lookups are batched when validating many records at once"""
+        return self._lookup_fields
+
+    @property
+    def compiled_field_validator(self) -> Optional[CompiledFieldValidator]:
+        """
+        The generated function that validates all the fields (if the plan is compiled; otherwise `None`).
+        Takes in the data (dictionary) to validate, the error budget (`valcheck.models.ErrorBudget`) and the prefetched lookups
+        (`valcheck.lookups.PrefetchedLookups`, or `None`), and returns tuple of `(validated_data, errors)`.
+        """
+        return self._compiled_field_validator
 
 
 class Validator:
     """
     Class that represents a Validator.
 
+    The fields of a validator class are compiled into a `valcheck.validators.SchemaPlan` once (when the class is created),
+    and are shared (without being copied) by all instances of said class, since fields do not hold any per-run state.
+
+    Sub-classes can opt into the compiled mode via `class MyValidator(Validator, compiled=True)`, wherein a specialized
+    function that validates all the fields is generated for the class (and its sub-classes).
+
+    The per-run state of an instance is held in slots. Sub-classes that do not set any instance attributes of their own
+    can declare `__slots__ = ()` to do away with the instance `__dict__`.
+
     Properties:
         - context
         - data
@@ -34,8 +127,37 @@ class Validator:
         - model_validator()
         - model_validators_to_consider()
         - run_validations()
+
+    Class methods:
+        - get_schema_plan()
+        - validate_many()
     """
 
+    __slots__ = ("_data", "_context", "_errors", "_validated_data", "_is_run_validations_called", "_error_budget")
+
+    _is_compiled: bool = False
+    _has_model_validators: bool = False
+
+    # Count of records whose lookups (of `LookupField` fields) are batched together by `validate_many()`
+    LOOKUP_BATCH_SIZE: int = 1000
+    _schema_plan: SchemaPlan = SchemaPlan(field_info={})
+
+    def __init_subclass__(cls, *, compiled: Optional[bool] = None, **kwargs: Any) -> None:
+        """
+        Parameters:
+            - compiled (bool): If `compiled=True`, validates the fields via a generated function that is specialized for the class.
+            Inherited by sub-classes if not passed.
+        """
+        assert compiled is None or isinstance(compiled, bool), "Param `compiled` must be of type 'bool'"
+        super().__init_subclass__(**kwargs)
+        if compiled is not None:
+            cls._is_compiled = compiled
+        cls._schema_plan = cls._build_schema_plan()
+        cls._has_model_validators = any(
+            class_ is not Validator and issubclass(class_, Validator) and "model_validator" in class_.__dict__
+            for class_ in cls.__mro__
+        )
+
     def __init__(
             self,
             *,
@@ -56,10 +178,168 @@ class Validator:
         context = context if context else {}
         self._data: Dict[str, Any] = utils.make_deep_copy(data) if deep_copy else data
         self._context: Dict[str, Any] = utils.make_deep_copy(context) if deep_copy else context
-        self._field_info: Dict[str, Field] = self._initialise_fields()
         self._errors: List[Error] = []
         self._validated_data: Dict[str, Any] = {}
         self._is_run_validations_called: bool = False
+        self._error_budget: Optional[ErrorBudget] = None  # Set by `run_validations()`
+
+    @classmethod
+    def get_schema_plan(cls) -> SchemaPlan:
+        """Returns the compiled field plan of the validator class"""
+        return cls._schema_plan
+
+    @classmethod
+    def validate_many(
+            cls,
+            records: Iterable[Dict[str, Any]],
+            /,
+            *,
+            context: Optional[Dict[str, Any]] = None,
+            max_errors: Optional[int] = None,
+        ) -> Iterator[ValidationResult]:
+        """
+        Validates each record (dictionary) of the given iterable, and lazily yields one `valcheck.models.ValidationResult`
+        per record (in order). This is the recommended entry point for validating a large batch of records.
+
+        The records are consumed one at a time, so a generator can be passed in to keep the memory usage flat.
+
+        Parameters:
+            - records (Iterable[Dict[str, Any]]): Iterable of records (dictionaries) to validate.
+            - context (Dict[str, Any]): Dictionary having the context used for validations (shared by all records).
+            - max_errors (int): If passed, stops once the total count of errors (across all records) reaches `max_errors`, i.e;
+            the result of the record that exhausts the error budget is the last result to be yielded. The error budget is
+            shared by all the records (and their nested validators), so the total count of errors never exceeds `max_errors`.
+        """
+        assert max_errors is None or (isinstance(max_errors, int) and max_errors >= 1), (
+            "Param `max_errors` must be an integer >= 1"
+        )
+        error_budget = ErrorBudget(max_errors=max_errors)
+        for index, (record, prefetched_lookups) in enumerate(cls._iter_records_with_prefetched_lookups(records)):
+            yield cls._validate_record(
+                record,
+                index=index,
+                context=context,
+                error_budget=error_budget,
+                prefetched_lookups=prefetched_lookups,
+            )
+            if error_budget.is_exhausted:
+                return
+
+    @classmethod
+    def _prefetch_lookups(
+            cls,
+            records: Iterable[Any],
+            /,
+            *,
+            prefetched_lookups: Optional[PrefetchedLookups] = None,
+        ) -> Optional[PrefetchedLookups]:
+        """
+        Looks up the values of all the `LookupField` fields (of the given records) in batches, so that the validation of said
+        records does not look up the values one at a time. Returns the given `prefetched_lookups` (of the enclosing batch, if any)
+        updated with the results (as a new dictionary), which must be passed to the validation of said records.
+        """
+        lookup_fields = cls._schema_plan.lookup_fields
+        if not lookup_fields:
+            return prefetched_lookups
+        records = [record for record in records if isinstance(record, dict)]
+        prefetched_lookups = dict(prefetched_lookups) if prefetched_lookups else {}
+        for field in lookup_fields:
+            source = field.source
+            results = field.index.prefetch(record[source] for record in records if source in record)
+            previous_results = prefetched_lookups.get(field.index)
+            prefetched_lookups[field.index] = {**previous_results, **results} if previous_results else results
+        return prefetched_lookups
+
+    @classmethod
+    def _iter_records_with_prefetched_lookups(
+            cls,
+            records: Iterable[Any],
+            /,
+        ) -> Iterator[Tuple[Any, Optional[PrefetchedLookups]]]:
+        """
+        Yields tuple of `(record, prefetched_lookups)` for each of the given records, wherein the lookups of each batch of
+        `LOOKUP_BATCH_SIZE` records are prefetched (if the class has any `LookupField` fields; otherwise `None`).
+        """
+        if not cls._schema_plan.lookup_fields:
+            for record in records:
+                yield (record, None)
+            return
+        iterator = iter(records)
+        while True:
+            batch = list(itertools.islice(iterator, cls.LOOKUP_BATCH_SIZE))
+            if not batch:
+                return
+            prefetched_lookups = cls._prefetch_lookups(batch)
+            for record in batch:
+                yield (record, prefetched_lookups)
+
+    @classmethod
+    def _validate_record(
+            cls,
+            record: Any,
+            /,
+            *,
+            index: int,
+            context: Optional[Dict[str, Any]] = None,
+            error_budget: Optional[ErrorBudget] = None,
+            prefetched_lookups: Optional[PrefetchedLookups] = None,
+        ) -> ValidationResult:
+        """
+        Validates one record (out of a batch of records), and returns the `valcheck.models.ValidationResult`.
+        The `error_budget` (if passed) is shared by all the records of the batch, and the `prefetched_lookups` (if passed)
+        are those of the batch (refer to `_prefetch_lookups()`).
+        """
+        if not isinstance(record, dict):
+            errors = [cls._create_invalid_record_error()]
+            if error_budget is not None:
+                error_budget.update(errors, num_errors_before=error_budget.num_errors)
+            return ValidationResult(index=index, validated_data=None, errors=errors)
+        validator = cls(data=record, context=context)
+        validator.run_validations(error_budget=error_budget, prefetched_lookups=prefetched_lookups)
+        errors = validator.errors
+        return ValidationResult(index=index, validated_data=None if errors else validator.validated_data, errors=errors)
+
+    @classmethod
+    def is_valid(cls, data: Any, /, *, context: Optional[Dict[str, Any]] = None, **kwargs: Any) -> bool:
+        """
+        Returns True if the given `data` is valid, else False.
+        Gives the same result as `run_validations()`, but does not build the validated-data, and stops at the first invalid
+        field. The fields are checked without building any errors, except the fields having custom validators (or whose class
+        overrides the checks of `Field.validate_entire_field()`), which are checked via their `validate()` method (or their
+        `validate_entire_field()` method), refer to `Field.is_valid_entire_field()`. Useful if you only need to branch on validity.
+
+        If the class (or any of its parent classes) implements the `model_validator()` method, the model validators
+        need the validated-data, so the fields are checked first and then a fail-fast `run_validations()` is performed.
+
+        Parameters:
+            - data (Dict[str, Any]): Dictionary having the data to be validated. Data that is not a dictionary is invalid.
+            - context (Dict[str, Any]): Dictionary having the context used for validations.
+
+        Accepted kwargs:
+            - prefetched_lookups (PrefetchedLookups): The lookups prefetched for the batch of records being validated (used by
+            the nested validators, refer to `valcheck.lookups.PrefetchedLookups`).
+        """
+        if not isinstance(data, dict):
+            return False
+        prefetched_lookups: Optional[PrefetchedLookups] = kwargs.get("prefetched_lookups", None)
+        field_kwargs = {"prefetched_lookups": prefetched_lookups} if prefetched_lookups is not None else {}
+        data_get = data.get
+        empty = utils.set_as_empty()
+        for field in cls._schema_plan.fields:
+            if not field.is_valid_entire_field(data_get(field.source, empty), **field_kwargs):
+                return False
+        if not cls._has_model_validators:
+            return True
+        validator = cls(data=data, context=context)
+        validator.run_validations(fail_fast=True, prefetched_lookups=prefetched_lookups)
+        return not validator.errors
+
+    @classmethod
+    def _create_invalid_record_error(cls) -> Error:
+        """Returns the error used when a record (to be validated by the class) is not a dictionary"""
+        error = Error()
+        error.validator_message = f"Invalid record for '{cls.__name__}' || Record must be a dictionary"
+        return error
 
     @property
     def data(self) -> Dict[str, Any]:
@@ -84,7 +364,7 @@ class Validator:
                     if isinstance(field, (ModelDictionaryField, ModelListField))
                     else []
                 ),
-            } for field_identifier, field in self._field_info.items()
+            } for field_identifier, field in self._schema_plan.field_info.items()
         ]
 
     def _get_field_key_picker(self, *, key: str) -> Callable[[Field], str]:
@@ -113,7 +393,7 @@ class Validator:
         assert isinstance(nullify_values, bool), "Param `nullify_values` must be of type 'bool'"
         field_key_picker = self._get_field_key_picker(key=key)
         representation = {}
-        for _, field in self._field_info.items():
+        for _, field in self._schema_plan.field_info.items():
             field_key = field_key_picker(field)
             if isinstance(field, (ModelDictionaryField, ModelListField)):
                 representation[field_key] = field.sample_value(key=key, nullify_values=nullify_values)
@@ -121,7 +401,8 @@ class Validator:
                 representation[field_key] = None if nullify_values else field.sample_value()
         return representation
 
-    def _validate_field_identifier(self, field_identifier: str, /) -> None:
+    @classmethod
+    def _validate_field_identifier(cls, field_identifier: str, /) -> None:
         """If an invalid field-identifier is found, raises `valcheck.exceptions.InvalidFieldIdentifierException`"""
         error_message = (
             f"Invalid field identifier '{field_identifier}'."
@@ -140,7 +421,8 @@ class Validator:
             if char not in allowed_chars:
                 raise InvalidFieldIdentifierException(error_message)
 
-    def _validate_uniqueness_of_sources_and_targets(self, field_info: Dict[str, Field], /) -> None:
+    @classmethod
+    def _validate_uniqueness_of_sources_and_targets(cls, field_info: Dict[str, Field], /) -> None:
         """
         If duplicate sources/targets are found, raises `valcheck.exceptions.DuplicateSourcesException`
         or `valcheck.exceptions.DuplicateTargetsException`
@@ -156,10 +438,14 @@ class Validator:
         if len(targets) != len(set(targets)):
             raise DuplicateTargetsException(f"Received duplicate values for `target`: {sorted(targets)}")
 
-    def _initialise_fields(self) -> Dict[str, Field]:
-        """Returns dictionary having keys = field identifiers, and values = initialised field instances"""
+    @classmethod
+    def _build_schema_plan(cls) -> SchemaPlan:
+        """
+        Returns the compiled field plan of the validator class.
+        Collects the fields across the class hierarchy, checks their identifiers, and binds a copy of each field to the class.
+        """
         vars_dict: Dict[str, Any] = {}
-        for class_ in reversed(self.__class__.__mro__):
+        for class_ in reversed(cls.__mro__):
             vars_dict.update(**vars(class_))
         field_info = {}
         for field_identifier in vars_dict:
@@ -169,20 +455,29 @@ class Validator:
                 and temp_field.__class__ is not Field
                 and issubclass(temp_field.__class__, Field)
             ):
-                self._validate_field_identifier(field_identifier)
+                cls._validate_field_identifier(field_identifier)
                 field = temp_field.copy()
                 field.field_identifier = field_identifier
                 field.source = field.source if field.source else field_identifier
                 field.target = field.target if field.target else field_identifier
-                field.field_value = self.data.get(field.source, utils.set_as_empty())
                 field_info[field_identifier] = field
-        self._validate_uniqueness_of_sources_and_targets(field_info)
-        return field_info
+        cls._validate_uniqueness_of_sources_and_targets(field_info)
+        return SchemaPlan(field_info=field_info, compiled=cls._is_compiled, name=cls.__name__)
 
     @property
     def errors(self) -> List[Error]:
         return self._errors
 
+    @property
+    def errors_truncated(self) -> bool:
+        """True if some of the errors were not collected, since the error budget (`max_errors`) was exhausted"""
+        return self._error_budget is not None and self._error_budget.is_truncated
+
+    @property
+    def skipped_row_count(self) -> int:
+        """Count of rows (of `ModelListField` fields) that were skipped, since the error budget (`max_errors`) was exhausted"""
+        return self._error_budget.skipped_row_count if self._error_budget is not None else 0
+
     def _clear_errors(self) -> None:
         """Clears out the list of errors"""
         self._errors.clear()
@@ -207,16 +502,8 @@ class Validator:
         Returns dictionary containing the extra data (key-value pairs) which is present in the `data` dictionary, but not a part of
         the fields being validated by the validator.
         """
-        sources = set(
-            filter(
-                None,
-                (
-                    field_instance.source if field_instance.source else None for _, field_instance in self._field_info.items()
-                ),
-            )
-        )
-        extra_keys_in_data = set(self.data.keys()).difference(sources)
-        return { key : value for key, value in self.data.items() if key in extra_keys_in_data }
+        sources = self._schema_plan.sources
+        return { key : value for key, value in self.data.items() if key not in sources }
 
     def get_validated_value(
             self,
@@ -249,31 +536,61 @@ class Validator:
         except (IndexError, KeyError, ValueError) as exc:
             raise MissingFieldException(f"The field target path {path} is missing from the validated data. Error info: {exc}")
 
-    def _perform_field_validation_checks(self, *, field: Field) -> None:
+    def _perform_field_validation_checks(self, *, field: Field, prefetched_lookups: Optional[PrefetchedLookups] = None) -> None:
         """Performs validation checks for the given field, and registers errors (if any) and validated-data"""
-        validated_field = field.validate_entire_field()
-        if validated_field.errors:
-            self._register_errors(errors=validated_field.errors)
+        field_value = self._data.get(field.source, utils.set_as_empty())
+        validated_field = field.validate_entire_field(
+            field_value,
+            error_budget=self._error_budget,
+            prefetched_lookups=prefetched_lookups,
+        )
+        if validated_field._errors:
+            self._errors.extend(validated_field._errors)
             return
-        if not utils.is_empty(validated_field.field.field_value):
-            self._register_validated_data(
-                key=validated_field.field.target,
-                value=validated_field.field.field_value,
-            )
+        if not utils.is_empty(validated_field._field_value):
+            self._validated_data[field.target] = validated_field._field_value
+
+    def _perform_all_field_validation_checks(
+            self,
+            *,
+            num_errors_before: int,
+            prefetched_lookups: Optional[PrefetchedLookups] = None,
+        ) -> None:
+        """
+        Performs validation checks for all the fields, and registers errors (if any) and validated-data.
+        Stops as soon as the error budget is exhausted.
+        """
+        error_budget = self._error_budget
+        compiled_field_validator = self._schema_plan.compiled_field_validator
+        if compiled_field_validator is None:
+            fields = self._schema_plan.fields
+            for idx, field in enumerate(fields):
+                self._perform_field_validation_checks(field=field, prefetched_lookups=prefetched_lookups)
+                if self._errors and error_budget.update(self._errors, num_errors_before=num_errors_before):
+                    if idx < len(fields) - 1:
+                        error_budget.mark_as_truncated()
+                    return
+            return
+        validated_data, errors = compiled_field_validator(self._data, error_budget, prefetched_lookups)
+        self._errors.extend(errors)
+        self._validated_data.update(validated_data)
+        if errors:
+            error_budget.update(self._errors, num_errors_before=num_errors_before)
 
     def _perform_model_validation_checks(self) -> None:
         """Performs model validation checks, and registers errors (if any)"""
         errors: List[Error] = []
         model_validator_classes_to_consider = self.model_validators_to_consider()
-        assert utils.is_list_of_subclasses_of_type(
-            model_validator_classes_to_consider,
-            type_=Validator,
-            allow_empty=True,
-        ), (
-            "The output of the `model_validators_to_consider()` method must be a list of types, each"
-            " being a sub-class of `valcheck.validators.Validator`."
-            " Must be an empty list if there are no parent classes to consider."
-        )
+        if settings.CHECK_INTERNAL_INVARIANTS:
+            assert utils.is_list_of_subclasses_of_type(
+                model_validator_classes_to_consider,
+                type_=Validator,
+                allow_empty=True,
+            ), (
+                "The output of the `model_validators_to_consider()` method must be a list of types, each"
+                " being a sub-class of `valcheck.validators.Validator`."
+                " Must be an empty list if there are no parent classes to consider."
+            )
         if self.__class__ not in model_validator_classes_to_consider:
             model_validator_classes_to_consider += [self.__class__]
         for class_ in self.__class__.__mro__:
@@ -284,10 +601,11 @@ class Validator:
                 and "model_validator" in class_.__dict__  # the `model_validator()` method must be implemented in said class
             ):
                 errors += class_.model_validator(self)
-        assert utils.is_list_of_instances_of_type(errors, type_=Error, allow_empty=True), (
-            "The output of the `model_validator()` method must be a list of errors (each of type `valcheck.models.Error`)."
-            " Must be an empty list if there are no errors."
-        )
+        if settings.CHECK_INTERNAL_INVARIANTS:
+            assert utils.is_list_of_instances_of_type(errors, type_=Error, allow_empty=True), (
+                "The output of the `model_validator()` method must be a list of errors (each of type `valcheck.models.Error`)."
+                " Must be an empty list if there are no errors."
+            )
         INVALID_MODEL_ERROR_MESSAGE = "Invalid model - Validation failed"
         for error in errors:
             error.validator_message = INVALID_MODEL_ERROR_MESSAGE
@@ -309,22 +627,49 @@ class Validator:
         """
         return []
 
-    def run_validations(self, *, raise_exception: Optional[bool] = False, **kwargs: Any) -> None:
+    def run_validations(
+            self,
+            *,
+            raise_exception: Optional[bool] = False,
+            fail_fast: Optional[bool] = False,
+            max_errors: Optional[int] = None,
+            **kwargs: Any,
+        ) -> None:
         """
         Runs validations and registers errors/validated-data.
         If `raise_exception=True` and validations fail, raises `valcheck.exceptions.ValidationException`.
+        If `max_errors` is passed, stops once the count of errors reaches `max_errors` (also applies to nested validators, i.e;
+        the ones used by `ModelDictionaryField` and `ModelListField`). Use the `errors_truncated` and `skipped_row_count`
+        properties to know whether some of the validations were skipped.
+        If `fail_fast=True`, stops at the first error (same as `max_errors=1`). Useful if you only need to know whether the data is valid.
+
+        Accepted kwargs:
+            - error_budget (ErrorBudget): The error budget shared with a parent validator (used by the nested validators).
+            - prefetched_lookups (PrefetchedLookups): The lookups prefetched for the batch of records being validated (used by
+            `validate_many()` and the nested validators, refer to `valcheck.lookups.PrefetchedLookups`).
         """
+        assert isinstance(fail_fast, bool), "Param `fail_fast` must be of type 'bool'"
+        assert not (fail_fast and max_errors is not None), "Params `fail_fast` and `max_errors` cannot be used together"
+        error_budget: Optional[ErrorBudget] = kwargs.get("error_budget", None)
+        if error_budget is None:
+            error_budget = ErrorBudget(max_errors=1 if fail_fast else max_errors)
         assert not self._is_run_validations_called, (
             f"The `run_validations()` method can be called only once per instance of the '{self.__class__.__name__}' class"
         )
         self._is_run_validations_called = True
         self._clear_errors()
         self._clear_validated_data()
-        for _, field in self._field_info.items():
-            self._perform_field_validation_checks(field=field)
+        self._error_budget = error_budget
+        num_errors_before = error_budget.num_errors
+        self._perform_all_field_validation_checks(
+            num_errors_before=num_errors_before,
+            prefetched_lookups=kwargs.get("prefetched_lookups", None),
+        )
         # Perform model validation checks only if there are no errors in field validation checks
         if not self.errors:
             self._perform_model_validation_checks()
+            if self.errors:
+                error_budget.update(self.errors, num_errors_before=num_errors_before)
         if self.errors:
             self._clear_validated_data()
         if raise_exception and self.errors: